@@ -1,15 +1,154 @@
 ### 초기설정
 
 import asyncio
+import time
 import MarketDataFetcher
 import numpy as np
 import DataStoreage
 import utils
 from pprint import pprint
-from typing import Dict, List, Final, Optional
+from typing import Any, Callable, Dict, List, Final, Optional, Tuple
 from copy import copy
 
 
+class IndicatorCache:
+    """
+    지표 연산 결과 중 마감 캔들 구간(마지막 행 제외)을 저장한다.
+    key는 (symbol, interval, indicator, params, 마지막 마감 캔들 open_timestamp)이며,
+    동일 key 재호출시 저장된 결과에 마지막 행(진행중 캔들)만 재계산하여 연결한다.
+    """
+
+    def __init__(self):
+        self.cache: Dict[Tuple, Tuple[int, Any]] = {}
+        # (symbol, interval, indicator, params)별 최신 key (이전 key는 삭제한다.)
+        self.latest_keys: Dict[Tuple, Tuple] = {}
+
+    def get_closed(
+        self,
+        symbol: str,
+        interval: str,
+        indicator: str,
+        params: Tuple,
+        data: np.ndarray,
+        func: Callable[[np.ndarray], Any],
+    ) -> Any:
+        """
+        1. 기능 : 마감 캔들 구간 연산 결과를 반환한다. 미저장시 func(data[:-1])로 계산 후 저장한다.
+        2. 매개변수
+            1) symbol : symbol 값
+            2) interval : interval 값
+            3) indicator : 지표명
+            4) params : 지표 설정값
+            5) data : kline data (마지막 행은 진행중 캔들)
+            6) func : 마감 캔들 구간 연산 함수
+        3. 추가설명
+            - 시작 open_timestamp가 달라지면(조회 구간 변경) 재계산한다.
+        """
+        base_key = (symbol, interval, indicator, params)
+        key = base_key + (int(data[-2, 0]),)
+        first_open_timestamp = int(data[0, 0])
+        entry = self.cache.get(key)
+        if entry is None or entry[0] != first_open_timestamp:
+            entry = (first_open_timestamp, func(data[:-1]))
+            latest_key = self.latest_keys.get(base_key)
+            if latest_key is not None and latest_key != key:
+                self.cache.pop(latest_key, None)
+            self.cache[key] = entry
+            self.latest_keys[base_key] = key
+        return entry[1]
+
+    def clear(self):
+        self.cache.clear()
+        self.latest_keys.clear()
+
+
+class ScenarioCondition:
+    """
+    시나리오 조건 1건의 실행 통계(호출 횟수, 통과 횟수, 누적 소요시간)를 기록한다.
+    """
+
+    __slots__ = ("name", "func", "calls", "passes", "elapsed")
+
+    def __init__(self, name: str, func: Callable[[Dict], bool]):
+        self.name = name
+        self.func = func
+        self.calls: int = 0
+        self.passes: int = 0
+        self.elapsed: float = 0.0
+
+    # 조건 실행 순서 기준값 (평균 소요시간 / 실패율, 낮을수록 먼저 실행)
+    def rank(self) -> float:
+        if self.calls == 0:
+            return 0.0
+        fail_rate = 1 - self.passes / self.calls
+        return (self.elapsed / self.calls) / max(fail_rate, 1e-6)
+
+
+class ScenarioRegistry:
+    """
+    시나리오(전략)별 조건을 등록하고 실행한다.
+    조건은 모두 통과해야 성공(AND)이므로 실패 즉시 나머지 조건은 생략하며,
+    조건별 소요시간과 통과율을 측정하여 저비용, 고탈락 조건부터 실행하도록 순서를 주기적으로 재정렬한다.
+    조건 함수는 context(dict)만 변경하고 다른 부수효과가 없어야 하며, 실행 순서와 무관하게 결과는 동일하다.
+    """
+
+    def __init__(self, reorder_interval: int = 100):
+        self.reorder_interval = reorder_interval
+        self.scenarios: Dict[str, List[ScenarioCondition]] = {}
+        self.evaluate_count: Dict[str, int] = {}
+
+    def register(self, scenario_name: str, condition_name: str, func: Callable[[Dict], bool]):
+        """
+        1. 기능 : 시나리오 조건을 등록한다.
+        2. 매개변수
+            1) scenario_name : 시나리오명
+            2) condition_name : 조건명
+            3) func : context(dict)를 입력받아 통과 여부를 반환하는 함수
+        3. 추가설명
+            - 측정 전에는 등록 순서대로 실행한다.
+        """
+        self.scenarios.setdefault(scenario_name, []).append(ScenarioCondition(condition_name, func))
+        self.evaluate_count.setdefault(scenario_name, 0)
+
+    def evaluate(self, scenario_name: str, context: Dict) -> bool:
+        """
+        1. 기능 : 시나리오 조건을 순서대로 실행하고 전체 통과 여부를 반환한다.
+        2. 매개변수
+            1) scenario_name : 시나리오명
+            2) context : 조건간 공유 데이터 (symbol 및 조건 실행중 생성된 값)
+        """
+        conditions = self.scenarios[scenario_name]
+        self.evaluate_count[scenario_name] += 1
+        if self.evaluate_count[scenario_name] % self.reorder_interval == 0:
+            conditions.sort(key=ScenarioCondition.rank)
+
+        for condition in conditions:
+            start = time.perf_counter()
+            is_passed = bool(condition.func(context))
+            condition.elapsed += time.perf_counter() - start
+            condition.calls += 1
+            if not is_passed:
+                return False
+            condition.passes += 1
+        return True
+
+    def get_stats(self, scenario_name: str) -> List[Dict]:
+        """
+        1. 기능 : 시나리오 조건별 실행 통계를 현재 실행 순서대로 반환한다.
+        2. 매개변수
+            1) scenario_name : 시나리오명
+        """
+        return [
+            {
+                "condition": condition.name,
+                "calls": condition.calls,
+                "pass_rate": condition.passes / condition.calls if condition.calls else None,
+                "mean_elapsed": condition.elapsed / condition.calls if condition.calls else None,
+            }
+            for condition in self.scenarios[scenario_name]
+        ]
+
+
 class IndicatorMA:
     """
     이동평균값을 계산한다.
@@ -21,12 +160,14 @@ class IndicatorMA:
         data_type: str = "sma",
         interval: str = "3m",
         periods: List = [7, 25, 99],
+        cache: Optional[IndicatorCache] = None,
     ):
         self.kline_datasets = kline_datasets
         self.periods: List[int] = periods
         self.interval: str = interval
         self.type_str: str = data_type
         self.ma_types: Final[List[str]] = ["sma", "ema", "wma"]
+        self.cache = cache
 
     def cals_sma(self, data: np.ndarray, period: int) -> np.ndarray:
         """
@@ -74,9 +215,33 @@ class IndicatorMA:
             base_data = data.get_data(interval=self.interval)
             array_data = np.array(base_data, float)
             for preiod in self.periods:
-                result = ma_func[self.type_str](data=array_data, period=preiod)
+                # 마감 캔들 구간이 기간보다 짧으면 cache 없이 계산한다.
+                if self.cache is None or len(array_data) <= preiod:
+                    result = ma_func[self.type_str](data=array_data, period=preiod)
+                else:
+                    result = self.__run_cached(symbol, array_data, preiod, ma_func)
                 setattr(self, f"{symbol}_{self.type_str}_{preiod}", result)
 
+    # 마감 캔들 구간은 cache를 사용하고, 마지막 행만 계산하여 연결한다.
+    def __run_cached(self, symbol: str, array_data: np.ndarray, period: int, ma_func: Dict) -> np.ndarray:
+        type_str = self.type_str
+        closed = self.cache.get_closed(
+            symbol=symbol,
+            interval=self.interval,
+            indicator=type_str,
+            params=(period,),
+            data=array_data,
+            func=lambda closed_data: ma_func[type_str](data=closed_data, period=period),
+        )
+        prices = array_data[:, 4]
+        if type_str == "ema":
+            multiplier = 2 / (period + 1)
+            last = (prices[-1] - closed[-1]) * multiplier + closed[-1]
+        else:
+            # 가장 최근 기간 구간만 계산한다. (sma / wma)
+            last = ma_func[type_str](data=array_data[-period:], period=period)[-1]
+        return np.append(closed, last)
+
 
 class IndicatorMACD:
     def __init__(
@@ -88,6 +253,7 @@ class IndicatorMACD:
         short_window: int = 12,
         long_window: int = 26,
         signal_window: int = 9,
+        cache: Optional[IndicatorCache] = None,
     ):
         self.kline_datasets = kline_datasets
         self.interval = interval
@@ -96,6 +262,7 @@ class IndicatorMACD:
         self.short_window = short_window
         self.long_window = long_window
         self.signal_window = signal_window
+        self.cache = cache
 
     def __ema(self, data: np.ndarray, window: int) -> np.ndarray:
         """EMA 계산 (데이터 길이 유지)"""
@@ -122,18 +289,49 @@ class IndicatorMACD:
         histogram = macd_line - signal_line
         return macd_line, signal_line, histogram
 
+    # 마감 캔들 구간 EMA는 cache를 사용하고, 마지막 행만 EMA를 1회 갱신한다.
+    def __macd_cached(self, symbol: str, data: np.ndarray):
+        windows = (self.short_window, self.long_window, self.signal_window)
+
+        def closed_ema(closed_data: np.ndarray):
+            value = closed_data[:, self.col_index]
+            short_ema = self.__ema(value, self.short_window)
+            long_ema = self.__ema(value, self.long_window)
+            return short_ema, long_ema, self.__ema(short_ema - long_ema, self.signal_window)
+
+        short_ema, long_ema, signal_ema = self.cache.get_closed(
+            symbol=symbol,
+            interval=self.interval,
+            indicator=self.type_str,
+            params=(self.col_index,) + windows,
+            data=data,
+            func=closed_ema,
+        )
+        value = data[-1, self.col_index]
+        alphas = [2 / (window + 1) for window in windows]
+        short_last = alphas[0] * value + (1 - alphas[0]) * short_ema[-1]
+        long_last = alphas[1] * value + (1 - alphas[1]) * long_ema[-1]
+        macd_line = np.append(short_ema - long_ema, short_last - long_last)
+        signal_line = np.append(
+            signal_ema, alphas[2] * macd_line[-1] + (1 - alphas[2]) * signal_ema[-1]
+        )
+        return macd_line, signal_line, macd_line - signal_line
+
     def run(self):
         for symbol, data in self.kline_datasets.items():
             base_data = data.get_data(interval=self.interval)
             array_data = np.array(base_data, float)
 
-            result = self.macd(
-                data=array_data,
-                col_index=self.col_index,
-                short_window=self.short_window,
-                long_window=self.long_window,
-                signal_window=self.signal_window,
-            )
+            if self.cache is not None and len(array_data) > 1:
+                result = self.__macd_cached(symbol=symbol, data=array_data)
+            else:
+                result = self.macd(
+                    data=array_data,
+                    col_index=self.col_index,
+                    short_window=self.short_window,
+                    long_window=self.long_window,
+                    signal_window=self.signal_window,
+                )
             setattr(
                 self,
                 f"{symbol}_{self.type_str}_{self.short_window}_{self.long_window}_{self.signal_window}",
@@ -152,7 +350,12 @@ class SellStrategy1:
     Short 포지션 관련 분석
     """
 
-    def __init__(self, ma_data: IndicatorMA, macd_data: IndicatorMACD):
+    def __init__(
+        self,
+        ma_data: IndicatorMA,
+        macd_data: IndicatorMACD,
+        registry: Optional[ScenarioRegistry] = None,
+    ):
         self.ins_ma = ma_data
         self.ins_macd = macd_data
 
@@ -168,96 +371,106 @@ class SellStrategy1:
         self.fail_message: List = [0, 2, 1, 0]
         self.success_message: List = [1, 2, 1]
 
+        # 조건 등록 (등록 순서는 측정 전 초기 실행 순서)
+        self.scenario_name = self.__class__.__name__
+        self.registry = registry if registry is not None else ScenarioRegistry()
+        for condition_name, func in (
+            ("candle", self.__check_candle),
+            ("ma_rank", self.__check_ma_rank),
+            ("volume", self.__check_volume),
+            ("macd", self.__check_macd),
+            ("ma_trend", self.__check_ma_trend),
+        ):
+            self.registry.register(self.scenario_name, condition_name, func)
+
     def reset_message(self):
         self.fail_message: List = [0, 2, 1, 0]
         self.success_message: List = [1, 2, 1]
 
-    def run(self):
-        symbols = list(self.kline_datasets.keys())
-        result = {}
-        for symbol in symbols:
-            ma_1 = getattr(
-                self.ins_ma, f"{symbol}_{self.type_str}_{self.periods[0]}"
-            )  # 7
-            ma_2 = getattr(
-                self.ins_ma, f"{symbol}_{self.type_str}_{self.periods[1]}"
-            )  # 25
-            ma_3 = getattr(
-                self.ins_ma, f"{symbol}_{self.type_str}_{self.periods[2]}"
-            )  # 99
-
-            macd = getattr(
-                self.ins_macd,
-                f"{symbol}_{self.ins_macd.type_str}_{self.ins_macd.short_window}_{self.ins_macd.long_window}_{self.ins_macd.signal_window}",
-            )
-            macd_line = macd[0]
-            signal_line = macd[1]
-            histogram = macd[2]
-
+    # 최근 3개 kline data (조건 1~3 공용)
+    def __get_recent_data(self, context: Dict) -> np.ndarray:
+        if "recent_data" not in context:
             base_data = getattr(
-                self.kline_datasets[symbol], f"interval_{self.interval}"
+                self.kline_datasets[context["symbol"]], f"interval_{self.interval}"
             )
-            convert_to_array = np.array(base_data, float)
-            current_price = float(convert_to_array[-1][4])
-            open_price = float(convert_to_array[-1][1])
-
-            # 조건 1 : 캔들 하락
-            if not open_price > current_price:
-                result[symbol] = self.fail_message
-                continue
-
-            # 조건 2 : MA간 순위 비교
-            is_price_trend = current_price < ma_3[-1] < open_price < ma_1[-1] < ma_2[-1]
-            if not is_price_trend:
-                result[symbol] = self.fail_message
-                continue
-
-            # 조건 3 : 볼륨 강도
-            volume_ratio = np.mean(convert_to_array[-3:, 10] / convert_to_array[-3:, 7])
-            volume_target_ratio = 0.45
-            if not volume_ratio <= volume_target_ratio:
-                result[symbol] = self.fail_message
+            context["recent_data"] = np.array(base_data[-3:], float)
+        return context["recent_data"]
+
+    def __get_ma(self, context: Dict, period: int) -> np.ndarray:
+        return getattr(self.ins_ma, f"{context['symbol']}_{self.type_str}_{period}")
+
+    # 조건 1 : 캔들 하락
+    def __check_candle(self, context: Dict) -> bool:
+        recent_data = self.__get_recent_data(context)
+        current_price = float(recent_data[-1][4])
+        open_price = float(recent_data[-1][1])
+        return open_price > current_price
+
+    # 조건 2 : MA간 순위 비교
+    def __check_ma_rank(self, context: Dict) -> bool:
+        recent_data = self.__get_recent_data(context)
+        current_price = float(recent_data[-1][4])
+        open_price = float(recent_data[-1][1])
+        ma_1 = self.__get_ma(context, self.periods[0])  # 7
+        ma_2 = self.__get_ma(context, self.periods[1])  # 25
+        ma_3 = self.__get_ma(context, self.periods[2])  # 99
+        return current_price < ma_3[-1] < open_price < ma_1[-1] < ma_2[-1]
+
+    # 조건 3 : 볼륨 강도
+    def __check_volume(self, context: Dict) -> bool:
+        recent_data = self.__get_recent_data(context)
+        volume_ratio = np.mean(recent_data[-3:, 10] / recent_data[-3:, 7])
+        volume_target_ratio = 0.45
+        return volume_ratio <= volume_target_ratio
+
+    ### DEBUG CODE
+    def __check_macd(self, context: Dict) -> bool:
+        macd = getattr(
+            self.ins_macd,
+            f"{context['symbol']}_{self.ins_macd.type_str}_{self.ins_macd.short_window}_{self.ins_macd.long_window}_{self.ins_macd.signal_window}",
+        )
+        macd_line = macd[0]
+        signal_line = macd[1]
+        return macd_line[-1] > signal_line[-1]
+
+    # 조건 4 : 장기 MA 하락
+    def __check_ma_trend(self, context: Dict) -> bool:
+        target_hr = 6
+        hour_minute = 60
+        interval_min = 3
+        data_lengh = int((target_hr * hour_minute) / interval_min)
+        select_data_ma_3 = self.__get_ma(context, self.periods[2])[-1 * data_lengh :]
+        # 데이터 부족시 실패 처리 (조건 실행 순서와 무관하게 동일한 결과 유지)
+        if len(select_data_ma_3) < data_lengh:
+            return False
+
+        group_count = 5
+        if data_lengh % group_count != 0:
+            raise ValueError(f"시간 또는 그룹값 수정 필요함.")
+
+        data_step = int(data_lengh / group_count)
+        down_count = 0
+        target_ratio = 1
+        for count in reversed(range(group_count)):
+            start = count * data_step
+            diff_ma = np.diff(select_data_ma_3[start : start + data_step])
+            positive_ratio = np.sum(diff_ma < 0) / (data_step - 1)
+            if not target_ratio <= positive_ratio:
                 continue
+            down_count += 1
 
-            ### DEBUG CODE
-            if not macd_line[-1] > signal_line[-1]:
-                result[symbol] = self.fail_message
-                continue
+        context["down_count"] = down_count
+        return down_count >= 2
 
-            # 조건 4 : 장기 MA 하락
-            target_hr = 6
-            hour_minute = 60
-            interval_min = 3
-            data_lengh = int((target_hr * hour_minute) / interval_min)
-            # print(f' data_lengh = {data_lengh}')
-            select_data_ma_3 = ma_3[-1 * data_lengh :]
-            # print(f'ma_lengh = {len(ma_3)}')
-            group_count = 5
-            if data_lengh % group_count != 0:
-                raise ValueError(f"시간 또는 그룹값 수정 필요함.")
-
-            data_step = int(data_lengh / group_count)
-            group_condition = []
-            for count in range(group_count):
-
-                start = count * data_step
-                stop = start + data_step
-                group_condition.append(np.arange(start=start, stop=stop, step=1))
-            down_count = 0
-
-            target_ratio = 1
-
-            for condition in reversed(group_condition):
-                diff_ma = np.diff(select_data_ma_3[condition])
-                positive_ratio = np.sum(diff_ma < 0) / (data_step - 1)
-                if not target_ratio <= positive_ratio:
-                    continue
-                down_count += 1
-
-            if down_count < 2:
+    def run(self):
+        symbols = list(self.kline_datasets.keys())
+        result = {}
+        for symbol in symbols:
+            context = {"symbol": symbol}
+            if not self.registry.evaluate(self.scenario_name, context):
                 result[symbol] = self.fail_message
                 continue
-            self.success_message.append(down_count)
+            self.success_message.append(context["down_count"])
             result[symbol] = self.success_message
             self.reset_message()
         self.result = result
@@ -268,7 +481,12 @@ class BuyStrategy1:
     Short 포지션 관련 분석
     """
 
-    def __init__(self, ma_data: IndicatorMA, macd_data: IndicatorMACD):
+    def __init__(
+        self,
+        ma_data: IndicatorMA,
+        macd_data: IndicatorMACD,
+        registry: Optional[ScenarioRegistry] = None,
+    ):
         self.ins_ma = ma_data
         self.ins_macd = macd_data
 
@@ -284,102 +502,109 @@ class BuyStrategy1:
         self.fail_message: List = [0, 1, 1, 0]
         self.success_message: List = [1, 1, 1]
 
+        # 조건 등록 (등록 순서는 측정 전 초기 실행 순서)
+        self.scenario_name = self.__class__.__name__
+        self.registry = registry if registry is not None else ScenarioRegistry()
+        for condition_name, func in (
+            ("candle", self.__check_candle),
+            ("ma_rank", self.__check_ma_rank),
+            ("volume", self.__check_volume),
+            ("macd", self.__check_macd),
+            ("ma_trend", self.__check_ma_trend),
+        ):
+            self.registry.register(self.scenario_name, condition_name, func)
+
     def reset_message(self):
         self.fail_message: List = [0, 1, 1, 0]
         self.success_message: List = [1, 1, 1]
 
-    def run(self):
-        symbols = list(self.kline_datasets.keys())
-        result = {}
-        for symbol in symbols:
-            ma_1 = getattr(
-                self.ins_ma, f"{symbol}_{self.type_str}_{self.periods[0]}"
-            )  # 7
-            ma_2 = getattr(
-                self.ins_ma, f"{symbol}_{self.type_str}_{self.periods[1]}"
-            )  # 25
-            ma_3 = getattr(
-                self.ins_ma, f"{symbol}_{self.type_str}_{self.periods[2]}"
-            )  # 99
-
-            macd = getattr(
-                self.ins_macd,
-                f"{symbol}_{self.ins_macd.type_str}_{self.ins_macd.short_window}_{self.ins_macd.long_window}_{self.ins_macd.signal_window}",
-            )
-            macd_line = macd[0]
-            # print(f'MACD:{macd_line}')
-            signal_line = macd[1]
-            histogram = macd[2]
-
+    # 최근 3개 kline data (조건 1~3 공용)
+    def __get_recent_data(self, context: Dict) -> np.ndarray:
+        if "recent_data" not in context:
             base_data = getattr(
-                self.kline_datasets[symbol], f"interval_{self.interval}"
+                self.kline_datasets[context["symbol"]], f"interval_{self.interval}"
             )
-            convert_to_array = np.array(base_data, float)
-            current_price = float(convert_to_array[-1][4])
-            open_price = float(convert_to_array[-1][1])
-
-            # 조건 1 : 캔들 상승
-            if not open_price < current_price:
-                result[symbol] = self.fail_message
-                # print(f'fail 1 {symbol} - {result[symbol]}')
-                continue
-
-            # 조건 2 : MA간 순위 비교
-            is_price_trend = current_price > ma_1[-1] > open_price > ma_3[-1] > ma_2[-1]
-
-            if not is_price_trend:
-                result[symbol] = self.fail_message
-                continue
-
-            # 조건 3 : 볼륨 강도
-            volume_ratio = np.mean(convert_to_array[-3:, 10] / convert_to_array[-3:, 7])
-            volume_target_ratio = 0.55
-            if not volume_ratio >= volume_target_ratio:
-                result[symbol] = self.fail_message
+            context["recent_data"] = np.array(base_data[-3:], float)
+        return context["recent_data"]
+
+    def __get_ma(self, context: Dict, period: int) -> np.ndarray:
+        return getattr(self.ins_ma, f"{context['symbol']}_{self.type_str}_{period}")
+
+    # 조건 1 : 캔들 상승
+    def __check_candle(self, context: Dict) -> bool:
+        recent_data = self.__get_recent_data(context)
+        current_price = float(recent_data[-1][4])
+        open_price = float(recent_data[-1][1])
+        return open_price < current_price
+
+    # 조건 2 : MA간 순위 비교
+    def __check_ma_rank(self, context: Dict) -> bool:
+        recent_data = self.__get_recent_data(context)
+        current_price = float(recent_data[-1][4])
+        open_price = float(recent_data[-1][1])
+        ma_1 = self.__get_ma(context, self.periods[0])  # 7
+        ma_2 = self.__get_ma(context, self.periods[1])  # 25
+        ma_3 = self.__get_ma(context, self.periods[2])  # 99
+        return current_price > ma_1[-1] > open_price > ma_3[-1] > ma_2[-1]
+
+    # 조건 3 : 볼륨 강도
+    def __check_volume(self, context: Dict) -> bool:
+        recent_data = self.__get_recent_data(context)
+        volume_ratio = np.mean(recent_data[-3:, 10] / recent_data[-3:, 7])
+        volume_target_ratio = 0.55
+        return volume_ratio >= volume_target_ratio
+
+    ### DEBUG CODE
+    def __check_macd(self, context: Dict) -> bool:
+        macd = getattr(
+            self.ins_macd,
+            f"{context['symbol']}_{self.ins_macd.type_str}_{self.ins_macd.short_window}_{self.ins_macd.long_window}_{self.ins_macd.signal_window}",
+        )
+        macd_line = macd[0]
+        signal_line = macd[1]
+        return macd_line[-1] < signal_line[-1]
+
+    # 조건 4 : 장기 MA 하락
+    def __check_ma_trend(self, context: Dict) -> bool:
+        target_hr = 6
+        hour_minute = 60
+        interval_min = 3
+        data_lengh = int((target_hr * hour_minute) / interval_min)
+        select_data_ma_3 = self.__get_ma(context, self.periods[2])[-1 * data_lengh :]
+        # 데이터 부족시 실패 처리 (조건 실행 순서와 무관하게 동일한 결과 유지)
+        if len(select_data_ma_3) < data_lengh:
+            return False
+
+        group_count = 5
+        if data_lengh % group_count != 0:
+            raise ValueError(f"시간 또는 그룹값 수정 필요함.")
+
+        data_step = int(data_lengh / group_count)
+        down_count = 0
+        target_ratio = 1
+        for count in reversed(range(group_count)):
+            start = count * data_step
+            diff_ma = np.diff(select_data_ma_3[start : start + data_step])
+            positive_ratio = np.sum(diff_ma > 0) / (data_step - 1)
+            if not target_ratio <= positive_ratio:
                 continue
+            down_count += 1
 
-            ### DEBUG CODE
-            if not macd_line[-1] < signal_line[-1]:
-                result[symbol] = self.fail_message
-                continue
+        context["down_count"] = down_count
+        return down_count >= 2
 
-            # 조건 4 : 장기 MA 하락
-            target_hr = 6
-            hour_minute = 60
-            interval_min = 3
-            data_lengh = int((target_hr * hour_minute) / interval_min)
-            select_data_ma_3 = ma_3[-1 * data_lengh :]
-
-            group_count = 5
-            if data_lengh % group_count != 0:
-                raise ValueError(f"시간 또는 그룹값 수정 필요함.")
-
-            data_step = int(data_lengh / group_count)
-            group_condition = []
-            for count in range(group_count):
-
-                start = count * data_step
-                stop = start + data_step
-                group_condition.append(np.arange(start=start, stop=stop, step=1))
-            down_count = 0
-
-            target_ratio = 1
-            for condition in reversed(group_condition):
-                diff_ma = np.diff(select_data_ma_3[condition])
-                positive_ratio = np.sum(diff_ma > 0) / (data_step - 1)
-                if not target_ratio <= positive_ratio:
-                    continue
-                # print(positive_ratio)
-                down_count += 1
-            if down_count < 2:
+    def run(self):
+        symbols = list(self.kline_datasets.keys())
+        result = {}
+        for symbol in symbols:
+            context = {"symbol": symbol}
+            if not self.registry.evaluate(self.scenario_name, context):
                 result[symbol] = self.fail_message
                 continue
-
-            self.success_message.append(down_count)
+            self.success_message.append(context["down_count"])
             result[symbol] = self.success_message
             self.reset_message()
         self.result = result
-        # print(self.result)
 
 
 class Intervals:
@@ -400,11 +625,14 @@ class AnalysisManager:
         self.data_type_wma: str = "wma"
         self.data_type_macd: str = "macd"
         self.periods: List[int] = [7, 25, 99]
+        # 마감 캔들 구간 지표 연산 결과 저장 (진행중 캔들만 재계산)
+        self.indicator_cache = IndicatorCache()
         self.ins_ma_sma_3m = IndicatorMA(
             kline_datasets=self.data_sets,
             data_type=self.data_type_sma,
             interval=self.interval_3m,
             periods=self.periods,
+            cache=self.indicator_cache,
         )
 
         ### MACD 분석
@@ -419,14 +647,19 @@ class AnalysisManager:
             short_window=self.short_window,
             long_window=self.long_window,
             signal_window=self.signal_window,
+            cache=self.indicator_cache,
         )
 
-        self.ins_sell_strategy_1: BuyStrategy1 = SellStrategy1(
-            self.ins_ma_sma_3m, self.ins_macd_12_26_9
+        ### 전략 (조건별 소요시간 / 통과율 기준으로 실행 순서 조정)
+        self.scenario_registry = ScenarioRegistry()
+        self.ins_sell_strategy_1: SellStrategy1 = SellStrategy1(
+            self.ins_ma_sma_3m, self.ins_macd_12_26_9, self.scenario_registry
         )
         self.ins_buy_strategy_1: BuyStrategy1 = BuyStrategy1(
-            self.ins_ma_sma_3m, self.ins_macd_12_26_9
+            self.ins_ma_sma_3m, self.ins_macd_12_26_9, self.scenario_registry
         )
+        # 결과 수집 대상 전략 (등록 순서대로 수집)
+        self.strategies: List[Any] = [self.ins_sell_strategy_1, self.ins_buy_strategy_1]
 
         self.success_signals: List[Any] = []
 
@@ -441,18 +674,216 @@ class AnalysisManager:
 
     def get_success_signal(self):
         # self.__run_func()
-        for attr_name in vars(self).keys():
-            base_name = "strategy"
-            if base_name in attr_name:
-                # getattr을 올바르게 사용
-                strategy_instance = getattr(self, attr_name, None)
-                for symbol, signal in strategy_instance.result.items():
-                    if signal[0]:
-                        signal.insert(0, symbol)
-                        self.success_signals.append(signal)                
+        for strategy_instance in self.strategies:
+            for symbol, signal in strategy_instance.result.items():
+                if signal[0]:
+                    signal.insert(0, symbol)
+                    self.success_signals.append(signal)
         return self.success_signals
         
     def run(self):
         self.__run_func()
         return self.get_success_signal()
         # self.reset_signal()
+
+
+class BatchSignalAnalyzer:
+    """
+    백테스트용 일괄 분석. SellStrategy1 / BuyStrategy1 조건을 closing_sync_data 전체 구간에 대하여 1회 연산하고,
+    1분봉 index와 정렬된 신호 배열을 반환한다. (step loop에서는 index로 조회만 한다.)
+
+    1. index i 시점의 interval 데이터는 LookbackIndices와 동일하게 step 배수 index(마감 캔들) + 현재 index(i)로 구성된다.
+    2. 마감 캔들 기준 지표는 누적합/run-length로 1회 계산하고, 현재 index(진행중 캔들)는 마지막 값만 보정한다.
+    3. MACD의 EMA는 전체 구간의 첫 마감 캔들을 초기값으로 사용한다.
+        (loop 방식은 lookback window 첫 값을 초기값으로 사용하며, window 길이 960 이상에서 차이는 무시 가능한 수준이다.)
+    """
+
+    def __init__(
+        self,
+        interval: str = "3m",
+        periods: List[int] = [7, 25, 99],
+        col_index: int = 10,
+        short_window: int = 12,
+        long_window: int = 26,
+        signal_window: int = 9,
+    ):
+        self.interval = interval
+        self.step = utils._get_interval_minutes(interval)
+        self.periods = periods
+        self.col_index = col_index
+        self.short_window = short_window
+        self.long_window = long_window
+        self.signal_window = signal_window
+
+        # 조건 4 : 장기 MA 추세 (SellStrategy1 / BuyStrategy1 동일 설정)
+        target_hr = 6
+        hour_minute = 60
+        self.data_lengh = int((target_hr * hour_minute) / self.step)
+        self.group_count = 5
+        if self.data_lengh % self.group_count != 0:
+            raise ValueError(f"시간 또는 그룹값 수정 필요함.")
+        self.data_step = int(self.data_lengh / self.group_count)
+        self.min_group_count = 2
+
+        # 조건 3 : 볼륨 강도
+        self.volume_length = 3
+        self.sell_volume_ratio = 0.45
+        self.buy_volume_ratio = 0.55
+
+        # 신호 발생시 시나리오 번호 (SellStrategy1 / BuyStrategy1 success_message의 class number)
+        self.sell_scenario_type = 1
+        self.buy_scenario_type = 1
+
+    @staticmethod
+    def _ema(data: np.ndarray, window: int) -> np.ndarray:
+        """
+        1. 기능 : IndicatorMACD와 동일한 EMA(첫 값 초기화)를 계산한다.
+        2. 매개변수
+            1) data : 대상 데이터
+            2) window : EMA 기간
+        """
+        alpha = 2 / (window + 1)
+        ema_values = np.empty_like(data, dtype=np.float64)
+        if len(data) == 0:
+            return ema_values
+        ema_values[0] = data[0]
+        for i in range(1, len(data)):
+            ema_values[i] = alpha * data[i] + (1 - alpha) * ema_values[i - 1]
+        return ema_values
+
+    @staticmethod
+    def _pad(values: np.ndarray) -> np.ndarray:
+        return np.concatenate(([np.nan], values))
+
+    @staticmethod
+    def _run_length(is_valid: np.ndarray) -> np.ndarray:
+        """
+        1. 기능 : index별로 해당 index에서 끝나는 연속 True 개수를 계산한다.
+        2. 매개변수
+            1) is_valid : bool 배열
+        """
+        idx = np.arange(len(is_valid))
+        last_false = np.maximum.accumulate(np.where(is_valid, -1, idx))
+        return np.where(is_valid, idx - last_false, 0)
+
+    # 지표 및 조건을 전체 구간에 대하여 일괄 계산한다.
+    def compute(self, data: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        1. 기능 : closing_sync_data(interval) 전체 구간의 매수/매도 신호를 계산한다.
+        2. 매개변수
+            1) data : closing_sync_data[symbol][interval] (1분봉 길이)
+        3. 반환값
+            - buy / sell : index별 신호 (bool)
+            - buy_scenario / sell_scenario : index별 시나리오 번호 (신호 미발생시 0)
+            - buy_count / sell_count : 조건 4 충족 그룹 수 (신호 발생 index만 유효)
+        """
+        data = np.asarray(data, dtype=np.float64)
+        data_length = len(data)
+        step = self.step
+
+        # 마감 캔들(step 배수 index, 0번 dummy 제외) 및 index별 직전 마감 캔들 위치
+        closed = data[step::step]
+        num_closed = len(closed)
+        idx = np.arange(data_length)
+        # 마감 캔들 배열은 0번에 nan을 추가하여 직전 마감 캔들이 없는 index(prev_pos == 0)는 nan을 조회한다.
+        prev_pos = np.maximum((idx - 1) // step, 0)
+
+        close_price = data[:, 4]
+        open_price = data[:, 1]
+
+        # SMA : 직전 (period-1)개 마감 캔들 + 현재 index
+        cumsum = np.concatenate(([0.0], np.cumsum(closed[:, 4])))
+        sma_current = {}
+        sma_closed = {}
+        for period in self.periods:
+            start_pos = prev_pos - (period - 1)
+            valid = start_pos >= 0
+            total = cumsum[prev_pos] - cumsum[np.clip(start_pos, 0, None)]
+            sma_current[period] = np.where(valid, (total + close_price) / period, np.nan)
+
+            closed_sma = np.full(num_closed, np.nan)
+            if num_closed >= period:
+                closed_sma[period - 1 :] = (cumsum[period:] - cumsum[:-period]) / period
+            sma_closed[period] = self._pad(closed_sma)
+
+        # 조건 1, 2 : 캔들 방향 및 MA간 순위
+        ma_1, ma_2, ma_3 = (sma_current[period] for period in self.periods)
+        is_sell = (open_price > close_price) & (
+            (close_price < ma_3) & (ma_3 < open_price) & (open_price < ma_1) & (ma_1 < ma_2)
+        )
+        is_buy = (open_price < close_price) & (
+            (close_price > ma_1) & (ma_1 > open_price) & (open_price > ma_3) & (ma_3 > ma_2)
+        )
+
+        # 조건 3 : 볼륨 강도 (직전 마감 캔들 + 현재 index 평균)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio_closed = self._pad(closed[:, 10] / closed[:, 7])
+            volume_ratio = data[:, 10] / data[:, 7]
+        for offset in range(1, self.volume_length):
+            pos = prev_pos - (offset - 1)
+            volume_ratio = volume_ratio + np.where(pos >= 1, ratio_closed[np.clip(pos, 0, None)], np.nan)
+        volume_ratio /= self.volume_length
+        is_sell &= volume_ratio <= self.sell_volume_ratio
+        is_buy &= volume_ratio >= self.buy_volume_ratio
+
+        # MACD : 마감 캔들 EMA에 현재 index 값을 1회 반영한다.
+        value_closed = closed[:, self.col_index]
+        value = data[:, self.col_index]
+        ema_closed = {}
+        ema_current = {}
+        for window in (self.short_window, self.long_window):
+            alpha = 2 / (window + 1)
+            ema_closed[window] = self._ema(value_closed, window)
+            ema_current[window] = alpha * value + (1 - alpha) * self._pad(ema_closed[window])[prev_pos]
+        macd_closed = ema_closed[self.short_window] - ema_closed[self.long_window]
+        macd_line = ema_current[self.short_window] - ema_current[self.long_window]
+        alpha = 2 / (self.signal_window + 1)
+        signal_closed = self._pad(self._ema(macd_closed, self.signal_window))
+        signal_line = alpha * macd_line + (1 - alpha) * signal_closed[prev_pos]
+        is_sell &= macd_line > signal_line
+        is_buy &= macd_line < signal_line
+
+        # 조건 4 : 장기 MA 추세. 최근 data_lengh개 MA(마지막은 현재 index)를 group_count개 그룹으로 나눈다.
+        ma_closed = sma_closed[self.periods[2]]
+        diff_closed = np.diff(ma_closed, prepend=np.nan)
+        base_pos = prev_pos - (self.data_lengh - 2)
+        sell_count = np.zeros(data_length, dtype=np.int64)
+        buy_count = np.zeros(data_length, dtype=np.int64)
+        for is_down, count in ((True, sell_count), (False, buy_count)):
+            is_trend = diff_closed < 0 if is_down else diff_closed > 0
+            run_length = self._run_length(is_trend)
+            for group in range(self.group_count - 1):
+                end_pos = base_pos + (group + 1) * self.data_step - 1
+                is_group = (base_pos >= 1) & (
+                    run_length[np.clip(end_pos, 0, None)] >= self.data_step - 1
+                )
+                count += is_group
+            # 마지막 그룹 : 마감 캔들 (data_step - 1)개 + 현재 index
+            ma_prev = ma_closed[prev_pos]
+            is_last = ma_3 < ma_prev if is_down else ma_3 > ma_prev
+            is_last &= (base_pos >= 1) & (run_length[prev_pos] >= self.data_step - 2)
+            count += is_last
+        is_sell &= sell_count >= self.min_group_count
+        is_buy &= buy_count >= self.min_group_count
+
+        return {
+            "sell": is_sell,
+            "buy": is_buy,
+            "sell_scenario": np.where(is_sell, self.sell_scenario_type, 0),
+            "buy_scenario": np.where(is_buy, self.buy_scenario_type, 0),
+            "sell_count": sell_count,
+            "buy_count": buy_count,
+        }
+
+    def run(
+        self, closing_sync_data: Dict[str, Dict[str, np.ndarray]]
+    ) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        1. 기능 : symbol별 신호 배열을 생성한다.
+        2. 매개변수
+            1) closing_sync_data : {symbol: {interval: data}}
+        """
+        return {
+            symbol: self.compute(symbol_data[self.interval])
+            for symbol, symbol_data in closing_sync_data.items()
+        }
@@ -1,8 +1,8 @@
 import os
 import utils
 import asyncio
+import time
 import numpy as np
-import pickle
 from typing import Union, List, Dict, Any
 import ConfigSetting
 import Analysis_new
@@ -112,42 +112,72 @@ class FactoryManager:
         if ins_market is None:
             raise ValueError(f'instance 로딩 오류')
 
-        # 기본값 설정
-        # API 호출 제한 설정
-        MAX_API_CALLS_PER_MINUTE = 1150
-        API_LIMIT_RESET_TIME = 60  # 초 단위
-
-        api_call_count = 0
-        # start_time = datetime.datetime.now()
+        # 분당 request weight 사용 상한 (futures 한도 2,400의 80%)
+        MAX_WEIGHT_PER_MINUTE = 1_920
         aggregated_results: Dict[str, Dict[str, List[Any]]] = {}
 
+        # 수신 이력 관리용 로컬 catalog
+        ins_catalog = DataStoreage.KlineCatalog(
+            path=ConfigSetting.SystemConfig.path_kline_catalog.value
+        )
+        market = ConfigSetting.SymbolConfig.market_type.value
+        start_timestamp = utils._convert_to_timestamp_ms(date=start_date)
+        end_timestamp = utils._convert_to_timestamp_ms(date=end_date)
+
         for symbol in self.symbols:
             aggregated_results[symbol] = {}
 
             for interval in self.intervals:
                 aggregated_results[symbol][interval] = []
-                timestamp_ranges = self.__generate_timestamp_ranges(
-                    interval=interval, start_date=start_date, end_date=end_date
+                # 로컬 catalog에 보유하지 않은 구간만 수신한다.
+                missing_ranges = ins_catalog.missing_ranges(
+                    market=market,
+                    symbol=symbol,
+                    interval=interval,
+                    start_ts=start_timestamp,
+                    end_ts=end_timestamp,
                 )
 
-                collected_data:List[Any] = []
-                for timestamps in timestamp_ranges:
-                    # 타임스탬프를 문자열로 변환
-                    start_timestamp_str = utils._convert_to_datetime(timestamps[0])
-                    end_timestamp_str = utils._convert_to_datetime(timestamps[1])
-
-                    # Kline 데이터 수집
-                    kline_data = await ins_market.fetch_klines_date(
+                collected_data = []
+                for missing_start, missing_end in missing_ranges:
+                    timestamp_ranges = self.__generate_timestamp_ranges(
+                        interval=interval,
+                        start_date=utils._convert_to_datetime(missing_start),
+                        end_date=utils._convert_to_datetime(missing_end),
+                    )
+                    for timestamps in timestamp_ranges:
+                        # 타임스탬프를 문자열로 변환
+                        start_timestamp_str = utils._convert_to_datetime(timestamps[0])
+                        end_timestamp_str = utils._convert_to_datetime(timestamps[1])
+
+                        # Kline 데이터 수집
+                        kline_data = await ins_market.fetch_klines_date(
+                            symbol=symbol,
+                            interval=interval,
+                            start_date=start_timestamp_str,
+                            end_date=end_timestamp_str,
+                        )
+                        collected_data.extend(kline_data)
+
+                        # 서버 기준 사용 weight가 상한 도달시 다음 분(weight 초기화)까지 대기한다.
+                        if ins_market.used_weight >= MAX_WEIGHT_PER_MINUTE:
+                            await asyncio.sleep(60 - time.time() % 60)
+
+                if missing_ranges:
+                    ins_catalog.merge(
+                        market=market,
                         symbol=symbol,
                         interval=interval,
-                        start_date=start_timestamp_str,
-                        end_date=end_timestamp_str,
+                        kline_data=collected_data,
+                        ranges=missing_ranges,
                     )
-                    collected_data.extend(kline_data)
-
-                # API 호출 간 간격 조정
-                await asyncio.sleep(0.2)
-                aggregated_results[symbol][interval] = collected_data
+                aggregated_results[symbol][interval] = ins_catalog.load(
+                    market=market,
+                    symbol=symbol,
+                    interval=interval,
+                    start_ts=start_timestamp,
+                    end_ts=end_timestamp,
+                ).tolist()
 
         if save:
             path = ConfigSetting.SystemConfig.path_kline_data.value
@@ -156,30 +186,6 @@ class FactoryManager:
             )
         return aggregated_results
 
-    # 생성한 closing_sync_data를 interval index데이터를 구성한다.(전체)
-    def __generate_full_indices(self, closing_sync_data):
-        # symbols를 획득
-        symbols = list(closing_sync_data.keys())
-        # Intervals를 획득
-        intervals = list(closing_sync_data[symbols[0]])
-        # 기본 데이터를 지정
-        base_data = closing_sync_data[symbols[0]]
-        # 마지막 index값 조회
-        max_index = len(base_data[intervals[0]])
-
-        # 인덱스 데이터를 저장할 자료를 초기화
-        indices_data = {}
-        # interval 루프
-        for interval in intervals:
-            # interval별 miute를 활용하여 step으로 지정
-            interval_step = utils._get_interval_minutes(interval)
-            # arange를 통해서 interval의 기준 index 지정.
-            indices_data[interval] = np.arange(
-                start=0, stop=max_index, step=interval_step
-            )
-        # 결과 반환.
-        return indices_data
-
     # 1분봉 종가 가격을 각 interval에 반영한 테스트용 더미 데이터를 생성한다.
     def generate_kline_closing_sync(
         self, kline_data: Dict, save: bool = False
@@ -230,72 +236,16 @@ class FactoryManager:
                     closing_sync_data[symbol][interval] = base_data
                     continue
 
-                timestamp_range = utils._get_interval_ms_seconds(interval) - 1
                 ### 목표 interval 데이터값을 조회한다.###
                 interval_data = kline_array[symbol][interval]
 
-                ### 데이터를 저장할 임시 변수를 초기화 한다. ###
-                temp_data = []
-
-                ### base data를 활용하여 index를 구현하고, index별 데이터를 순환한다.###
-                for index, data in enumerate(base_data):
-                    open_timestamp = data[0]  # 시작 타임스템프
-                    open_price = data[1]  # 시작 가격
-                    high_price = data[2]  # 최고 가격
-                    low_price = data[3]  # 최저 가격
-                    close_price = data[4]  # 마지막 가격
-                    volume = data[5]  # 거래량(단위 : coin)
-                    close_timestamp = data[6]  # 종료 타임스템프
-                    volume_total_usdt = data[7]  # 거래량(단위 : usdt)
-                    trades_count = data[8]  # 총 거래횟수
-                    taker_asset_volume = data[9]  # 시장가 주문 거래량(단위 : coin)
-                    taker_quote_volume = data[10]  # 시장가 주문 거래량(단위 : usdt)
-
-                    ### base_data가 적용되는 interval_data의 index값을 확보한다.
-                    condition = np.where(
-                        (interval_data[:, 0] <= open_timestamp)
-                        & (interval_data[:, 6] >= close_timestamp)
-                    )
-
-                    ### interval 전체 데이터에서 해당 interval 데이터만 추출한다. ###
-                    ### 용도는 start_timestap / end_timestamp추출 및 new_data에 적용을 위함. ###
-                    target_data = interval_data[condition]
-                    # print(target_data)
-
-                    target_open_timestamp = target_data[0, 0]  # 단일값이 확실할 경우
-                    target_close_timestamp = target_data[0, 6]  # 단일값이 확실할 경우
-
-                    new_data_condition = np.where(
-                        (base_data[:, 0] >= target_open_timestamp)
-                        & (base_data[:, 6] <= close_timestamp)
-                    )  # close_timestamp는 현재 data종료 시간 기준으로 해야한다.
-
-                    new_base_data = base_data[new_data_condition]
-
-                    timestamp_diff = new_base_data[-1, 6] - new_base_data[0, 0]
-                    if timestamp_range == timestamp_diff:
-                        new_data = target_data[0]
-                    else:
-                        new_data = [
-                            target_open_timestamp,
-                            new_base_data[0, 1],
-                            np.max(new_base_data[:, 2]),
-                            np.min(new_base_data[:, 3]),
-                            new_base_data[-1, 4],
-                            np.sum(new_base_data[:, 5]),
-                            target_close_timestamp,
-                            np.sum(new_base_data[:, 7]),
-                            np.sum(new_base_data[:, 8]),
-                            np.sum(new_base_data[:, 9]),
-                            np.sum(new_base_data[:, 10]),
-                            0,
-                        ]
-                    temp_data.append(new_data)
-                closing_sync_data[symbol][interval] = np.array(temp_data, float)
+                ### base data 각 index 시점의 interval 데이터를 벡터 연산으로 일괄 생성한다. ###
+                closing_sync_data[symbol][interval] = utils._generate_closing_sync(
+                    base_data=base_data, interval_data=interval_data, interval=interval
+                )
         if save:
-            path = ConfigSetting.SystemConfig.path_closing_sync_data.value
-            with open(file=path, mode="wb") as file:
-                pickle.dump(closing_sync_data, file)
+            path = ConfigSetting.SystemConfig.path_closing_sync_store.value
+            utils._save_columnar_store(path=path, dataset=closing_sync_data)
         return closing_sync_data
 
     # generate_kline_closing_sync index 자료를 생성한다.
@@ -312,36 +262,25 @@ class FactoryManager:
         3. 추가설명
             data_container는 utils에서 호출한 instance를 사용한다. params에 적용하면 해당 변수는 전체 적용된다.
             백테스를 위한 자료이며, 실제 알고리즘 트레이딩시에는 필요 없다. 데이터의 흐름을 구현하기 위하여 만든 함수다.
+            interval별 LookbackIndices[index]는 (start, stop, step) window를 반환하며, LookbackIndices.select로 조회한다.
         """
-        # 하루의 총 분
-
         symbols = list(closing_sync_data.keys())
         intervals = list(closing_sync_data[symbols[0]])
 
-        date_range = lookback_days
-        timestamp_step = utils._get_interval_minutes("1d") * date_range
-
-        indices_data = self.__generate_full_indices(closing_sync_data)
-        base_indices = indices_data[intervals[0]]
+        # 기준 interval(1분봉)의 데이터 길이
+        data_length = len(closing_sync_data[symbols[0]][intervals[0]])
 
         container_data = DataStoreage.DataContainer()
 
+        ### index 목록을 미리 생성하지 않고, 조회 시점에 (start, stop, step) window를 계산한다. ###
         for interval in intervals:
-            select_indices = []
-            for current_idx in base_indices:
-                reference_data = indices_data[interval]
-                start_idx = current_idx - timestamp_step
-                if start_idx < 0:
-                    start_idx
-                condition = np.where(
-                    (reference_data[:] >= start_idx)
-                    & (reference_data[:] < current_idx)
-                )
-                indices = indices_data[interval][condition]
-                add_indices = np.append(indices, current_idx)
-                select_indices.append(add_indices)
             container_data.set_data(
-                data_name=f"interval_{interval}", data=select_indices
+                data_name=f"interval_{interval}",
+                data=DataStoreage.LookbackIndices(
+                    interval=interval,
+                    data_length=data_length,
+                    lookback_days=lookback_days,
+                ),
             )
 
         return container_data
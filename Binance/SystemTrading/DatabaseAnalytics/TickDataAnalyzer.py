@@ -50,6 +50,14 @@ class TickDataAnalyzer:
                 score["buy"] += value
         return score["buy"] / score["sell"]
 
+    @staticmethod
+    def trade_pressure_array(prices:np.ndarray, quantities:np.ndarray, is_buyer_maker:np.ndarray):
+        """매수/매도 압력 계산 (RepositoryRing 열 데이터 입력, trade_pressure와 동일)"""
+        values = prices * quantities
+        sell = np.sum(values[is_buyer_maker])
+        buy = np.sum(values) - sell
+        return buy / sell
+
     @staticmethod
     def tick_interval(timestamps):
         """평균 틱 간격 계산"""
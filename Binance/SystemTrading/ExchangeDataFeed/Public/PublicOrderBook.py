@@ -0,0 +1,321 @@
+from typing import List, Dict, Optional, Any, Tuple, Callable, Awaitable
+from bisect import bisect_left
+import numpy as np
+
+import asyncio
+import sys, os
+home_path = os.path.expanduser("~")
+sys.path.append(os.path.join(home_path, "github", "Thunder", "Binance"))
+import Workspace.Utils.TradingUtils as tr_utils
+
+from Workspace.Services.PublicData.Fetcher.FuturesMarketFetcher import FuturesMarketFetcher
+
+# (symbol, limit) -> REST depth 응답 {"lastUpdateId", "bids", "asks"}
+SnapshotFetcher = Callable[[str, int], Awaitable[Dict[str, Any]]]
+
+
+class LocalOrderBook:
+    """
+    REST depth snapshot 1회와 diff depth stream(@depth@100ms)으로 유지하는 symbol별 호가창.
+
+    Binance Futures 동기화 규칙:
+        1. snapshot 수신 전 event는 보관한다.
+        2. u < lastUpdateId인 event는 버린다.
+        3. 첫 적용 event는 U <= lastUpdateId <= u 이어야 한다.
+        4. 이후 event의 pu는 직전 event의 u와 같아야 하며, 다르면 동기화를 해제하고 snapshot을 다시 받는다.
+        5. 수량은 절대값이며, 0이면 해당 가격을 삭제한다.
+
+    가격은 오름차순 list(bisect)로, 수량은 dict로 관리한다.
+    가격 탐색은 O(log n), 최우선 호가 조회는 O(1)이다. (bids 최우선 = 마지막, asks 최우선 = 처음)
+    동기화되지 않은 상태(snapshot 수신 전, 누락 발생 후)에는 호가를 비우며, 조회 함수는 None을 반환한다.
+    """
+
+    def __init__(self, symbol: str, max_buffer: int = 1_000):
+        self.symbol = symbol
+        self.max_buffer = max_buffer
+        self.bid_prices: List[float] = []
+        self.ask_prices: List[float] = []
+        self.bid_quantities: Dict[float, float] = {}
+        self.ask_quantities: Dict[float, float] = {}
+        self.last_update_id: int = 0
+        self.event_time: int = 0
+        self.is_synced: bool = False
+        self.buffer: List[Dict[str, Any]] = []
+        self.resync_count: int = 0
+
+    @staticmethod
+    def __update_side(prices: List[float], quantities: Dict[float, float], levels: List[List[str]]):
+        # 가격별 수량을 덮어쓰며, 수량 0은 삭제한다.
+        for price, quantity in levels:
+            price = float(price)
+            quantity = float(quantity)
+            if quantity == 0:
+                if quantities.pop(price, None) is not None:
+                    del prices[bisect_left(prices, price)]
+                continue
+            if price not in quantities:
+                prices.insert(bisect_left(prices, price), price)
+            quantities[price] = quantity
+
+    def __apply(self, data: Dict[str, Any]):
+        self.__update_side(self.bid_prices, self.bid_quantities, data["b"])
+        self.__update_side(self.ask_prices, self.ask_quantities, data["a"])
+        self.last_update_id = int(data["u"])
+        self.event_time = int(data.get("E", self.event_time))
+
+    def __clear_levels(self):
+        self.bid_prices.clear()
+        self.ask_prices.clear()
+        self.bid_quantities.clear()
+        self.ask_quantities.clear()
+
+    def __desync(self):
+        # 누락 이후의 호가는 신뢰할 수 없으므로 비운다.
+        self.is_synced = False
+        self.resync_count += 1
+        self.__clear_levels()
+
+    def set_snapshot(self, snapshot: Dict[str, Any]):
+        """
+        📥 REST depth snapshot으로 호가창을 초기화하고, 보관중인 event를 규칙에 따라 적용한다.
+
+        Args:
+            snapshot (Dict[str, Any]): fetch_order_book 응답 {"lastUpdateId", "bids", "asks"}
+        """
+        self.__clear_levels()
+        self.__update_side(self.bid_prices, self.bid_quantities, snapshot["bids"])
+        self.__update_side(self.ask_prices, self.ask_quantities, snapshot["asks"])
+        self.last_update_id = int(snapshot["lastUpdateId"])
+        self.event_time = int(snapshot.get("E", 0))
+
+        buffer = self.buffer
+        self.buffer = []
+        self.is_synced = False
+        for data in buffer:
+            self.apply_event(data)
+
+    def apply_event(self, data: Dict[str, Any]) -> bool:
+        """
+        🔄 diff depth event를 적용한다.
+
+        Args:
+            data (Dict[str, Any]): depthUpdate message의 data
+
+        Returns:
+            bool: 적용 여부 (미동기화 상태로 보관 또는 폐기시 False)
+        """
+        first_update_id = int(data["U"])
+        final_update_id = int(data["u"])
+
+        if not self.is_synced:
+            if self.last_update_id == 0 or first_update_id > self.last_update_id:
+                # snapshot 미수신 또는 snapshot 이후 event만 존재 (snapshot 재수신 필요)
+                self.buffer.append(data)
+                if len(self.buffer) > self.max_buffer:
+                    del self.buffer[0]
+                return False
+            if final_update_id < self.last_update_id:
+                return False
+            self.__apply(data)
+            self.is_synced = True
+            return True
+
+        if int(data["pu"]) != self.last_update_id:
+            # 누락 발생 : snapshot 재수신 후 다시 적용한다.
+            self.__desync()
+            self.last_update_id = 0
+            self.buffer = [data]
+            return False
+        self.__apply(data)
+        return True
+
+    @property
+    def needs_snapshot(self) -> bool:
+        """snapshot 재수신 필요 여부 (미동기화 상태이며 snapshot 이후 event가 도착한 경우 포함)"""
+        return not self.is_synced and (
+            self.last_update_id == 0
+            or (bool(self.buffer) and int(self.buffer[0]["U"]) > self.last_update_id)
+        )
+
+    def best_bid(self) -> Optional[Tuple[float, float]]:
+        """최우선 매수호가 (가격, 수량)"""
+        if not self.is_synced or not self.bid_prices:
+            return None
+        price = self.bid_prices[-1]
+        return price, self.bid_quantities[price]
+
+    def best_ask(self) -> Optional[Tuple[float, float]]:
+        """최우선 매도호가 (가격, 수량)"""
+        if not self.is_synced or not self.ask_prices:
+            return None
+        price = self.ask_prices[0]
+        return price, self.ask_quantities[price]
+
+    def mid_price(self) -> Optional[float]:
+        if not self.is_synced or not self.bid_prices or not self.ask_prices:
+            return None
+        return (self.bid_prices[-1] + self.ask_prices[0]) / 2
+
+    def get_levels(self, side: str, depth: Optional[int] = None) -> np.ndarray:
+        """
+        📤 최우선 호가부터 depth개의 [가격, 수량] 배열을 반환한다.
+
+        Args:
+            side (str): "bids" 또는 "asks"
+            depth (Optional[int], optional): 호가 갯수 (기본값 전체)
+
+        Returns:
+            np.ndarray: [[price, quantity], ...] (bids 가격 내림차순, asks 가격 오름차순, 미동기화시 빈 배열)
+        """
+        if side == "bids":
+            prices = self.bid_prices[::-1] if depth is None else self.bid_prices[: -depth - 1 : -1]
+            quantities = self.bid_quantities
+        elif side == "asks":
+            prices = self.ask_prices if depth is None else self.ask_prices[:depth]
+            quantities = self.ask_quantities
+        else:
+            raise ValueError(f"  ⚠️ side 입력 오류: {side}")
+        if not self.is_synced:
+            return np.empty((0, 2), dtype=np.float64)
+        levels = np.empty((len(prices), 2), dtype=np.float64)
+        levels[:, 0] = prices
+        levels[:, 1] = [quantities[price] for price in prices]
+        return levels
+
+    def get_orderbook(self, depth: Optional[int] = None) -> Optional[Dict[str, np.ndarray]]:
+        """
+        📑 fetch_order_book 응답과 동일한 구조로 반환한다. (detect_bid_wall / detect_ask_wall 입력 호환)
+
+        Args:
+            depth (Optional[int], optional): 호가 갯수 (기본값 전체)
+
+        Returns:
+            Optional[Dict[str, np.ndarray]]: {"lastUpdateId", "E", "bids", "asks"} (미동기화시 None)
+        """
+        if not self.is_synced:
+            return None
+        return {
+            "lastUpdateId": self.last_update_id,
+            "E": self.event_time,
+            "bids": self.get_levels("bids", depth),
+            "asks": self.get_levels("asks", depth),
+        }
+
+    def estimate_slippage(self, side: str, quantity: float) -> Optional[Dict[str, float]]:
+        """
+        📐 시장가 주문시 평균 체결가와 최우선 호가 대비 slippage를 계산한다.
+
+        Args:
+            side (str): "BUY"(asks 소진) 또는 "SELL"(bids 소진)
+            quantity (float): 주문 수량
+
+        Returns:
+            Optional[Dict[str, float]]: 평균 체결가, slippage 비율, 체결 가능 수량 (미동기화 또는 호가 없을 시 None)
+        """
+        if not self.is_synced:
+            return None
+        levels = self.get_levels("asks" if side == "BUY" else "bids")
+        if len(levels) == 0:
+            return None
+        cumulative = np.cumsum(levels[:, 1])
+        filled = np.minimum(levels[:, 1], np.maximum(quantity - (cumulative - levels[:, 1]), 0))
+        filled_quantity = float(filled.sum())
+        if filled_quantity == 0:
+            return None
+        average_price = float(np.dot(filled, levels[:, 0]) / filled_quantity)
+        best_price = float(levels[0, 0])
+        return {
+            "average_price": average_price,
+            "slippage_rate": abs(average_price - best_price) / best_price,
+            "filled_quantity": filled_quantity,
+        }
+
+
+class PublicOrderBookHub:
+    """
+    diff depth stream queue를 소비하여 symbol별 LocalOrderBook을 유지한다.
+    누락 감지 또는 최초 수신시 REST snapshot으로 자동 재동기화하며, 주기적인 REST 호가 조회가 필요 없다.
+    """
+
+    def __init__(self,
+                 symbols: List[str],
+                 queue_feed_websocket_depth: asyncio.Queue,
+                 event_trigger_shutdown_loop: asyncio.Event,
+                 event_fired_done_public_order_book_hub: asyncio.Event,
+                 snapshot_fetcher: Optional[SnapshotFetcher] = None,
+                 snapshot_limit: int = 1_000,
+                 websocket_timeout: float = 1.0,
+                 resync_retry_delay: float = 1.0,
+                 ):
+        self.symbols = symbols
+        self.queue_feed_websocket_depth = queue_feed_websocket_depth
+        self.event_trigger_shutdown_loop = event_trigger_shutdown_loop
+        self.event_fired_done_public_order_book_hub = event_fired_done_public_order_book_hub
+        self.snapshot_fetcher = (
+            snapshot_fetcher if snapshot_fetcher is not None else FuturesMarketFetcher().fetch_order_book
+        )
+        self.snapshot_limit = snapshot_limit
+        self.websocket_timeout = websocket_timeout
+        self.resync_retry_delay = resync_retry_delay
+
+        self.order_books: Dict[str, LocalOrderBook] = {
+            symbol: LocalOrderBook(symbol) for symbol in symbols
+        }
+        self.snapshot_tasks: Dict[str, asyncio.Task] = {}
+
+    async def __resync(self, symbol: str):
+        try:
+            snapshot = await self.snapshot_fetcher(symbol, self.snapshot_limit)
+            if not snapshot:
+                raise ValueError("빈 snapshot 응답")
+            self.order_books[symbol].set_snapshot(snapshot)
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            # 실패시 재시도 간격 동안 task를 유지하여 다음 event가 즉시 재요청하지 않도록 한다.
+            print(f"  ⚠️ {symbol} 호가 snapshot 수신 실패: {error!r}")
+            await asyncio.sleep(self.resync_retry_delay)
+        finally:
+            self.snapshot_tasks.pop(symbol, None)
+
+    def get_order_book(self, symbol: str) -> LocalOrderBook:
+        return self.order_books[symbol]
+
+    def handle_message(self, message: Dict[str, Any]) -> bool:
+        """
+        combined stream depth message를 적용하고, 필요시 snapshot 재수신 task를 생성한다.
+
+        Args:
+            message (Dict[str, Any]): {"stream", "data"} 형태의 depth message
+
+        Returns:
+            bool: 적용 여부
+        """
+        data = message["data"]
+        symbol = data["s"]
+        order_book = self.order_books.get(symbol)
+        if order_book is None:
+            return False
+        is_applied = order_book.apply_event(data)
+        if order_book.needs_snapshot and symbol not in self.snapshot_tasks:
+            self.snapshot_tasks[symbol] = asyncio.create_task(self.__resync(symbol))
+        return is_applied
+
+    @tr_utils.Decorator.log_lifecycle()
+    async def route_message_depth(self):
+        while not self.event_trigger_shutdown_loop.is_set():
+            try:
+                message = await asyncio.wait_for(
+                    self.queue_feed_websocket_depth.get(), timeout=self.websocket_timeout
+                )
+            except asyncio.TimeoutError:
+                continue
+            self.handle_message(message)
+            self.queue_feed_websocket_depth.task_done()
+        for task in list(self.snapshot_tasks.values()):
+            task.cancel()
+
+    async def start(self):
+        await self.route_message_depth()
+        self.event_fired_done_public_order_book_hub.set()
+        print(f"  \033[91m🔴 Shutdown\033[0m >> \033[91mPublicOrderBook.py\033[0m")
@@ -0,0 +1,307 @@
+from typing import List, Dict, Optional, Iterable, Iterator, Tuple, Any
+import heapq
+import json
+import time
+
+import asyncio
+import sys, os
+home_path = os.path.expanduser("~")
+sys.path.append(os.path.join(home_path, "github", "Thunder", "Binance"))
+import Workspace.Utils.TradingUtils as tr_utils
+
+# (event time, stream type, combined stream message)
+ReplayEvent = Tuple[int, str, Dict[str, Any]]
+
+
+class ReplaySource:
+    """
+    PublicWebsocketHub가 queue에 넣는 combined stream 메시지와 동일한 형태의 replay event를 생성한다.
+    event는 (event time, stream type, message) 형태이며 event time 순으로 정렬되어 있어야 한다.
+    """
+
+    STREAM_TYPES: Tuple[str, ...] = (
+        "ticker",
+        "trade",
+        "miniTicker",
+        "depth",
+        "aggTrade",
+        "kline",
+    )
+
+    @staticmethod
+    def from_klines(
+        symbol: str,
+        interval: str,
+        kline_data: Iterable[List[Any]],
+        event_timestamps: Optional[Iterable[int]] = None,
+    ) -> Iterator[ReplayEvent]:
+        """
+        📨 kline data(REST 12열)로 kline stream 메시지를 생성한다.
+
+        Args:
+            symbol (str): symbol 값
+            interval (str): interval 값
+            kline_data (Iterable[List[Any]]): kline data 또는 closing sync data
+            event_timestamps (Optional[Iterable[int]], optional): 행별 event time.
+                closing sync data 사용시 1분봉 close timestamp를 입력하며, 미입력시 close timestamp를 사용한다.
+
+        Returns:
+            Iterator[ReplayEvent]: kline replay event
+        """
+        stream = f"{symbol.lower()}@kline_{interval}"
+        kline_data = iter(kline_data)
+        event_timestamps = iter(event_timestamps) if event_timestamps is not None else None
+        for row in kline_data:
+            close_timestamp = int(row[6])
+            event_time = (
+                int(next(event_timestamps)) if event_timestamps is not None else close_timestamp
+            )
+            message = {
+                "stream": stream,
+                "data": {
+                    "e": "kline",
+                    "E": event_time,
+                    "s": symbol,
+                    "k": {
+                        "t": int(row[0]),
+                        "T": close_timestamp,
+                        "s": symbol,
+                        "i": interval,
+                        "f": -1,
+                        "L": -1,
+                        "o": str(row[1]),
+                        "c": str(row[4]),
+                        "h": str(row[2]),
+                        "l": str(row[3]),
+                        "v": str(row[5]),
+                        "n": int(row[8]),
+                        "x": event_time >= close_timestamp,
+                        "q": str(row[7]),
+                        "V": str(row[9]),
+                        "Q": str(row[10]),
+                        "B": "0",
+                    },
+                },
+            }
+            yield event_time, "kline", message
+
+    @staticmethod
+    def from_agg_trades(
+        symbol: str, agg_trades: Iterable[Dict[str, Any]]
+    ) -> Iterator[ReplayEvent]:
+        """
+        📨 REST aggTrades 응답으로 aggTrade stream 메시지를 생성한다.
+
+        Args:
+            symbol (str): symbol 값
+            agg_trades (Iterable[Dict[str, Any]]): fetch_agg_trades 결과물
+
+        Returns:
+            Iterator[ReplayEvent]: aggTrade replay event
+        """
+        stream = f"{symbol.lower()}@aggTrade"
+        for trade in agg_trades:
+            event_time = int(trade["T"])
+            message = {
+                "stream": stream,
+                "data": {"e": "aggTrade", "E": event_time, "s": symbol, **trade},
+            }
+            yield event_time, "aggTrade", message
+
+    @staticmethod
+    def from_jsonl(path: str) -> Iterator[ReplayEvent]:
+        """
+        📂 MessageRecorder로 기록한 파일을 불러온다. 각 행은 {"stream_type", "message"} 형태다.
+
+        Args:
+            path (str): 파일 주소
+
+        Returns:
+            Iterator[ReplayEvent]: 기록된 replay event
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                record = json.loads(line)
+                message = record["message"]
+                yield int(message["data"]["E"]), record["stream_type"], message
+
+    @staticmethod
+    def merge(*sources: Iterable[ReplayEvent]) -> Iterator[ReplayEvent]:
+        """
+        여러 replay event를 event time 순으로 병합한다.
+
+        Returns:
+            Iterator[ReplayEvent]: 병합된 replay event
+        """
+        return heapq.merge(*sources, key=lambda event: event[0])
+
+
+class MessageRecorder:
+    """
+    live websocket 메시지를 ReplaySource.from_jsonl 형식으로 기록한다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.file = open(self.path, "a", encoding="utf-8")
+
+    def record(self, stream_type: str, message: Dict[str, Any]):
+        self.file.write(json.dumps({"stream_type": stream_type, "message": message}) + "\n")
+
+    def close(self):
+        self.file.close()
+
+
+class PublicReplayHub:
+    """
+    PublicWebsocketHub 대신 replay event를 동일한 queue에 공급한다.
+    websocket 연결 없이 live 경로(storage, analysis)를 offline으로 실행 및 부하 테스트할 수 있다.
+
+    speed:
+        1.0 실시간, 100.0 100배속, None 대기 없이 최대 속도
+        (None은 처리량 측정용으로, 소비측 처리 속도가 반영되도록 maxsize가 지정된 queue가 필요하다.)
+    yield_every:
+        대기 없이 공급하는 동안 event loop에 제어권을 넘기는 메시지 간격
+    """
+
+    def __init__(self,
+                 source:Iterable[ReplayEvent],
+                 queue_feed_websocket_ticker:asyncio.Queue,
+                 queue_feed_websocket_trade:asyncio.Queue,
+                 queue_feed_websocket_miniTicker:asyncio.Queue,
+                 queue_feed_websocket_depth:asyncio.Queue,
+                 queue_feed_websocket_aggTrade:asyncio.Queue,
+                 queue_feed_websocket_kline:asyncio.Queue,
+
+                 event_trigger_shutdown_loop:asyncio.Event,
+
+                 event_fired_done_shutdown_loop_websocket_ticker:asyncio.Event,
+                 event_fired_done_shutdown_loop_websocket_trade:asyncio.Event,
+                 event_fired_done_shutdown_loop_websocket_miniTicker:asyncio.Event,
+                 event_fired_done_shutdown_loop_websocket_depth:asyncio.Event,
+                 event_fired_done_shutdown_loop_websocket_aggTrade:asyncio.Event,
+                 event_fired_done_shutdown_loop_websocket_kline:asyncio.Event,
+
+                 event_fired_done_public_websocket_hub:asyncio.Event,
+                 speed:Optional[float] = 1.0,
+                 yield_every:int = 64
+                 ):
+        self.source = source
+        self.queues: Dict[str, asyncio.Queue] = {
+            "ticker": queue_feed_websocket_ticker,
+            "trade": queue_feed_websocket_trade,
+            "miniTicker": queue_feed_websocket_miniTicker,
+            "depth": queue_feed_websocket_depth,
+            "aggTrade": queue_feed_websocket_aggTrade,
+            "kline": queue_feed_websocket_kline,
+        }
+        self.event_trigger_shutdown_loop = event_trigger_shutdown_loop
+        self.events_done_shutdown_loop: List[asyncio.Event] = [
+            event_fired_done_shutdown_loop_websocket_ticker,
+            event_fired_done_shutdown_loop_websocket_trade,
+            event_fired_done_shutdown_loop_websocket_miniTicker,
+            event_fired_done_shutdown_loop_websocket_depth,
+            event_fired_done_shutdown_loop_websocket_aggTrade,
+            event_fired_done_shutdown_loop_websocket_kline,
+        ]
+        self.event_fired_done_public_websocket_hub = event_fired_done_public_websocket_hub
+        self.speed = speed
+        self.yield_every = yield_every
+        if self.speed is None and any(queue.maxsize <= 0 for queue in self.queues.values()):
+            raise ValueError("  ⚠️ speed=None 사용시 maxsize가 지정된 queue가 필요합니다.")
+
+        self.message_count: Dict[str, int] = {stream: 0 for stream in self.queues}
+        self.elapsed_seconds: float = 0.0
+        self.max_lag_seconds: float = 0.0
+
+    async def wait_drained(self):
+        """
+        소비측이 queue의 메시지를 모두 가져갈 때까지 대기한다. (종료 신호시 중단)
+        """
+        while not self.event_trigger_shutdown_loop.is_set() and any(
+            not queue.empty() for queue in self.queues.values()
+        ):
+            await asyncio.sleep(0.001)
+
+    @tr_utils.Decorator.log_lifecycle()
+    async def route_replay_message(self):
+        start_wall = time.perf_counter()
+        start_event_time: Optional[int] = None
+        pending_yield = 0
+        for event_time, stream_type, message in self.source:
+            if self.event_trigger_shutdown_loop.is_set():
+                break
+            if start_event_time is None:
+                start_event_time = event_time
+            is_waited = False
+            if self.speed is not None:
+                target = (event_time - start_event_time) / 1_000 / self.speed
+                delay = target - (time.perf_counter() - start_wall)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                    is_waited = True
+                else:
+                    self.max_lag_seconds = max(self.max_lag_seconds, -delay)
+            await self.queues[stream_type].put(message)
+            self.message_count[stream_type] += 1
+            # 미제한 queue의 put은 대기하지 않으므로 주기적으로 소비측에 제어권을 넘긴다.
+            pending_yield = 0 if is_waited else pending_yield + 1
+            if pending_yield >= self.yield_every:
+                pending_yield = 0
+                await asyncio.sleep(0)
+        # 처리량은 소비측이 마지막 메시지를 가져간 시점 기준으로 측정한다.
+        await self.wait_drained()
+        self.elapsed_seconds = time.perf_counter() - start_wall
+        for event in self.events_done_shutdown_loop:
+            event.set()
+
+    def get_throughput(self) -> Dict[str, float]:
+        """
+        replay 결과 처리량을 반환한다. 소요시간은 소비측이 queue를 모두 비운 시점까지이며,
+        speed=None(maxsize 지정 queue)일 때 소비측 처리 한계가 반영된 최대 처리량이다.
+
+        Returns:
+            Dict[str, float]: 전체 메시지 수, 소요시간, 초당 메시지 수, 최대 지연시간
+        """
+        total = sum(self.message_count.values())
+        return {
+            "messages": total,
+            "elapsed_seconds": self.elapsed_seconds,
+            "messages_per_second": total / self.elapsed_seconds if self.elapsed_seconds else 0.0,
+            "max_lag_seconds": self.max_lag_seconds,
+        }
+
+    async def start(self):
+        await self.route_replay_message()
+        self.event_fired_done_public_websocket_hub.set()
+        throughput = self.get_throughput()
+        print(
+            f"  ℹ️ Replay {throughput['messages']:,} messages - "
+            f"{throughput['messages_per_second']:,.0f} msg/s"
+        )
+        print(f"  \033[91m🔴 Shutdown\033[0m >> \033[91mPublicReplayHub.py\033[0m")
+
+
+if __name__ == "__main__":
+    symbol = "BTCUSDT"
+    dummy_klines = [
+        [idx * 60_000, 1, 2, 0.5, 1.5, 10, idx * 60_000 + 59_999, 15, 3, 5, 7, 0]
+        for idx in range(100_000)
+    ]
+    async def main():
+        q_ = tuple(asyncio.Queue(maxsize=1_000) for _ in range(6))
+        e_ = tuple(asyncio.Event() for _ in range(8))
+        source = ReplaySource.from_klines(symbol, "1m", dummy_klines)
+        dummy = PublicReplayHub(source, *q_, *e_, speed=None)
+
+        async def consume(queue: asyncio.Queue):
+            while True:
+                await queue.get()
+
+        consumers = [asyncio.create_task(consume(queue)) for queue in q_]
+        await dummy.start()
+        for consumer in consumers:
+            consumer.cancel()
+        print(dummy.get_throughput())
+
+    asyncio.run(main())
@@ -1,4 +1,4 @@
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import aiohttp
 
 import asyncio
@@ -10,6 +10,12 @@ import Workspace.Utils.TradingUtils as tr_utils
 from Workspace.Services.PublicData.Receiver.FuturesMarketWebsocket import FuturesMarketWebsocket
 
 class PublicWebsocketHub:
+    """
+    전체 public stream(ticker, trade, miniTicker, depth, aggTrade, kline)을 combined stream 연결로 수신한다.
+    연결당 최대 max_streams_per_connection개의 stream을 묶으며, 'stream' 값으로 기존 queue에 전달한다.
+    연결이 끊어지면 해당 연결 그룹만 backoff 간격으로 재연결한다.
+    """
+
     def __init__(self,
                  symbols:List[str],
                  intervals:List[str],
@@ -30,7 +36,10 @@ class PublicWebsocketHub:
                  event_fired_done_shutdown_loop_websocket_kline:asyncio.Event,
                  
                  event_fired_done_public_websocket_hub:asyncio.Event,
-                 websocket_timeout:float = 1.0
+                 websocket_timeout:float = 1.0,
+                 max_streams_per_connection:int = 200,
+                 reconnect_max_delay:float = 30.0,
+                 queue_feed_order_book_depth:Optional[asyncio.Queue] = None
                  ):
         
         self.symbols = symbols
@@ -54,14 +63,34 @@ class PublicWebsocketHub:
         self.event_fired_done_public_websocket_hub = event_fired_done_public_websocket_hub
 
         self.websocket_timeout = websocket_timeout
+        self.max_streams_per_connection = max_streams_per_connection
+        self.reconnect_max_delay = reconnect_max_delay
+
+        # PublicOrderBookHub 전용 depth queue (지정시 depth message를 추가로 전달한다.)
+        self.queue_feed_order_book_depth = queue_feed_order_book_depth
+        depth_queues = (self.queue_feed_websocket_depth,) + (
+            (self.queue_feed_order_book_depth,) if self.queue_feed_order_book_depth is not None else ()
+        )
+
+        # stream type (stream 이름의 symbol 이후 값) -> 수신 queue 목록
+        self.routes: Dict[str, Tuple[asyncio.Queue, ...]] = {
+            "ticker": (self.queue_feed_websocket_ticker,),
+            "trade": (self.queue_feed_websocket_trade,),
+            "miniTicker": (self.queue_feed_websocket_miniTicker,),
+            "depth@100ms": depth_queues,
+            "aggTrade": (self.queue_feed_websocket_aggTrade,),
+            **{f"kline_{interval}": (self.queue_feed_websocket_kline,) for interval in self.intervals},
+        }
 
         self.session:aiohttp.ClientSession = None
-        self.websocket_ticker = FuturesMarketWebsocket(self.symbols)
-        self.websocket_trade = FuturesMarketWebsocket(self.symbols)
-        self.websocket_miniTicker = FuturesMarketWebsocket(self.symbols)
-        self.websocket_depth = FuturesMarketWebsocket(self.symbols)
-        self.websocket_aggTrade = FuturesMarketWebsocket(self.symbols)
-        self.websocket_kline = FuturesMarketWebsocket(self.symbols)
+        streams = FuturesMarketWebsocket(self.symbols).build_streams(list(self.routes))
+        self.stream_groups: List[List[str]] = [
+            streams[idx : idx + self.max_streams_per_connection]
+            for idx in range(0, len(streams), self.max_streams_per_connection)
+        ]
+        self.websockets: List[FuturesMarketWebsocket] = [
+            FuturesMarketWebsocket(self.symbols) for _ in self.stream_groups
+        ]
 
     @tr_utils.Decorator.log_complete()
     async def initialize_session(self, session:Optional[aiohttp.ClientSession]=None):
@@ -71,102 +100,76 @@ class PublicWebsocketHub:
             self.session = session
 
     @tr_utils.Decorator.log_ws_connect()
-    async def connect_websocket_ticker(self):
-        stream = "ticker"
-        await self.websocket_ticker.open_stream_connection(stream, self.session)
-
-    @tr_utils.Decorator.log_ws_connect()
-    async def connect_websocket_tread(self):
-        stream = "trade"
-        await self.websocket_trade.open_stream_connection(stream, self.session)
-
-    @tr_utils.Decorator.log_ws_connect()
-    async def connect_websocket_miniTicker(self):
-        stream = "miniTicker"
-        await self.websocket_miniTicker.open_stream_connection(stream, self.session)
-
-    @tr_utils.Decorator.log_ws_connect()
-    async def connect_websocket_depth(self):
-        stream = "depth"
-        await self.websocket_depth.open_stream_connection(stream, self.session)
-
-    @tr_utils.Decorator.log_ws_connect()
-    async def connect_websocket_aggTrade(self):
-        stream = "aggTrade"
-        await self.websocket_aggTrade.open_stream_connection(stream, self.session)
-
-    @tr_utils.Decorator.log_ws_connect()
-    async def connect_websocket_kline(self):
-        await self.websocket_kline.open_kline_connection(self.intervals, self.session)
-
-    @tr_utils.Decorator.log_lifecycle()
-    async def route_message_ticker(self):
-        while not self.event_trigger_shutdown_loop.is_set():
-            try:
-                message = await asyncio.wait_for(self.websocket_ticker.receive_message(), timeout=self.websocket_timeout)
-            except asyncio.TimeoutError:
-                continue
-            await self.queue_feed_websocket_ticker.put(message)
-        self.event_fired_done_shutdown_loop_websocket_ticker.set()
-    
-    @tr_utils.Decorator.log_lifecycle()
-    async def route_message_tread(self):
+    async def connect_websocket(self, websocket:FuturesMarketWebsocket, streams:List[str]):
+        await websocket.open_combined_connection(streams, self.session)
+
+    async def dispatch_message(self, message:Dict):
+        """
+        수신 message를 'stream' 값(예: btcusdt@kline_1m)의 stream type에 해당하는 queue로 전달한다.
+        'stream' 값이 없거나(구독 응답, 오류 등) 등록되지 않은 stream type은 기록 후 무시한다.
+        """
+        stream = message.get("stream") if isinstance(message, dict) else None
+        queues = self.routes.get(stream.split("@", 1)[-1]) if isinstance(stream, str) else None
+        if queues is None:
+            print(f"  ⚠️ 전달 대상 없는 message 무시: {str(message)[:200]}")
+            return
+        for queue in queues:
+            await queue.put(message)
+
+    async def reconnect_websocket(self, websocket:FuturesMarketWebsocket, streams:List[str]) -> bool:
+        """
+        끊어진 연결을 backoff(1초부터 2배씩, 최대 reconnect_max_delay초) 간격으로 재연결한다.
+
+        Returns:
+            bool: 재연결 성공 여부 (종료 신호시 False)
+        """
+        delay = 1.0
         while not self.event_trigger_shutdown_loop.is_set():
+            if websocket.websocket is not None:
+                await websocket.websocket.close()
             try:
-                message = await asyncio.wait_for(self.websocket_trade.receive_message(), timeout=self.websocket_timeout)
-            except asyncio.TimeoutError:
+                await websocket.open_combined_connection(streams, self.session)
+            except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as error:
+                print(f"  ⚠️ WebSocket 재연결 실패({error}), {delay:.0f}초 후 재시도")
+                try:
+                    await asyncio.wait_for(self.event_trigger_shutdown_loop.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                delay = min(delay * 2, self.reconnect_max_delay)
                 continue
-            await self.queue_feed_websocket_trade.put(message)
-        self.event_fired_done_shutdown_loop_websocket_trade.set()
-    
-    @tr_utils.Decorator.log_lifecycle()
-    async def route_message_miniTicker(self):
-        while not self.event_trigger_shutdown_loop.is_set():
-            try:
-                message = await asyncio.wait_for(self.websocket_miniTicker.receive_message(), timeout=self.websocket_timeout)
-            except asyncio.TimeoutError:
-                continue
-            await self.queue_feed_websocket_miniTicker.put(message)
-        self.event_fired_done_shutdown_loop_websocket_miniTicker.set()
-    
-    @tr_utils.Decorator.log_lifecycle()
-    async def route_message_depth(self):
-        while not self.event_trigger_shutdown_loop.is_set():
-            try:
-                message = await asyncio.wait_for(self.websocket_depth.receive_message(), timeout=self.websocket_timeout)
-            except asyncio.TimeoutError:
-                continue
-            await self.queue_feed_websocket_depth.put(message)
-        self.event_fired_done_shutdown_loop_websocket_depth.set()
-    
+            if self.event_trigger_shutdown_loop.is_set():
+                # 재연결 중 종료 신호 수신 : watch_shutdown 이후 생성된 연결을 직접 닫는다.
+                await websocket.websocket.close()
+                return False
+            return True
+        return False
+
     @tr_utils.Decorator.log_lifecycle()
-    async def route_message_aggTrage(self):
+    async def route_message(self, websocket:FuturesMarketWebsocket, streams:List[str]):
+        # 종료 신호시 watch_shutdown이 연결을 닫아 수신 대기를 해제한다.
         while not self.event_trigger_shutdown_loop.is_set():
             try:
-                message = await asyncio.wait_for(self.websocket_aggTrade.receive_message(), timeout=self.websocket_timeout)
-            except asyncio.TimeoutError:
+                message = await websocket.receive_message()
+            except ConnectionError:
+                if not await self.reconnect_websocket(websocket, streams):
+                    break
                 continue
-            await self.queue_feed_websocket_aggTrade.put(message)
-        self.event_fired_done_shutdown_loop_websocket_depth.set()
-    
-    @tr_utils.Decorator.log_lifecycle()
-    async def route_message_kline(self):
-        while not self.event_trigger_shutdown_loop.is_set():
-            try:
-                message = await asyncio.wait_for(self.websocket_kline.receive_message(), timeout=self.websocket_timeout)
-            except asyncio.TimeoutError:
+            if message is None:
                 continue
-            await self.queue_feed_websocket_kline.put(message)
-        self.event_fired_done_shutdown_loop_websocket_depth.set()
+            await self.dispatch_message(message)
+
+    async def watch_shutdown(self):
+        await self.event_trigger_shutdown_loop.wait()
+        for websocket in self.websockets:
+            if websocket.websocket is not None:
+                await websocket.websocket.close()
 
     @tr_utils.Decorator.log_complete()
     async def connect_all_websockets(self):
-        await self.connect_websocket_ticker()
-        await self.connect_websocket_tread()
-        await self.connect_websocket_miniTicker()
-        await self.connect_websocket_depth()
-        await self.connect_websocket_aggTrade()
-        await self.connect_websocket_kline()
+        if self.session is None:
+            await self.initialize_session()
+        for websocket, streams in zip(self.websockets, self.stream_groups):
+            await self.connect_websocket(websocket, streams)
     
     @tr_utils.Decorator.log_complete()
     async def disconnect_all_websockets(self):
@@ -175,28 +178,47 @@ class PublicWebsocketHub:
     async def start(self):
         await self.connect_all_websockets()
         tasks = [
-            asyncio.create_task(self.route_message_ticker()),
-            asyncio.create_task(self.route_message_tread()),
-            asyncio.create_task(self.route_message_miniTicker()),
-            asyncio.create_task(self.route_message_depth()),
-            asyncio.create_task(self.route_message_aggTrage()),
-            asyncio.create_task(self.route_message_kline()),
+            asyncio.create_task(self.route_message(websocket, streams))
+            for websocket, streams in zip(self.websockets, self.stream_groups)
         ]
-        await asyncio.gather(*tasks)
+        watcher = asyncio.create_task(self.watch_shutdown())
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in (*tasks, watcher):
+                task.cancel()
+            await asyncio.gather(*tasks, watcher, return_exceptions=True)
         await self.disconnect_all_websockets()
+        for event in (
+            self.event_fired_done_shutdown_loop_websocket_ticker,
+            self.event_fired_done_shutdown_loop_websocket_trade,
+            self.event_fired_done_shutdown_loop_websocket_miniTicker,
+            self.event_fired_done_shutdown_loop_websocket_depth,
+            self.event_fired_done_shutdown_loop_websocket_aggTrade,
+            self.event_fired_done_shutdown_loop_websocket_kline,
+        ):
+            event.set()
         self.event_fired_done_public_websocket_hub.set()
         print(f"  \033[91m🔴 Shutdown\033[0m >> \033[91mPublicWebsocketHub.py\033[0m")
     
 if __name__ == "__main__":
+    from SystemTrading.ExchangeDataFeed.Public.PublicOrderBook import PublicOrderBookHub
+
     symbols = ["BTCUSDT", "XRPUSDT"]
     intervals = ["1m", "3m"]
-    q_ = []
-    e_ = []
-    for _ in range(6):
-        q_.append(asyncio.Queue())
-    for _ in range(7):
-        e_.append(asyncio.Event())
-    q_ = tuple(q_)
-    e_ = tuple(e_)
-    dummy = PublicWebsocketHub(symbols, intervals, *q_, *e_)
-    asyncio.run(dummy.start())
\ No newline at end of file
+
+    async def main():
+        q_ = tuple(asyncio.Queue() for _ in range(6))
+        event_trigger_shutdown_loop = asyncio.Event()
+        e_ = tuple(asyncio.Event() for _ in range(7))
+        queue_feed_order_book_depth = asyncio.Queue()
+        dummy = PublicWebsocketHub(
+            symbols, intervals, *q_, event_trigger_shutdown_loop, *e_,
+            queue_feed_order_book_depth=queue_feed_order_book_depth,
+        )
+        order_book_hub = PublicOrderBookHub(
+            symbols, queue_feed_order_book_depth, event_trigger_shutdown_loop, asyncio.Event()
+        )
+        await asyncio.gather(dummy.start(), order_book_hub.start())
+
+    asyncio.run(main())
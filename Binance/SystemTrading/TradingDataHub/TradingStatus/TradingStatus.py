@@ -10,6 +10,7 @@ from SystemConfig import Streaming
 import SystemTrading.TradingDataHub.ReceiverDataStorage.StorageNodeManager as node_storage
 import Workspace.Utils.TradingUtils as tr_utils
 from Workspace.DataStorage.StorageDeque import StorageDeque
+from Workspace.Repository.RepositoryRing import RepositoryRing
 from Workspace.DataStorage.StorageOverwrite import StorageOverwrite
 
 class ReceiverDataStorage:
@@ -81,11 +82,11 @@ class ReceiverDataStorage:
         self.event_fired_clear_account_balance = event_fired_clear_account_balance
         self.event_fired_clear_order_status = event_fired_clear_order_status
 
-        self.storage_ticker = StorageDeque(Streaming.max_lengh_ticker)#
-        self.storage_trade = StorageDeque(Streaming.max_lengh_trade)#
-        self.storage_miniTicker = StorageDeque(Streaming.max_lengh_miniTicker)#
+        self.storage_ticker = RepositoryRing("ticker", Streaming.max_lengh_ticker)#
+        self.storage_trade = RepositoryRing("trade", Streaming.max_lengh_trade)#
+        self.storage_miniTicker = RepositoryRing("miniTicker", Streaming.max_lengh_miniTicker)#
         self.storage_depth = StorageDeque(Streaming.max_lengh_depth)#
-        self.storage_aggTrade = StorageDeque(Streaming.max_lengh_aggTrade)#
+        self.storage_aggTrade = RepositoryRing("aggTrade", Streaming.max_lengh_aggTrade)#
         self.storage_kline_ws = node_storage.storage_kline_real#
         self.storage_execution_ws = node_storage.storage_execution_ws#
         self.storage_kline_fetcher = node_storage.storage_kline_history#
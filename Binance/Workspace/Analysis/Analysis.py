@@ -12,6 +12,7 @@ home_path = os.path.expanduser("~")
 sys.path.append(os.path.join(home_path, "github", "Thunder", "Binance"))
 
 from Workspace.Analysis.Indicator import *
+from Workspace.Analysis.Pattern import Streak
 
 
 def count_consecutive_drops(values:np.ndarray) -> int:
@@ -19,26 +20,24 @@ def count_consecutive_drops(values:np.ndarray) -> int:
     📉 값의 연속 하락횟수를 연산한다.    
 
     Args:
-        values (np.ndarray): 계산하고자 하는 값(예: prices, values)
+        values (np.ndarray): 계산하고자 하는 값(예: prices, values), 2차원(symbols × 시간) 입력시 행별 연산
 
-    Returns: int
+    Returns: int | np.ndarray
     """
-    values_reversed = values[::-1]
-    diff = np.diff(values)
-    return next((i for i, v in enumerate(diff) if v > 0), len(diff))
+    diff = np.diff(values, axis=-1)
+    return Streak.leading(~(diff > 0))
 
 def count_consecutive_gains(values:np.ndarray) -> int:
     """
     📈 값의 연속 상승횟수를 연산한다.    
 
     Args:
-        values (np.ndarray): 계산하고자 하는 값(예: prices, values)
+        values (np.ndarray): 계산하고자 하는 값(예: prices, values), 2차원(symbols × 시간) 입력시 행별 연산
 
-    Returns: int
+    Returns: int | np.ndarray
     """
-    values_reversed = values[::-1]
-    diff = np.diff(values)
-    return next((i for i, v in enumerate(diff) if v < 0), len(diff))
+    diff = np.diff(values, axis=-1)
+    return Streak.leading(~(diff < 0))
 
 def detect_bid_wall(orderbook) -> tuple:
     """
@@ -14,13 +14,21 @@ from Workspace.DataStorage.DataCollector.NodeStorage import MainStorage
 from Workspace.DataStorage.DataCollector.aggTradeStorage import aggTradeStorage
 from Workspace.DataStorage.DataCollector.DepthStorage import DepthStorage
 from Workspace.DataStorage.DataCollector.ExecutionStorage import ExecutionStorage
+from Workspace.Analysis.StreamingIndicator import (
+    IndicatorStream,
+    StreamingSMA,
+    StreamingEMA,
+    StreamingMACD,
+    StreamingRSI,
+    StreamingBollinger,
+)
 
 import SystemConfig
 
-def process_analysis(symbol, kline_data, agg_trade, depth):
-    """멀티프로세싱으로 실행될 데이터 분석 함수"""
+def process_analysis(symbol, indicator_values, agg_trade, depth):
+    """멀티프로세싱으로 실행될 데이터 분석 함수 (kline 대신 실시간 지표값을 전달받는다.)"""
     return (f"{symbol}: 분석 완료\n"
-            f"kline size: {len(kline_data)}\n"
+            f"indicators: {indicator_values}\n"
             f"agg_trade size: {len(agg_trade)}\n"
             f"depth size: {len(depth)}\n")         
             # ✅ Queue를 사용하지 않고, 결과를 직접 반환
@@ -67,6 +75,19 @@ class TradingAnalysis:
 
         self.ma_sam = {}
 
+        # 마감 캔들은 1회만 반영하고, 진행중 캔들은 임시값만 계산하는 실시간 지표
+        self.indicator_stream = IndicatorStream(
+            {
+                "sma_20": lambda: StreamingSMA(20),
+                "ema_20": lambda: StreamingEMA(20),
+                "macd": StreamingMACD,
+                "rsi": StreamingRSI,
+                "bollinger": StreamingBollinger,
+            }
+        )
+        # {symbol: {kline_data의 interval key: {지표명: 진행중 캔들 기준 지표값}}}
+        self.indicator_values: Dict[str, Dict[str, Dict]] = {}
+
     def ma_sma(self):
         KlineDataUpdater._merge_kline(self.storage_real_time, self.storage_history)
         
@@ -85,10 +106,24 @@ class TradingAnalysis:
         # ✅ queue를 전달하지 않고 순수 데이터만 반환
         return symbol, kline_data, agg_trade, depth
 
+    def update_indicators(self, symbol: str, kline_data: Dict[str, List]):
+        """신규 마감 캔들만 실시간 지표에 반영하고 진행중 캔들 기준 지표값을 저장 및 반환하는 함수
+        (interval은 kline_data의 key를 그대로 사용한다.)"""
+        self.indicator_values[symbol] = {
+            interval: self.indicator_stream.update(symbol, interval, rows)
+            for interval, rows in kline_data.items()
+            if rows
+        }
+        return self.indicator_values[symbol]
+
     async def analysis_async(self):
         """비동기 루프에서 멀티프로세싱 분석 실행"""
         loop = asyncio.get_running_loop()
-        dataset = [self.get_dataset(symbol) for symbol in self.symbols]  # ✅ queue 없이 데이터만 전달
+        # ✅ kline 전체 대신 실시간 지표값만 프로세스에 전달한다.
+        dataset = [
+            (symbol, self.update_indicators(symbol, kline_data), agg_trade, depth)
+            for symbol, kline_data, agg_trade, depth in map(self.get_dataset, self.symbols)
+        ]
 
         with multiprocessing.Pool(processes=4) as pool:
             results = await loop.run_in_executor(None, pool.starmap, process_analysis, dataset)
@@ -1,16 +1,358 @@
 ### 초기설정
 
 import asyncio
+import warnings
 import numpy as np
 from pprint import pprint
 from typing import Dict, List, Final, Optional
 from copy import copy
 
+try:
+    # 선택 의존성 : 미설치시 numpy block 연산으로 대체한다.
+    from scipy.signal import lfilter
+except ImportError:
+    lfilter = None
+
 import os, sys
 home_path = os.path.expanduser("~")
 sys.path.append(os.path.join(home_path, "github", "Thunder", "Binance"))
 # from Workspace.DataStorage.NodeStorage import SubStorage
 
+class Rolling:
+    """
+    📌 이동(rolling) 통계 공통 모듈
+    - 이동 평균 : 누적합(cumsum) 기반 O(n)
+    - 이동 분산 / 표준편차 : 누적합 평균 기준 편차를 sliding_window_view로 일괄 계산 (2-pass 방식으로 수치 안정)
+    - 반환값은 입력 길이를 유지하며, window 미충족 구간 및 NaN이 포함된 window는 NaN이다.
+    - 1차원(시간) 또는 2차원(symbols × 시간) 데이터를 지원하며, 마지막 축(시간) 기준으로 계산한다.
+    """
+
+    @staticmethod
+    def windows(values: np.ndarray, window: int) -> np.ndarray:
+        """
+        👻 window별 view를 생성한다. (복사 없음)
+
+        Args:
+            values (np.ndarray): 1차원 또는 2차원 데이터
+            window (int): window 크기
+
+        Returns:
+            np.ndarray: (..., 길이 - window + 1, window) view
+        """
+        return np.lib.stride_tricks.sliding_window_view(values, window, axis=-1)
+
+    @staticmethod
+    def __pad(values: np.ndarray, length: int, fill: float = np.nan) -> np.ndarray:
+        padding = np.full(values.shape[:-1] + (length - values.shape[-1],), fill)
+        return np.concatenate((padding, values), axis=-1)
+
+    @staticmethod
+    def __cumsum(values: np.ndarray) -> np.ndarray:
+        # 0을 앞에 추가한 누적합 (구간합 = cumsum[window:] - cumsum[:-window])
+        return Rolling.__pad(np.cumsum(values, axis=-1), values.shape[-1] + 1, 0)
+
+    @staticmethod
+    def mean(values: np.ndarray, window: int) -> np.ndarray:
+        """
+        이동 평균
+
+        Args:
+            values (np.ndarray): 1차원 또는 2차원 데이터
+            window (int): window 크기
+
+        Returns:
+            np.ndarray: 이동 평균 (길이 유지)
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if values.shape[-1] < window:
+            return np.full(values.shape, np.nan)
+
+        is_nan = np.isnan(values)
+        # 누적 오차를 줄이기 위해 기준값(첫 유효값)을 차감 후 누적한다.
+        first_valid = np.take_along_axis(
+            values, np.argmax(~is_nan, axis=-1)[..., np.newaxis], axis=-1
+        )
+        offset = np.where(np.isnan(first_valid), 0.0, first_valid)
+        cumsum = Rolling.__cumsum(np.where(is_nan, 0.0, values - offset))
+        nan_count = Rolling.__cumsum(is_nan.astype(np.int64))
+
+        result = (cumsum[..., window:] - cumsum[..., :-window]) / window + offset
+        result[(nan_count[..., window:] - nan_count[..., :-window]) > 0] = np.nan
+        return Rolling.__pad(result, values.shape[-1])
+
+    @staticmethod
+    def var(values: np.ndarray, window: int, ddof: int = 0) -> np.ndarray:
+        """
+        이동 분산
+
+        Args:
+            values (np.ndarray): 1차원 또는 2차원 데이터
+            window (int): window 크기
+            ddof (int, optional): 자유도 (np.var와 동일)
+
+        Returns:
+            np.ndarray: 이동 분산 (길이 유지)
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if values.shape[-1] < window:
+            return np.full(values.shape, np.nan)
+
+        mean = Rolling.mean(values, window)[..., window - 1 :]
+        deviation = Rolling.windows(values, window) - mean[..., np.newaxis]
+        result = np.sum(deviation**2, axis=-1) / (window - ddof)
+        return Rolling.__pad(result, values.shape[-1])
+
+    @staticmethod
+    def std(values: np.ndarray, window: int, ddof: int = 0) -> np.ndarray:
+        """
+        이동 표준편차
+
+        Args:
+            values (np.ndarray): 1차원 또는 2차원 데이터
+            window (int): window 크기
+            ddof (int, optional): 자유도 (np.std와 동일)
+
+        Returns:
+            np.ndarray: 이동 표준편차 (길이 유지)
+        """
+        return np.sqrt(Rolling.var(values, window, ddof))
+
+    @staticmethod
+    def nan_std(values: np.ndarray, window: int, min_count: int = 2) -> np.ndarray:
+        """
+        NaN을 제외한 이동 표준편차. 시작 구간은 window 미충족 데이터로 계산한다.
+
+        Args:
+            values (np.ndarray): 1차원 또는 2차원 데이터
+            window (int): window 크기
+            min_count (int, optional): 최소 유효 데이터 수 (미달시 0)
+
+        Returns:
+            np.ndarray: 이동 표준편차 (길이 유지)
+        """
+        values = np.asarray(values, dtype=np.float64)
+        padded = Rolling.__pad(values, values.shape[-1] + window - 1)
+        view = Rolling.windows(padded, window)
+        is_valid = ~np.isnan(view)
+        count = is_valid.sum(axis=-1)
+        safe_count = np.maximum(count, 1)
+        mean = np.where(is_valid, view, 0.0).sum(axis=-1) / safe_count
+        deviation = np.where(is_valid, view - mean[..., np.newaxis], 0.0)
+        result = np.sqrt(np.sum(deviation**2, axis=-1) / safe_count)
+        return np.where(count >= min_count, result, 0.0)
+
+    @staticmethod
+    def __sliding_extreme(values: np.ndarray, window: int, func: np.ufunc, fill: float) -> np.ndarray:
+        # van Herk/Gil-Werman : window 크기 block별 누적(prefix/suffix) 극값을 조합하여 O(n)으로 계산한다.
+        length = values.shape[-1]
+        values = Rolling.__pad(values, length + window - 1, fill)
+        padded_length = values.shape[-1] + (-values.shape[-1] % window)
+        values = np.concatenate(
+            (values, np.full(values.shape[:-1] + (padded_length - values.shape[-1],), fill)),
+            axis=-1,
+        )
+        blocks = values.reshape(values.shape[:-1] + (-1, window))
+        prefix = func.accumulate(blocks, axis=-1).reshape(values.shape)
+        suffix = func.accumulate(blocks[..., ::-1], axis=-1)[..., ::-1].reshape(values.shape)
+        return func(suffix[..., :length], prefix[..., window - 1 : window - 1 + length])
+
+    @staticmethod
+    def max(values: np.ndarray, window: int) -> np.ndarray:
+        """
+        NaN을 제외한 이동 최대값. 시작 구간은 window 미충족 데이터로 계산한다.
+
+        Args:
+            values (np.ndarray): 1차원 또는 2차원 데이터
+            window (int): window 크기
+
+        Returns:
+            np.ndarray: 이동 최대값 (길이 유지, window 전체가 NaN이면 NaN)
+        """
+        values = np.asarray(values, dtype=np.float64)
+        result = Rolling.__sliding_extreme(
+            np.where(np.isnan(values), -np.inf, values), window, np.maximum, -np.inf
+        )
+        return np.where(result == -np.inf, np.nan, result)
+
+    @staticmethod
+    def min(values: np.ndarray, window: int) -> np.ndarray:
+        """
+        NaN을 제외한 이동 최소값. 시작 구간은 window 미충족 데이터로 계산한다.
+
+        Args:
+            values (np.ndarray): 1차원 또는 2차원 데이터
+            window (int): window 크기
+
+        Returns:
+            np.ndarray: 이동 최소값 (길이 유지, window 전체가 NaN이면 NaN)
+        """
+        values = np.asarray(values, dtype=np.float64)
+        result = Rolling.__sliding_extreme(
+            np.where(np.isnan(values), np.inf, values), window, np.minimum, np.inf
+        )
+        return np.where(result == np.inf, np.nan, result)
+
+
+class Recursive:
+    """
+    📌 재귀(IIR) 필터 공통 모듈
+    - y[i] = alpha * x[i] + (1 - alpha) * y[i - 1] 형태의 EMA / Wilder 평균을 python loop 없이 계산한다.
+    - scipy 설치시 scipy.signal.lfilter를 사용하며, 미설치시 block 단위 행렬 연산으로 계산한다.
+    - loop 방식과 동일하게 NaN 입력 이후 구간은 NaN이다.
+    - 1차원 또는 2차원(symbols × 시간) 데이터를 지원하며, 2차원은 행별 초기값을 사용한다.
+    """
+
+    BLOCK_SIZE: int = 256
+
+    @staticmethod
+    def __filter_numpy(values: np.ndarray, alpha: float, initial: np.ndarray) -> np.ndarray:
+        decay = 1 - alpha
+        length = values.shape[-1]
+        block_size = min(Recursive.BLOCK_SIZE, length)
+        powers = decay ** np.arange(block_size + 1)
+        lag = np.arange(block_size)[:, np.newaxis] - np.arange(block_size)
+        # weights[i, j] = alpha * decay^(i - j) (j <= i)
+        weights = np.where(lag >= 0, alpha * powers[np.clip(lag, 0, None)], 0.0)
+
+        result = np.empty(values.shape, dtype=np.float64)
+        previous = initial
+        for start in range(0, length, block_size):
+            block = values[..., start : start + block_size]
+            size = block.shape[-1]
+            result[..., start : start + size] = (
+                block @ weights[:size, :size].T + powers[1 : size + 1] * previous
+            )
+            previous = result[..., start + size - 1 : start + size]
+        return result
+
+    @staticmethod
+    def filter(values: np.ndarray, alpha: float, initial) -> np.ndarray:
+        """
+        👻 초기값(initial) 이후 values 전체에 재귀 필터를 적용한다.
+
+        Args:
+            values (np.ndarray): 입력 데이터 (1차원 또는 2차원)
+            alpha (float): 가중치 (EMA: 2 / (period + 1), Wilder: 1 / period)
+            initial (float | np.ndarray): 첫 입력 직전의 필터값 (2차원은 행별 값)
+
+        Returns:
+            np.ndarray: 필터 결과 (입력 형태와 동일)
+        """
+        values = np.asarray(values, dtype=np.float64)
+        initial = np.broadcast_to(
+            np.asarray(initial, dtype=np.float64), values.shape[:-1]
+        )[..., np.newaxis]
+        if values.shape[-1] == 0:
+            return np.full(values.shape, np.nan)
+
+        # NaN 입력 이후 구간은 loop 방식과 동일하게 NaN으로 유지한다.
+        is_invalid = np.logical_or.accumulate(np.isnan(values), axis=-1) | np.isnan(initial)
+        filled = np.where(is_invalid, 0.0, values)
+        safe_initial = np.where(np.isnan(initial), 0.0, initial)
+        if lfilter is not None:
+            decay = 1 - alpha
+            result, _ = lfilter(
+                [alpha], [1.0, -decay], filled, axis=-1, zi=decay * safe_initial
+            )
+        else:
+            result = Recursive.__filter_numpy(filled, alpha, safe_initial)
+        return np.where(is_invalid, np.nan, result)
+
+    @staticmethod
+    def seeded(values: np.ndarray, alpha: float, seed_index: int, seed_value) -> np.ndarray:
+        """
+        seed_index에 seed_value(예: SMA)를 지정하고, 이후 구간에 재귀 필터를 적용한다.
+
+        Args:
+            values (np.ndarray): 입력 데이터 (1차원 또는 2차원)
+            alpha (float): 가중치
+            seed_index (int): 초기값 위치
+            seed_value (float | np.ndarray): 초기값 (2차원은 행별 값)
+
+        Returns:
+            np.ndarray: 필터 결과 (형태 유지, seed_index 이전은 NaN)
+        """
+        values = np.asarray(values, dtype=np.float64)
+        result = np.full(values.shape, np.nan)
+        if seed_index >= values.shape[-1]:
+            return result
+        result[..., seed_index] = seed_value
+        result[..., seed_index + 1 :] = Recursive.filter(
+            values[..., seed_index + 1 :], alpha, seed_value
+        )
+        return result
+
+
+class Batch:
+    """
+    📌 다중 symbol(symbols × 시간) 2차원 일괄 연산
+    - 각 지표 함수는 2차원 데이터를 마지막 축(시간) 기준으로 한번에 계산한다.
+    - NaN 규칙 : 각 행은 최신 값이 마지막 열에 오도록 우측 정렬하며, 이력이 짧은 symbol은 앞쪽을 NaN으로 채운다.
+      결과는 입력과 같은 형태이며, symbol별 이력이 지표 계산에 부족한 구간은 NaN이다.
+    - 모든 symbol의 이력 길이가 같으면 지표 함수를 직접 호출하고,
+      길이가 다르면 Batch.run으로 호출하여 symbol별 시작 시점을 맞춘다.
+    """
+
+    @staticmethod
+    def stack(series: List[np.ndarray], length: Optional[int] = None) -> np.ndarray:
+        """
+        📥 symbol별 1차원 데이터를 우측 정렬 2차원 배열로 변환한다.
+
+        Args:
+            series (List[np.ndarray]): symbol별 데이터 (오래된 순)
+            length (Optional[int], optional): 시간축 길이 (미입력시 최대 길이, 초과분은 앞쪽을 자른다)
+
+        Returns:
+            np.ndarray: (symbols × length) 배열
+        """
+        if length is None:
+            length = max((len(values) for values in series), default=0)
+        result = np.full((len(series), length), np.nan)
+        for row, values in enumerate(series):
+            values = np.asarray(values, dtype=np.float64)[-length:] if length else []
+            result[row, length - len(values) :] = values
+        return result
+
+    @staticmethod
+    def __shift(values: np.ndarray, shift: np.ndarray) -> np.ndarray:
+        # 행별로 shift만큼 앞(+) 또는 뒤(-)로 이동하고, 범위를 벗어난 구간은 NaN으로 채운다.
+        length = values.shape[-1]
+        index = np.arange(length) + shift[:, np.newaxis]
+        is_valid = (index >= 0) & (index < length)
+        shifted = np.take_along_axis(values, np.clip(index, 0, length - 1), axis=-1)
+        return np.where(is_valid, shifted, np.nan)
+
+    @staticmethod
+    def run(func, values: np.ndarray, *args, **kwargs):
+        """
+        🚀 앞쪽 NaN 길이가 다른 2차원 데이터에 지표 함수를 일괄 적용한다.
+        행별 유효 데이터를 좌측 정렬하여 1회 계산한 뒤, 결과를 원래 위치로 되돌린다.
+
+        Args:
+            func (Callable): 길이를 유지하는 지표 함수 (예: MA.ema, MACD.calculate)
+            values (np.ndarray): 우측 정렬 (symbols × 시간) 배열
+
+        Returns:
+            func 결과와 동일한 구조 (np.ndarray / tuple / dict)
+        """
+        values = np.asarray(values, dtype=np.float64)
+        is_valid = ~np.isnan(values)
+        lead = np.where(is_valid.any(axis=-1), np.argmax(is_valid, axis=-1), values.shape[-1])
+        result = func(Batch.__shift(values, lead), *args, **kwargs)
+
+        def restore(output: np.ndarray) -> np.ndarray:
+            output = np.asarray(output, dtype=np.float64)
+            if output.shape != values.shape:
+                raise ValueError(f"  ⚠️ 길이를 유지하는 지표만 지원합니다: {output.shape}")
+            return Batch.__shift(output, -lead)
+
+        if isinstance(result, tuple):
+            return tuple(restore(output) for output in result)
+        if isinstance(result, dict):
+            return {name: restore(output) for name, output in result.items()}
+        return restore(result)
+
+
 class MA:
     """
     이동평균값을 계산하는 클래스
@@ -28,10 +370,7 @@ class MA:
         Returns:
             np.ndarray: SMA 값 (길이 유지)
         """
-        sma_values = np.convolve(values, np.ones(period) / period, mode="valid")
-
-        # 원래 길이를 유지하도록 NaN 추가
-        return np.concatenate((np.full(period - 1, np.nan), sma_values))
+        return Rolling.mean(values, period)
 
     @staticmethod
     def ema(values: np.ndarray, period: int) -> np.ndarray:
@@ -45,17 +384,16 @@ class MA:
         Returns:
             np.ndarray: EMA 값 (길이 유지)
         """
-        ema = np.full_like(values, np.nan, dtype=float)  # 초기 NaN 값 설정
+        values = np.asarray(values, dtype=np.float64)
+        if values.shape[-1] < period:
+            return np.full(values.shape, np.nan)
+
         multiplier = 2 / (period + 1)
 
         # 첫 번째 EMA 값을 SMA로 설정
-        ema[period - 1] = np.mean(values[:period])
-
-        # EMA 계산
-        for i in range(period, len(values)):
-            ema[i] = (values[i] - ema[i - 1]) * multiplier + ema[i - 1]
-
-        return ema
+        return Recursive.seeded(
+            values, multiplier, period - 1, np.mean(values[..., :period], axis=-1)
+        )
 
     @staticmethod
     def wma(values: np.ndarray, period: int) -> np.ndarray:
@@ -69,16 +407,18 @@ class MA:
         Returns:
             np.ndarray: WMA 값 (길이 유지)
         """
+        values = np.asarray(values, dtype=np.float64)
+        if values.shape[-1] < period:
+            return np.full(values.shape, np.nan)
+
         weights = np.arange(1, period + 1)
 
-        # 가중 이동평균 계산
-        wma_values = np.array([
-            np.dot(values[i - period + 1:i + 1], weights) / weights.sum()
-            if i >= period - 1 else np.nan
-            for i in range(len(values))
-        ])
+        # 가중 이동평균 계산 (window별 내적)
+        wma_values = Rolling.windows(values, period) @ weights / weights.sum()
 
-        return wma_values
+        return np.concatenate(
+            (np.full(values.shape[:-1] + (period - 1,), np.nan), wma_values), axis=-1
+        )
 
 
 class MACD:
@@ -89,17 +429,42 @@ class MACD:
     @staticmethod
     def __ema(values: np.ndarray, window: int) -> np.ndarray:
         """(비공개) EMA 계산 함수 - MACD 내부에서만 사용"""
-        if len(values) < window:
+        values = np.asarray(values, dtype=np.float64)
+        if values.shape[-1] < window:
             return np.full_like(values, np.nan, dtype=np.float64)  # 데이터 부족 시 NaN 반환
 
         alpha = 2 / (window + 1)
-        ema_values = np.full_like(values, np.nan, dtype=np.float64)  # NaN으로 초기화
-        ema_values[window - 1] = np.nanmean(values[:window])  # 첫 EMA는 SMA로 초기화
+        # 첫 EMA는 SMA로 초기화 (유효값이 없는 symbol은 NaN)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            seed_value = np.nanmean(values[..., :window], axis=-1)
+        return Recursive.seeded(values, alpha, window - 1, seed_value)
+
+    @staticmethod
+    def calculate(values: np.ndarray, short_window: int = 12, long_window: int = 26, signal_window: int = 9) -> tuple:
+        """MACD Line, Signal Line, Histogram 일괄 계산 (중간값 1회 계산)"""
+        macd_line = MACD.__ema(values, short_window) - MACD.__ema(values, long_window)
 
-        for i in range(window, len(values)):
-            ema_values[i] = alpha * values[i] + (1 - alpha) * ema_values[i - 1]
+        # 2차원(symbols × 시간) : MACD Line 유효 시작 위치부터 Signal Line을 계산한다.
+        if macd_line.ndim > 1:
+            first_valid = max(short_window, long_window) - 1
+            signal = np.full_like(macd_line, np.nan)
+            signal[..., first_valid:] = MACD.__ema(macd_line[..., first_valid:], signal_window)
+            return macd_line, signal, macd_line - signal
 
-        return ema_values
+        # 데이터 길이 확인 후 NaN 방지
+        if np.isnan(macd_line).all():
+            signal = np.full_like(macd_line, np.nan)
+            return macd_line, signal, macd_line - signal
+
+        valid_macd = macd_line[~np.isnan(macd_line)]  # NaN이 아닌 값만 필터링
+        valid_signal = MACD.__ema(valid_macd, signal_window)
+
+        # 결과값 길이 맞추기
+        signal = np.full_like(macd_line, np.nan)
+        signal[-len(valid_signal):] = valid_signal  # 뒤쪽에 채우기
+
+        return macd_line, signal, macd_line - signal
 
     @staticmethod
     def line(values: np.ndarray, short_window: int = 12, long_window: int = 26) -> np.ndarray:
@@ -111,27 +476,12 @@ class MACD:
     @staticmethod
     def signal_line(values: np.ndarray, short_window: int = 12, long_window: int = 26, signal_window: int = 9) -> np.ndarray:
         """Signal Line 계산"""
-        macd_line = MACD.line(values, short_window, long_window)
-        
-        # 데이터 길이 확인 후 NaN 방지
-        if np.isnan(macd_line).all():
-            return np.full_like(macd_line, np.nan)
-
-        valid_macd = macd_line[~np.isnan(macd_line)]  # NaN이 아닌 값만 필터링
-        signal = MACD.__ema(valid_macd, signal_window)
-
-        # 결과값 길이 맞추기
-        result = np.full_like(macd_line, np.nan)
-        result[-len(signal):] = signal  # 뒤쪽에 채우기
-
-        return result
+        return MACD.calculate(values, short_window, long_window, signal_window)[1]
 
     @staticmethod
     def histogram(values: np.ndarray, short_window: int = 12, long_window: int = 26, signal_window: int = 9) -> np.ndarray:
         """MACD Histogram 계산"""
-        macd_line = MACD.line(values, short_window, long_window)
-        signal_line = MACD.signal_line(values, short_window, long_window, signal_window)
-        return macd_line - signal_line
+        return MACD.calculate(values, short_window, long_window, signal_window)[2]
 
 class RSI:
     """ 
@@ -158,26 +508,21 @@ class RSI:
             4. 상대 강도(Relative Strength, RS) 계산: RS = AVG_Gain / AVG_Loss
             5. RSI 계산: RSI = 100 - (100 / (1 + RS))
         """
-        if len(values) < window:
+        values = np.asarray(values, dtype=np.float64)
+        if values.shape[-1] < window:
             return np.full_like(values, np.nan, dtype=np.float64)
 
         # 가격 변화량 계산
-        delta = np.diff(values, prepend=values[0])
+        delta = np.diff(values, prepend=values[..., :1], axis=-1)
 
         # 상승(gain)과 하락(loss) 분리
         gain = np.where(delta > 0, delta, 0)
         loss = np.where(delta < 0, -delta, 0)
 
-        # 초기 평균 상승 및 하락 값 계산 (첫 window 구간은 단순 평균 사용)
-        avg_gain = np.full_like(values, np.nan, dtype=np.float64)
-        avg_loss = np.full_like(values, np.nan, dtype=np.float64)
-        avg_gain[window - 1] = np.mean(gain[:window])
-        avg_loss[window - 1] = np.mean(loss[:window])
-
-        # Wilder 방식의 지수 이동평균(EMA) 적용
-        for i in range(window, len(values)):
-            avg_gain[i] = (avg_gain[i - 1] * (window - 1) + gain[i]) / window
-            avg_loss[i] = (avg_loss[i - 1] * (window - 1) + loss[i]) / window
+        # 초기 평균 상승 및 하락 값 계산 (첫 window 구간은 단순 평균 사용) 후
+        # Wilder 방식의 지수 이동평균(EMA, alpha = 1 / window) 적용
+        avg_gain = Recursive.seeded(gain, 1 / window, window - 1, np.mean(gain[..., :window], axis=-1))
+        avg_loss = Recursive.seeded(loss, 1 / window, window - 1, np.mean(loss[..., :window], axis=-1))
 
         # 상대 강도(Relative Strength) 및 RSI 계산
         rs = np.where(avg_loss == 0, 0, avg_gain / avg_loss)
@@ -202,20 +547,9 @@ class RSI:
         rsi = RSI.wilder(values, window)
         rsi = np.nan_to_num(rsi, nan=50.0)  # NaN 값을 기본값 50으로 대체 (중립적인 값)
 
-        # 최솟값 및 최댓값 계산 (NaN 방지 코드 포함)
-        min_rsi = np.full_like(rsi, np.nan)
-        max_rsi = np.full_like(rsi, np.nan)
-
-        for i in range(len(rsi)):
-            valid_rsi = rsi[max(0, i - window + 1):i + 1]
-            valid_rsi = valid_rsi[~np.isnan(valid_rsi)]  # NaN 제거
-
-            if len(valid_rsi) > 0:
-                min_rsi[i] = np.nanmin(valid_rsi)
-                max_rsi[i] = np.nanmax(valid_rsi)
-            else:
-                min_rsi[i] = rsi[i]  # NaN 방지: 현재 RSI 값 사용
-                max_rsi[i] = rsi[i]
+        # 최솟값 및 최댓값 계산 (NaN 제외, 시작 구간은 window 미충족 데이터 사용)
+        min_rsi = Rolling.min(rsi, window)
+        max_rsi = Rolling.max(rsi, window)
 
         # ⚠️ 나눗셈 오류 방지 (max_rsi - min_rsi == 0인 경우 1로 처리)
         range_rsi = np.where((max_rsi - min_rsi) == 0, 1, max_rsi - min_rsi)
@@ -233,7 +567,8 @@ class RSI:
             - 약세 다이버전스: 가격 상승 & RSI 하락 (매도 신호)
         """
         rsi = RSI.wilder(values, window)
-        return np.where(np.diff(values, prepend=values[0]) > 0, -1, 1)
+        values = np.asarray(values, dtype=np.float64)
+        return np.where(np.diff(values, prepend=values[..., :1], axis=-1) > 0, -1, 1)
 
     @staticmethod
     def cutlers(values: np.ndarray, window: int = 14) -> np.ndarray:
@@ -245,12 +580,14 @@ class RSI:
             Cutler's RSI = 100 - (100 / (1 + RS))
             RS = SMA(Avg Gain) / SMA(Avg Loss)
         """
-        delta = np.diff(values, prepend=values[0])
+        values = np.asarray(values, dtype=np.float64)
+        delta = np.diff(values, prepend=values[..., :1], axis=-1)
         gain = np.where(delta > 0, delta, 0)
         loss = np.where(delta < 0, -delta, 0)
 
-        avg_gain = np.convolve(gain, np.ones(window)/window, mode='valid')
-        avg_loss = np.convolve(loss, np.ones(window)/window, mode='valid')
+        # window 충족 구간만 반환한다. (길이 = 데이터 길이 - window + 1)
+        avg_gain = Rolling.mean(gain, window)[..., window - 1:]
+        avg_loss = Rolling.mean(loss, window)[..., window - 1:]
 
         rs = np.where(avg_loss == 0, 0, avg_gain / avg_loss)
         return 100 - (100 / (1 + rs))
@@ -266,15 +603,10 @@ class RSI:
             α = 2 / (smoothing + 1)
         """
         rsi = RSI.wilder(values, window)
-        ema_rsi = np.full_like(rsi, np.nan)
-        
+        if rsi.shape[-1] < window:
+            return rsi
         alpha = 2 / (smoothing + 1)
-        ema_rsi[window - 1] = rsi[window - 1]
-
-        for i in range(window, len(rsi)):
-            ema_rsi[i] = alpha * rsi[i] + (1 - alpha) * ema_rsi[i - 1]
-
-        return ema_rsi
+        return Recursive.seeded(rsi, alpha, window - 1, rsi[..., window - 1])
 
     @staticmethod
     def bands(values: np.ndarray, window: int = 14, std_factor: float = 1.5) -> tuple:
@@ -288,17 +620,8 @@ class RSI:
         """
         rsi = RSI.wilder(values, window)
 
-        # ⚠️ NaN 데이터 및 데이터 부족 문제 방지
-        rsi_std = np.full_like(rsi, np.nan)
-
-        for i in range(len(rsi)):
-            valid_data = rsi[max(0, i - window + 1):i + 1]
-            valid_data = valid_data[~np.isnan(valid_data)]  # NaN 값 제거
-            
-            if len(valid_data) > 1:  # 표준편차를 계산할 충분한 데이터가 있는 경우
-                rsi_std[i] = np.nanstd(valid_data, ddof=0)  # 자유도 0 설정
-            else:
-                rsi_std[i] = 0  # 데이터가 부족하면 표준편차를 0으로 설정
+        # ⚠️ NaN 데이터 제외, 유효 데이터가 1개 이하인 구간은 표준편차 0
+        rsi_std = Rolling.nan_std(rsi, window, min_count=2)
 
         # 상한 및 하한 밴드 계산
         upper_band = rsi + (rsi_std * std_factor)
@@ -325,26 +648,19 @@ class BollingerBands:
         📌 기본 볼린저 밴드 (Standard Bollinger Bands)
         - 중심선(SMA), 상한선(Upper Band), 하한선(Lower Band) 계산
         """
-        values = np.asarray(values)
+        values = np.asarray(values, dtype=np.float64)
         
-        if len(values) < window:
-            return np.full(len(values), np.nan), np.full(len(values), np.nan), np.full(len(values), np.nan)
+        if values.shape[-1] < window:
+            return np.full(values.shape, np.nan), np.full(values.shape, np.nan), np.full(values.shape, np.nan)
 
-        # 이동 평균 (SMA) 계산
-        sma = np.array([np.mean(values[i - window + 1:i + 1]) for i in range(window - 1, len(values))])
-
-        # 표준편차 계산 (rolling 방식)
-        std_dev = np.array([np.std(values[i - window + 1:i + 1]) for i in range(window - 1, len(values))])
+        # 이동 평균 (SMA) 및 표준편차 계산 (rolling 방식, 길이 유지)
+        sma = Rolling.mean(values, window)
+        std_dev = Rolling.std(values, window)
 
         # 볼린저 밴드 계산
         upper_band = sma + (std_factor * std_dev)
         lower_band = sma - (std_factor * std_dev)
 
-        # 길이를 맞추기 위해 NaN 추가
-        sma = np.concatenate((np.full(window - 1, np.nan), sma))
-        upper_band = np.concatenate((np.full(window - 1, np.nan), upper_band))
-        lower_band = np.concatenate((np.full(window - 1, np.nan), lower_band))
-
         return sma, upper_band, lower_band
 
 
@@ -412,30 +728,24 @@ class BollingerBands:
         - 상한선 = 중심선 + (ATR × atr_factor)
         - 하한선 = 중심선 - (ATR × atr_factor)
         """
-        values = np.asarray(values)
+        values = np.asarray(values, dtype=np.float64)
 
-        if len(values) < window:
-            return np.full(len(values), np.nan), np.full(len(values), np.nan), np.full(len(values), np.nan)
+        if values.shape[-1] < window:
+            return np.full(values.shape, np.nan), np.full(values.shape, np.nan), np.full(values.shape, np.nan)
 
-        # ✅ EMA 계산 (지수 이동 평균)
-        ema = np.zeros(len(values))
+        # ✅ EMA 계산 (지수 이동 평균, 초기값 SMA / 이전 구간 0)
         alpha = 2 / (window + 1)  # EMA 가중치
-        ema[window - 1] = np.mean(values[:window])  # 초기값 (SMA)
-        
-        for i in range(window, len(values)):
-            ema[i] = (values[i] - ema[i - 1]) * alpha + ema[i - 1]  # EMA 공식
+        ema = Recursive.seeded(values, alpha, window - 1, np.mean(values[..., :window], axis=-1))
+        ema[..., : window - 1] = 0
 
         # ✅ ATR 계산 (Average True Range)
-        tr = np.zeros(len(values))  # True Range (TR)
-        
-        for i in range(1, len(values)):
-            tr[i] = max(values[i] - values[i - 1], abs(values[i] - values[i - 1]), abs(values[i - 1] - values[i]))
-        
-        atr = np.zeros(len(values))
-        atr[window - 1] = np.mean(tr[:window])  # 초기값 (SMA로 초기화)
+        # True Range (TR) : 단일 가격 데이터이므로 전일 대비 변화량의 절대값과 같다.
+        tr = np.zeros(values.shape)
+        tr[..., 1:] = np.abs(np.diff(values, axis=-1))
 
-        for i in range(window, len(values)):
-            atr[i] = (tr[i] - atr[i - 1]) * alpha + atr[i - 1]  # EMA 방식 ATR 계산
+        # EMA 방식 ATR 계산 (초기값 SMA)
+        atr = Recursive.seeded(tr, alpha, window - 1, np.mean(tr[..., :window], axis=-1))
+        atr[..., : window - 1] = 0
 
         # ✅ Keltner Channel 계산
         upper_band = ema + (atr_factor * atr)
@@ -454,23 +764,38 @@ class BollingerBands:
             상한선 = 최근 N일 동안의 최고가
             하한선 = 최근 N일 동안의 최저가
         """
-        if len(values) < window:
-            return np.full(len(values), np.nan), np.full(len(values), np.nan)
+        values = np.asarray(values, dtype=np.float64)
+        if values.shape[-1] < window:
+            return np.full(values.shape, np.nan), np.full(values.shape, np.nan)
 
-        upper_band = np.array([np.nanmax(values[max(0, i - window + 1):i + 1]) for i in range(len(values))])
-        lower_band = np.array([np.nanmin(values[max(0, i - window + 1):i + 1]) for i in range(len(values))])
+        upper_band = Rolling.max(values, window)
+        lower_band = Rolling.min(values, window)
 
         return upper_band, lower_band
 
 class IchimokuCloud:
     @staticmethod
-    def calculate(high: np.ndarray, low:np.ndarray, close:np.ndarray):
-        """ Ichimoku Cloud (일목균형표) 계산 """
-        conversion_line = (np.max(high[-9:]) + np.min(low[-9:])) / 2  # 전환선 (Tenkan-sen)
-        base_line = (np.max(high[-26:]) + np.min(low[-26:])) / 2  # 기준선 (Kijun-sen)
+    def series(
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        conversion_window: int = 9,
+        base_window: int = 26,
+        span_window: int = 52,
+        lagging_window: int = 26,
+    ) -> Dict[str, np.ndarray]:
+        """
+        📌 Ichimoku Cloud (일목균형표) 전체 구간 계산
+        - index별로 calculate와 동일한 값을 계산한다. (선행스팬은 미래 방향 이동 없이 현재 index에 기록)
+        - 시작 구간은 window 미충족 데이터로 계산하며, 후행스팬은 lagging_window 이전 종가다.
+        """
+        conversion_line = (Rolling.max(high, conversion_window) + Rolling.min(low, conversion_window)) / 2  # 전환선 (Tenkan-sen)
+        base_line = (Rolling.max(high, base_window) + Rolling.min(low, base_window)) / 2  # 기준선 (Kijun-sen)
         leading_span1 = (conversion_line + base_line) / 2  # 선행스팬1 (Senkou Span A)
-        leading_span2 = (np.max(high[-52:]) + np.min(low[-52:])) / 2  # 선행스팬2 (Senkou Span B)
-        lagging_span = close[-26]  # 후행스팬 (Chikou Span)
+        leading_span2 = (Rolling.max(high, span_window) + Rolling.min(low, span_window)) / 2  # 선행스팬2 (Senkou Span B)
+        close = np.asarray(close, dtype=np.float64)
+        lagging_span = np.full(close.shape, np.nan)  # 후행스팬 (Chikou Span)
+        lagging_span[..., lagging_window - 1 :] = close[..., : close.shape[-1] - lagging_window + 1]
 
         return {
             "Conversion Line": conversion_line,
@@ -478,4 +803,12 @@ class IchimokuCloud:
             "Leading Span 1": leading_span1,
             "Leading Span 2": leading_span2,
             "Lagging Span": lagging_span
-        }
\ No newline at end of file
+        }
+
+    @staticmethod
+    def calculate(high: np.ndarray, low:np.ndarray, close:np.ndarray):
+        """ Ichimoku Cloud (일목균형표) 계산 - 최신 index 값 """
+        # 최신값 계산에 필요한 구간(최대 window)만 사용한다.
+        tail = -52
+        result = IchimokuCloud.series(high[..., tail:], low[..., tail:], close[..., tail:])
+        return {name: values[..., -1][()] for name, values in result.items()}
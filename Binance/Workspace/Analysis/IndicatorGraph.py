@@ -0,0 +1,326 @@
+### 초기설정
+
+import numpy as np
+from typing import Callable, Dict, Iterable, List, Tuple
+
+import os, sys
+home_path = os.path.expanduser("~")
+sys.path.append(os.path.join(home_path, "github", "Thunder", "Binance"))
+
+from Workspace.Analysis.Indicator import Rolling, Recursive, MA, RSI
+
+# (지표 종류, 입력 데이터명, 설정값...) 예) ("ema", "close", 12)
+NodeKey = Tuple
+# node 정의 : (의존 node 목록, 의존 node 결과를 입력받는 연산 함수)
+NodeSpec = Tuple[List[NodeKey], Callable[..., np.ndarray]]
+
+
+class IndicatorGraph:
+    """
+    📌 지표 의존성 그래프
+    - 요청한 지표(outputs)를 하위 연산(node)으로 분해하고, 동일한 node(EMA(12), true range, 이동 최대/최소 등)는 1회만 계산한다.
+    - 실행 순서는 생성시 1회 결정하며, evaluate 호출마다 각 node를 1회씩 계산한다.
+    - 입력 데이터(sources)는 1차원 또는 2차원(symbols × 시간) 배열이며, Indicator.py와 동일한 규칙으로 계산한다.
+
+    사용 예:
+        graph = IndicatorGraph([("macd_hist", "close", 12, 26, 9), ("bb_upper", "close", 20, 2), ("rsi", "close", 14)])
+        result = graph.evaluate({"close": close, "high": high, "low": low})
+    """
+
+    NODES: Dict[str, Callable[..., NodeSpec]] = {}
+
+    @classmethod
+    def register(cls, kind: str):
+        """
+        🧩 node 종류를 등록한다. 등록 함수는 설정값을 입력받아 (의존 node 목록, 연산 함수)를 반환한다.
+
+        Args:
+            kind (str): node 종류
+        """
+
+        def decorator(builder: Callable[..., NodeSpec]):
+            cls.NODES[kind] = builder
+            return builder
+
+        return decorator
+
+    def __init__(self, outputs: Iterable[NodeKey]):
+        self.outputs: List[NodeKey] = [tuple(key) for key in outputs]
+        self.plan: List[Tuple[NodeKey, List[NodeKey], Callable]] = []
+        visited = set()
+        for key in self.outputs:
+            self.__resolve(key, visited, ())
+
+    def __resolve(self, key: NodeKey, visited: set, path: Tuple):
+        if key in visited:
+            return
+        if key in path:
+            raise ValueError(f"  ⚠️ 순환 의존성: {key}")
+        kind, *params = key
+        if kind == "source":
+            visited.add(key)
+            self.plan.append((key, [], None))
+            return
+        if kind not in self.NODES:
+            raise ValueError(f"  ⚠️ 등록되지 않은 지표: {kind}")
+        dependencies, func = self.NODES[kind](*params)
+        for dependency in dependencies:
+            self.__resolve(tuple(dependency), visited, path + (key,))
+        visited.add(key)
+        self.plan.append((key, [tuple(dependency) for dependency in dependencies], func))
+
+    @property
+    def node_count(self) -> int:
+        """중복 제거 후 계산되는 node 수"""
+        return len(self.plan)
+
+    def evaluate(self, sources: Dict[str, np.ndarray]) -> Dict[NodeKey, np.ndarray]:
+        """
+        🚀 실행 순서에 따라 node를 1회씩 계산하고 요청 지표를 반환한다.
+
+        Args:
+            sources (Dict[str, np.ndarray]): {입력 데이터명: 배열} 예) {"close": ..., "high": ..., "low": ...}
+
+        Returns:
+            Dict[NodeKey, np.ndarray]: {요청 지표: 결과}
+        """
+        results: Dict[NodeKey, np.ndarray] = {}
+        for key, dependencies, func in self.plan:
+            if func is None:
+                results[key] = np.asarray(sources[key[1]], dtype=np.float64)
+                continue
+            results[key] = func(*(results[dependency] for dependency in dependencies))
+        return {key: results[key] for key in self.outputs}
+
+
+def source(name: str) -> NodeKey:
+    return ("source", name)
+
+
+##=---=####=---=####=---=####=---=####=---=####=---=##
+# =-=###=----=###=---=# 기본 지표 node #=---=###=----=###=-#
+##=---=####=---=####=---=####=---=####=---=####=---=##
+
+
+@IndicatorGraph.register("sma")
+def _sma(name: str, period: int) -> NodeSpec:
+    return [source(name)], lambda values: Rolling.mean(values, period)
+
+
+@IndicatorGraph.register("std")
+def _std(name: str, period: int) -> NodeSpec:
+    return [source(name)], lambda values: Rolling.std(values, period)
+
+
+@IndicatorGraph.register("ema")
+def _ema(name: str, period: int) -> NodeSpec:
+    # MA.ema와 동일 (period번째 값에서 SMA로 초기화)
+    return [source(name)], lambda values: MA.ema(values, period)
+
+
+@IndicatorGraph.register("rolling_max")
+def _rolling_max(name: str, window: int) -> NodeSpec:
+    return [source(name)], lambda values: Rolling.max(values, window)
+
+
+@IndicatorGraph.register("rolling_min")
+def _rolling_min(name: str, window: int) -> NodeSpec:
+    return [source(name)], lambda values: Rolling.min(values, window)
+
+
+@IndicatorGraph.register("true_range")
+def _true_range(name: str) -> NodeSpec:
+    # BollingerBands.keltner_channel과 동일 (단일 가격 데이터의 변화량 절대값)
+    def func(values: np.ndarray) -> np.ndarray:
+        tr = np.zeros(values.shape)
+        tr[..., 1:] = np.abs(np.diff(values, axis=-1))
+        return tr
+
+    return [source(name)], func
+
+
+##=---=####=---=####=---=####=---=####=---=####=---=##
+# =-=###=----=###=---=# MACD #=---=###=----=###=-#
+##=---=####=---=####=---=####=---=####=---=####=---=##
+
+
+@IndicatorGraph.register("macd_line")
+def _macd_line(name: str, short_window: int = 12, long_window: int = 26) -> NodeSpec:
+    return [("ema", name, short_window), ("ema", name, long_window)], np.subtract
+
+
+@IndicatorGraph.register("macd_signal")
+def _macd_signal(
+    name: str, short_window: int = 12, long_window: int = 26, signal_window: int = 9
+) -> NodeSpec:
+    # MACD.calculate와 동일 : MACD Line 유효 시작 위치부터 Signal Line을 계산한다.
+    first_valid = max(short_window, long_window) - 1
+
+    def func(macd_line: np.ndarray) -> np.ndarray:
+        signal = np.full(macd_line.shape, np.nan)
+        signal[..., first_valid:] = MA.ema(macd_line[..., first_valid:], signal_window)
+        return signal
+
+    return [("macd_line", name, short_window, long_window)], func
+
+
+@IndicatorGraph.register("macd_hist")
+def _macd_hist(
+    name: str, short_window: int = 12, long_window: int = 26, signal_window: int = 9
+) -> NodeSpec:
+    return [
+        ("macd_line", name, short_window, long_window),
+        ("macd_signal", name, short_window, long_window, signal_window),
+    ], np.subtract
+
+
+##=---=####=---=####=---=####=---=####=---=####=---=##
+# =-=###=----=###=---=# RSI #=---=###=----=###=-#
+##=---=####=---=####=---=####=---=####=---=####=---=##
+
+
+@IndicatorGraph.register("rsi")
+def _rsi(name: str, window: int = 14) -> NodeSpec:
+    return [source(name)], lambda values: RSI.wilder(values, window)
+
+
+@IndicatorGraph.register("stoch_rsi")
+def _stoch_rsi(name: str, window: int = 14) -> NodeSpec:
+    # RSI.stochastic과 동일
+    def func(rsi: np.ndarray) -> np.ndarray:
+        rsi = np.nan_to_num(rsi, nan=50.0)
+        min_rsi = Rolling.min(rsi, window)
+        max_rsi = Rolling.max(rsi, window)
+        range_rsi = np.where((max_rsi - min_rsi) == 0, 1, max_rsi - min_rsi)
+        return (rsi - min_rsi) / range_rsi
+
+    return [("rsi", name, window)], func
+
+
+##=---=####=---=####=---=####=---=####=---=####=---=##
+# =-=###=----=###=---=# Bollinger / Keltner / Donchian #=---=###=----=###=-#
+##=---=####=---=####=---=####=---=####=---=####=---=##
+
+
+@IndicatorGraph.register("bb_upper")
+def _bb_upper(name: str, window: int = 20, std_factor: float = 2) -> NodeSpec:
+    return [("sma", name, window), ("std", name, window)], lambda sma, std: sma + std_factor * std
+
+
+@IndicatorGraph.register("bb_lower")
+def _bb_lower(name: str, window: int = 20, std_factor: float = 2) -> NodeSpec:
+    return [("sma", name, window), ("std", name, window)], lambda sma, std: sma - std_factor * std
+
+
+@IndicatorGraph.register("bb_percent_b")
+def _bb_percent_b(name: str, window: int = 20, std_factor: float = 2) -> NodeSpec:
+    return [
+        source(name),
+        ("bb_upper", name, window, std_factor),
+        ("bb_lower", name, window, std_factor),
+    ], lambda values, upper, lower: (values - lower) / (upper - lower)
+
+
+@IndicatorGraph.register("bb_bandwidth")
+def _bb_bandwidth(name: str, window: int = 20, std_factor: float = 2) -> NodeSpec:
+    return [
+        ("sma", name, window),
+        ("bb_upper", name, window, std_factor),
+        ("bb_lower", name, window, std_factor),
+    ], lambda sma, upper, lower: (upper - lower) / sma
+
+
+@IndicatorGraph.register("bb_squeeze")
+def _bb_squeeze(name: str, window: int = 20, threshold: float = 0.05) -> NodeSpec:
+    return [("bb_bandwidth", name, window, 2)], lambda bbw: (bbw < threshold).astype(float)
+
+
+@IndicatorGraph.register("atr")
+def _atr(name: str, window: int = 20) -> NodeSpec:
+    # BollingerBands.keltner_channel과 동일 (EMA 가중치, 초기값 SMA, 이전 구간 0)
+    def func(tr: np.ndarray) -> np.ndarray:
+        if tr.shape[-1] < window:
+            return np.full(tr.shape, np.nan)
+        atr = Recursive.seeded(tr, 2 / (window + 1), window - 1, np.mean(tr[..., :window], axis=-1))
+        atr[..., : window - 1] = 0
+        return atr
+
+    return [("true_range", name)], func
+
+
+@IndicatorGraph.register("keltner_mid")
+def _keltner_mid(name: str, window: int = 20) -> NodeSpec:
+    # 이전 구간 0 (BollingerBands.keltner_channel과 동일)
+    def func(ema: np.ndarray) -> np.ndarray:
+        ema = ema.copy()
+        if ema.shape[-1] >= window:
+            ema[..., : window - 1] = 0
+        return ema
+
+    return [("ema", name, window)], func
+
+
+@IndicatorGraph.register("keltner_upper")
+def _keltner_upper(name: str, window: int = 20, atr_factor: float = 2) -> NodeSpec:
+    return [("keltner_mid", name, window), ("atr", name, window)], lambda mid, atr: mid + atr_factor * atr
+
+
+@IndicatorGraph.register("keltner_lower")
+def _keltner_lower(name: str, window: int = 20, atr_factor: float = 2) -> NodeSpec:
+    return [("keltner_mid", name, window), ("atr", name, window)], lambda mid, atr: mid - atr_factor * atr
+
+
+@IndicatorGraph.register("donchian_upper")
+def _donchian_upper(name: str, window: int = 20) -> NodeSpec:
+    return [("rolling_max", name, window)], lambda values: values
+
+
+@IndicatorGraph.register("donchian_lower")
+def _donchian_lower(name: str, window: int = 20) -> NodeSpec:
+    return [("rolling_min", name, window)], lambda values: values
+
+
+##=---=####=---=####=---=####=---=####=---=####=---=##
+# =-=###=----=###=---=# Ichimoku #=---=###=----=###=-#
+##=---=####=---=####=---=####=---=####=---=####=---=##
+
+
+@IndicatorGraph.register("midpoint")
+def _midpoint(high: str, low: str, window: int) -> NodeSpec:
+    # (이동 최고가 + 이동 최저가) / 2
+    return [("rolling_max", high, window), ("rolling_min", low, window)], lambda upper, lower: (upper + lower) / 2
+
+
+@IndicatorGraph.register("ichimoku_conversion")
+def _ichimoku_conversion(high: str = "high", low: str = "low", window: int = 9) -> NodeSpec:
+    return [("midpoint", high, low, window)], lambda values: values
+
+
+@IndicatorGraph.register("ichimoku_base")
+def _ichimoku_base(high: str = "high", low: str = "low", window: int = 26) -> NodeSpec:
+    return [("midpoint", high, low, window)], lambda values: values
+
+
+@IndicatorGraph.register("ichimoku_span1")
+def _ichimoku_span1(
+    high: str = "high", low: str = "low", conversion_window: int = 9, base_window: int = 26
+) -> NodeSpec:
+    return [
+        ("midpoint", high, low, conversion_window),
+        ("midpoint", high, low, base_window),
+    ], lambda conversion, base: (conversion + base) / 2
+
+
+@IndicatorGraph.register("ichimoku_span2")
+def _ichimoku_span2(high: str = "high", low: str = "low", window: int = 52) -> NodeSpec:
+    return [("midpoint", high, low, window)], lambda values: values
+
+
+@IndicatorGraph.register("ichimoku_lagging")
+def _ichimoku_lagging(name: str = "close", window: int = 26) -> NodeSpec:
+    def func(close: np.ndarray) -> np.ndarray:
+        lagging_span = np.full(close.shape, np.nan)
+        lagging_span[..., window - 1 :] = close[..., : close.shape[-1] - window + 1]
+        return lagging_span
+
+    return [source(name)], func
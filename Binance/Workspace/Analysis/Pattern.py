@@ -0,0 +1,281 @@
+### 초기설정
+
+import numpy as np
+from typing import Optional, Tuple
+
+import os, sys
+home_path = os.path.expanduser("~")
+sys.path.append(os.path.join(home_path, "github", "Thunder", "Binance"))
+
+from Workspace.Analysis.Indicator import Rolling
+
+
+class RunLength:
+    """
+    📌 구간(run) 인코딩 공통 모듈
+    - 동일한 값이 연속되는 구간을 (시작 index, 길이, 값)으로 변환한다.
+    - 상승/하락 부호열에 적용하면 연속 상승/하락 구간을 python loop 없이 얻을 수 있다.
+    """
+
+    @staticmethod
+    def sign(values: np.ndarray) -> np.ndarray:
+        """
+        👻 직전 값 대비 변화 부호를 계산한다. (첫 값은 0)
+
+        Args:
+            values (np.ndarray): 1차원 또는 2차원(symbols × 시간) 데이터
+
+        Returns:
+            np.ndarray: 1 상승, -1 하락, 0 보합 (길이 유지)
+        """
+        values = np.asarray(values, dtype=np.float64)
+        sign = np.zeros(values.shape, dtype=np.int8)
+        sign[..., 1:] = np.sign(np.diff(values, axis=-1))
+        return sign
+
+    @staticmethod
+    def encode(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        1차원 데이터를 구간별로 인코딩한다.
+
+        Args:
+            values (np.ndarray): 1차원 데이터
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: (구간 시작 index, 구간 길이, 구간 값)
+        """
+        values = np.asarray(values)
+        if len(values) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), values[:0]
+        is_start = np.empty(len(values), dtype=bool)
+        is_start[0] = True
+        is_start[1:] = values[1:] != values[:-1]
+        starts = np.flatnonzero(is_start)
+        lengths = np.diff(np.append(starts, len(values)))
+        return starts, lengths, values[starts]
+
+
+class Streak:
+    """
+    📌 연속 횟수(streak) 공통 모듈
+    - 조건(mask)이 연속으로 참인 횟수를 누적 최대값(maximum.accumulate)으로 계산한다.
+    - 1차원 또는 2차원(symbols × 시간) 데이터를 지원하며, 마지막 축(시간) 기준으로 계산한다.
+    """
+
+    @staticmethod
+    def __append_false(mask: np.ndarray) -> np.ndarray:
+        # 끝에 거짓을 추가하여 전체가 참(또는 빈 배열)인 경우 길이를 반환하도록 한다.
+        mask = np.asarray(mask, dtype=bool)
+        return np.concatenate([mask, np.zeros(mask.shape[:-1] + (1,), dtype=bool)], axis=-1)
+
+    @staticmethod
+    def running(mask: np.ndarray) -> np.ndarray:
+        """
+        각 위치에서 끝나는 연속 참 횟수를 계산한다.
+
+        Args:
+            mask (np.ndarray): 1차원 또는 2차원 bool 배열
+
+        Returns:
+            np.ndarray: 연속 횟수 (길이 유지, 거짓 위치는 0)
+        """
+        mask = np.asarray(mask, dtype=bool)
+        index = np.arange(mask.shape[-1])
+        last_false = np.maximum.accumulate(np.where(mask, -1, index), axis=-1)
+        return index - last_false
+
+    @staticmethod
+    def leading(mask: np.ndarray):
+        """
+        시작 위치부터 연속 참 횟수를 계산한다.
+
+        Args:
+            mask (np.ndarray): 1차원 또는 2차원 bool 배열
+
+        Returns:
+            int | np.ndarray: 연속 횟수 (2차원은 행별)
+        """
+        return np.argmin(Streak.__append_false(mask), axis=-1)[()]
+
+    @staticmethod
+    def trailing(mask: np.ndarray):
+        """
+        마지막 위치까지 연속 참 횟수를 계산한다.
+
+        Args:
+            mask (np.ndarray): 1차원 또는 2차원 bool 배열
+
+        Returns:
+            int | np.ndarray: 연속 횟수 (2차원은 행별)
+        """
+        return np.argmin(Streak.__append_false(np.asarray(mask)[..., ::-1]), axis=-1)[()]
+
+    @staticmethod
+    def rising(values: np.ndarray) -> np.ndarray:
+        """
+        📈 각 위치까지 연속 상승 횟수를 계산한다.
+
+        Args:
+            values (np.ndarray): 1차원 또는 2차원 데이터
+
+        Returns:
+            np.ndarray: 연속 상승 횟수 (길이 유지)
+        """
+        return Streak.running(RunLength.sign(values) > 0)
+
+    @staticmethod
+    def falling(values: np.ndarray) -> np.ndarray:
+        """
+        📉 각 위치까지 연속 하락 횟수를 계산한다.
+
+        Args:
+            values (np.ndarray): 1차원 또는 2차원 데이터
+
+        Returns:
+            np.ndarray: 연속 하락 횟수 (길이 유지)
+        """
+        return Streak.running(RunLength.sign(values) < 0)
+
+
+class Extrema:
+    """
+    📌 국소 극값(꼭지점) 공통 모듈
+    - 꼭지점은 직전 값보다 크고 다음 값보다 큰 위치다. (TradeSignalAnalyzer.Processing과 동일, 평탄 구간 제외)
+    - prominence : 좌/우로 더 높은 값을 만나기 전까지의 최저값(base) 중 높은 값과 꼭지점의 차이다. (scipy.signal.peak_prominences와 동일)
+      더 높은 값의 위치는 구간 최대/최소 sparse table을 이용한 binary lifting으로 찾는다. (O(n log n), python loop 없음)
+    - distance : 전후 distance 구간 꼭지점 중 최대값인 꼭지점만 남긴다. (동일 값은 모두 유지)
+    - 1차원 또는 2차원(symbols × 시간) 데이터를 지원하며, 결과는 입력과 동일한 크기의 bool 배열이다.
+    """
+
+    @staticmethod
+    def __sparse_table(values: np.ndarray, func) -> list:
+        # level k : [i - 2^k + 1, i] 구간 연산값 (시작 구간은 미충족 데이터)
+        table = [values]
+        while (1 << len(table)) <= values.shape[-1] * 2:
+            shift = 1 << (len(table) - 1)
+            level = table[-1].copy()
+            level[..., shift:] = func(table[-1][..., shift:], table[-1][..., :-shift])
+            table.append(level)
+        return table
+
+    @staticmethod
+    def __left_base(values: np.ndarray, window: int) -> np.ndarray:
+        # 왼쪽으로 더 높은 값을 만나기 전(최대 window)까지의 최저값
+        index = np.broadcast_to(np.arange(values.shape[-1]), values.shape)
+        max_table = Extrema.__sparse_table(values, np.maximum)
+        min_table = Extrema.__sparse_table(values, np.minimum)
+
+        position = index - 1
+        for level in range(len(max_table) - 1, -1, -1):
+            block_max = np.take_along_axis(max_table[level], np.maximum(position, 0), axis=-1)
+            is_jump = (position >= 0) & (block_max <= values)
+            position = np.where(is_jump, np.maximum(position - (1 << level), -1), position)
+
+        start = np.maximum(position + 1, index - window)
+        level = np.floor(np.log2(index - start + 1)).astype(np.int64)
+        result = np.empty(values.shape)
+        for k in np.unique(level):
+            is_level = level == k
+            lower = np.take_along_axis(min_table[k], np.minimum(start + (1 << k) - 1, index), axis=-1)
+            result = np.where(is_level, np.minimum(min_table[k], lower), result)
+        return result
+
+    @staticmethod
+    def prominence(values: np.ndarray, window: Optional[int] = None) -> np.ndarray:
+        """
+        위치별 돌출 높이를 계산한다. (꼭지점이 아닌 위치도 동일 정의로 계산)
+
+        Args:
+            values (np.ndarray): 1차원 또는 2차원 데이터 (NaN 미포함)
+            window (Optional[int], optional): 좌/우 최대 검토 구간 (기본값 전체)
+
+        Returns:
+            np.ndarray: 돌출 높이 (길이 유지)
+        """
+        values = np.asarray(values, dtype=np.float64)
+        window = values.shape[-1] if window is None else window
+        left_base = Extrema.__left_base(values, window)
+        right_base = Extrema.__left_base(values[..., ::-1], window)[..., ::-1]
+        return values - np.maximum(left_base, right_base)
+
+    @staticmethod
+    def __centered_max(values: np.ndarray, distance: int) -> np.ndarray:
+        # 전후 distance 구간 최대값 (NaN 제외)
+        padding = np.full(values.shape[:-1] + (distance,), np.nan)
+        forward = Rolling.max(np.concatenate([values, padding], axis=-1), 2 * distance + 1)
+        return forward[..., distance:]
+
+    @staticmethod
+    def peaks(
+        values: np.ndarray,
+        prominence: Optional[float] = None,
+        distance: Optional[int] = None,
+        window: Optional[int] = None,
+    ) -> np.ndarray:
+        """
+        🔺 상승 꼭지점을 찾는다.
+
+        Args:
+            values (np.ndarray): 1차원 또는 2차원 데이터
+            prominence (Optional[float], optional): 최소 돌출 높이
+            distance (Optional[int], optional): 꼭지점간 최소 간격
+            window (Optional[int], optional): prominence 계산시 좌/우 검토 구간 (기본값 전체)
+
+        Returns:
+            np.ndarray: 꼭지점 여부 (bool)
+        """
+        values = np.asarray(values, dtype=np.float64)
+        mask = np.zeros(values.shape, dtype=bool)
+        diff = np.diff(values, axis=-1)
+        mask[..., 1:-1] = (diff[..., :-1] > 0) & (diff[..., 1:] < 0)
+
+        if prominence is not None:
+            mask &= Extrema.prominence(values, window) >= prominence
+
+        if distance is not None and distance > 0:
+            mask &= Extrema.__centered_max(np.where(mask, values, np.nan), distance) == values
+
+        return mask
+
+    @staticmethod
+    def valleys(
+        values: np.ndarray,
+        prominence: Optional[float] = None,
+        distance: Optional[int] = None,
+        window: Optional[int] = None,
+    ) -> np.ndarray:
+        """
+        🔻 하락 꼭지점을 찾는다. (부호 반전 후 peaks와 동일)
+
+        Args:
+            values (np.ndarray): 1차원 또는 2차원 데이터
+            prominence (Optional[float], optional): 최소 돌출 깊이
+            distance (Optional[int], optional): 꼭지점간 최소 간격
+            window (Optional[int], optional): prominence 계산시 좌/우 검토 구간 (기본값 전체)
+
+        Returns:
+            np.ndarray: 꼭지점 여부 (bool)
+        """
+        return Extrema.peaks(-np.asarray(values, dtype=np.float64), prominence, distance, window)
+
+    @staticmethod
+    def top(values: np.ndarray, mask: np.ndarray, count: Optional[int] = None, descending: bool = True) -> np.ndarray:
+        """
+        1차원 데이터에서 꼭지점 index를 값 기준으로 정렬하여 반환한다.
+
+        Args:
+            values (np.ndarray): 1차원 데이터
+            mask (np.ndarray): peaks / valleys 결과
+            count (Optional[int], optional): 반환할 꼭지점 갯수 (기본값 전체)
+            descending (bool, optional): True 값 내림차순(peaks), False 값 오름차순(valleys)
+
+        Returns:
+            np.ndarray: 꼭지점 index
+        """
+        indices = np.flatnonzero(mask)
+        key = np.asarray(values, dtype=np.float64)[indices]
+        key = -key if descending else key
+        if count is not None and count < len(indices):
+            selected = np.argpartition(key, count)[:count]
+            return indices[selected[np.argsort(key[selected], kind="stable")]]
+        return indices[np.argsort(key, kind="stable")]
@@ -0,0 +1,316 @@
+### 초기설정
+
+import numpy as np
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import os, sys
+home_path = os.path.expanduser("~")
+sys.path.append(os.path.join(home_path, "github", "Thunder", "Binance"))
+
+
+class StreamingIndicator(ABC):
+    """
+    📌 실시간 지표 공통 인터페이스
+    - update(value) : 마감 캔들 값을 반영하고 확정 지표값을 반환한다. (O(1))
+    - peek(value) : 진행중 캔들 값으로 임시 지표값을 계산한다. 내부 상태는 변경하지 않는다. (O(1))
+    - 데이터 부족 구간은 NaN을 반환하며, 초기값(seed) 규칙은 Indicator.py와 동일하다.
+    """
+
+    @abstractmethod
+    def update(self, value: float):
+        """
+        📥 마감 캔들 값을 반영하고 확정 지표값을 반환한다.
+        """
+        pass
+
+    @abstractmethod
+    def peek(self, value: float):
+        """
+        🔍 진행중 캔들 값으로 임시 지표값을 반환한다. (내부 상태 변경 없음)
+        """
+        pass
+
+    def extend(self, values: Iterable[float]):
+        """
+        📥 과거 마감 캔들 값을 순서대로 반영한다.
+
+        Args:
+            values (Iterable[float]): 마감 캔들 값 (오래된 순)
+
+        Returns:
+            마지막 확정 지표값
+        """
+        result = np.nan
+        for value in values:
+            result = self.update(float(value))
+        return result
+
+
+class StreamingEMA(StreamingIndicator):
+    """
+    📌 지수 이동평균 (MA.ema와 동일 : period번째 값에서 SMA로 초기화)
+    """
+
+    def __init__(self, period: int, alpha: Optional[float] = None):
+        self.period = period
+        self.alpha = 2 / (period + 1) if alpha is None else alpha
+        self.count: int = 0
+        self.total: float = 0.0
+        self.value: float = np.nan
+
+    def __next(self, value: float) -> Tuple[float, float]:
+        if self.count + 1 < self.period:
+            return np.nan, self.total + value
+        if self.count + 1 == self.period:
+            return (self.total + value) / self.period, self.total + value
+        return self.alpha * value + (1 - self.alpha) * self.value, self.total
+
+    def update(self, value: float) -> float:
+        self.value, self.total = self.__next(value)
+        self.count += 1
+        return self.value
+
+    def peek(self, value: float) -> float:
+        return self.__next(value)[0]
+
+
+class StreamingSMA(StreamingIndicator):
+    """
+    📌 단순 이동평균 / 표준편차
+    - window 값을 보관하며 평균 및 편차제곱합(M2)을 추가/제거 방식으로 갱신한다. (Welford)
+    """
+
+    def __init__(self, period: int):
+        self.period = period
+        self.values: deque = deque(maxlen=period)
+        self.mean: float = 0.0
+        self.m2: float = 0.0
+
+    def __next(self, value: float) -> Tuple[float, float]:
+        count = len(self.values)
+        if count < self.period:
+            mean = self.mean + (value - self.mean) / (count + 1)
+            return mean, self.m2 + (value - self.mean) * (value - mean)
+        removed = self.values[0]
+        mean = self.mean + (value - removed) / self.period
+        m2 = self.m2 + (value - removed) * (value - mean + removed - self.mean)
+        return mean, max(m2, 0.0)
+
+    def __result(self, count: int, mean: float, m2: float) -> Tuple[float, float]:
+        if count < self.period:
+            return np.nan, np.nan
+        return mean, np.sqrt(m2 / self.period)
+
+    def update(self, value: float) -> float:
+        self.mean, self.m2 = self.__next(value)
+        self.values.append(value)
+        return self.__result(len(self.values), self.mean, self.m2)[0]
+
+    def peek(self, value: float) -> float:
+        return self.__result(min(len(self.values) + 1, self.period), *self.__next(value))[0]
+
+    def std(self) -> float:
+        """확정 구간 표준편차 (ddof=0)"""
+        return self.__result(len(self.values), self.mean, self.m2)[1]
+
+    def peek_std(self, value: float) -> float:
+        """임시 표준편차 (ddof=0)"""
+        return self.__result(min(len(self.values) + 1, self.period), *self.__next(value))[1]
+
+
+class StreamingBollinger(StreamingIndicator):
+    """
+    📌 볼린저 밴드 (BollingerBands.standard와 동일 : SMA ± std_factor × 표준편차(ddof=0))
+    """
+
+    def __init__(self, window: int = 20, std_factor: float = 2):
+        self.std_factor = std_factor
+        self.sma = StreamingSMA(window)
+
+    def __bands(self, mean: float, std: float) -> Tuple[float, float, float]:
+        return mean, mean + self.std_factor * std, mean - self.std_factor * std
+
+    def update(self, value: float) -> Tuple[float, float, float]:
+        mean = self.sma.update(value)
+        return self.__bands(mean, self.sma.std())
+
+    def peek(self, value: float) -> Tuple[float, float, float]:
+        return self.__bands(self.sma.peek(value), self.sma.peek_std(value))
+
+
+class StreamingMACD(StreamingIndicator):
+    """
+    📌 MACD (MACD.calculate와 동일 : Signal Line은 유효한 MACD Line 값부터 계산)
+    """
+
+    def __init__(self, short_window: int = 12, long_window: int = 26, signal_window: int = 9):
+        self.short_ema = StreamingEMA(short_window)
+        self.long_ema = StreamingEMA(long_window)
+        self.signal_ema = StreamingEMA(signal_window)
+
+    @staticmethod
+    def __result(macd_line: float, signal: float) -> Tuple[float, float, float]:
+        return macd_line, signal, macd_line - signal
+
+    def update(self, value: float) -> Tuple[float, float, float]:
+        macd_line = self.short_ema.update(value) - self.long_ema.update(value)
+        signal = self.signal_ema.update(macd_line) if not np.isnan(macd_line) else np.nan
+        return self.__result(macd_line, signal)
+
+    def peek(self, value: float) -> Tuple[float, float, float]:
+        macd_line = self.short_ema.peek(value) - self.long_ema.peek(value)
+        signal = self.signal_ema.peek(macd_line) if not np.isnan(macd_line) else np.nan
+        return self.__result(macd_line, signal)
+
+
+class StreamingRSI(StreamingIndicator):
+    """
+    📌 RSI (RSI.wilder와 동일 : 첫 변화량은 0, window번째 값에서 평균 상승/하락 초기화)
+    """
+
+    def __init__(self, window: int = 14):
+        self.window = window
+        self.avg_gain = StreamingEMA(window, alpha=1 / window)
+        self.avg_loss = StreamingEMA(window, alpha=1 / window)
+        self.last_value: Optional[float] = None
+
+    def __delta(self, value: float) -> Tuple[float, float]:
+        delta = 0.0 if self.last_value is None else value - self.last_value
+        return max(delta, 0.0), max(-delta, 0.0)
+
+    @staticmethod
+    def __rsi(avg_gain: float, avg_loss: float) -> float:
+        if np.isnan(avg_gain) or np.isnan(avg_loss):
+            return np.nan
+        rs = 0.0 if avg_loss == 0 else avg_gain / avg_loss
+        return 100 - (100 / (1 + rs))
+
+    def update(self, value: float) -> float:
+        gain, loss = self.__delta(value)
+        self.last_value = value
+        return self.__rsi(self.avg_gain.update(gain), self.avg_loss.update(loss))
+
+    def peek(self, value: float) -> float:
+        gain, loss = self.__delta(value)
+        return self.__rsi(self.avg_gain.peek(gain), self.avg_loss.peek(loss))
+
+
+class StreamingStochastic(StreamingIndicator):
+    """
+    📌 스토캐스틱 ((값 - 최소) / (최대 - 최소), RSI.stochastic의 정규화 규칙과 동일)
+    - 최근 window 값의 최소/최대는 monotonic deque로 관리한다. (분할상환 O(1))
+    - 시작 구간은 window 미충족 데이터로 계산하며, NaN 입력은 nan_value로 대체한다.
+    """
+
+    def __init__(self, window: int = 14, nan_value: float = 50.0):
+        self.window = window
+        self.nan_value = nan_value
+        self.index: int = 0
+        # (index, value) : max는 값 내림차순, min은 값 오름차순
+        self.max_deque: deque = deque()
+        self.min_deque: deque = deque()
+
+    def __extreme(self, target: deque, value: float, is_max: bool) -> float:
+        expired = self.index - self.window
+        for idx, candidate in target:
+            if idx > expired:
+                return max(candidate, value) if is_max else min(candidate, value)
+        return value
+
+    @staticmethod
+    def __result(value: float, low: float, high: float) -> float:
+        value_range = high - low
+        return (value - low) / (value_range if value_range != 0 else 1)
+
+    def __clean(self, value: float) -> float:
+        return self.nan_value if np.isnan(value) else value
+
+    def update(self, value: float) -> float:
+        value = self.__clean(value)
+        for target, is_max in ((self.max_deque, True), (self.min_deque, False)):
+            while target and (target[-1][1] <= value if is_max else target[-1][1] >= value):
+                target.pop()
+            target.append((self.index, value))
+            while target[0][0] <= self.index - self.window:
+                target.popleft()
+        self.index += 1
+        return self.__result(value, self.min_deque[0][1], self.max_deque[0][1])
+
+    def peek(self, value: float) -> float:
+        value = self.__clean(value)
+        high = self.__extreme(self.max_deque, value, True)
+        low = self.__extreme(self.min_deque, value, False)
+        return self.__result(value, low, high)
+
+
+class IndicatorStream:
+    """
+    📌 (symbol, interval)별 실시간 지표 관리
+    - kline data(마지막 행은 진행중 캔들)를 전달하면 신규 마감 캔들만 update로 반영하고,
+      진행중 캔들은 peek으로 임시값을 계산한다. 호출당 연산량은 전체 데이터 길이와 무관하다.
+    """
+
+    def __init__(
+        self,
+        factories: Dict[str, Callable[[], StreamingIndicator]],
+        col_index: int = 4,
+    ):
+        """
+        Args:
+            factories (Dict[str, Callable[[], StreamingIndicator]]): {지표명: 지표 생성 함수}
+                예) {"ema_20": lambda: StreamingEMA(20), "macd": StreamingMACD}
+            col_index (int, optional): kline data 계산 대상 열 (기본값 종가)
+        """
+        self.factories = factories
+        self.col_index = col_index
+        self.indicators: Dict[Tuple[str, str], Dict[str, StreamingIndicator]] = {}
+        self.last_open_timestamp: Dict[Tuple[str, str], int] = {}
+        self.committed: Dict[Tuple[str, str], Dict] = {}
+
+    def update(self, symbol: str, interval: str, kline_data: List[List]) -> Dict:
+        """
+        🔄 kline data를 반영하고 진행중 캔들 기준 지표값을 반환한다.
+
+        Args:
+            symbol (str): symbol 값
+            interval (str): interval 값
+            kline_data (List[List]): open timestamp 오름차순 kline data (마지막 행은 진행중 캔들)
+
+        Returns:
+            Dict: {지표명: 임시 지표값}
+        """
+        key = (symbol, interval)
+        if key not in self.indicators:
+            self.indicators[key] = {name: factory() for name, factory in self.factories.items()}
+            self.last_open_timestamp[key] = -1
+            self.committed[key] = {name: np.nan for name in self.factories}
+        indicators = self.indicators[key]
+
+        # 미반영 마감 캔들 구간을 뒤에서부터 찾는다.
+        last_open_timestamp = self.last_open_timestamp[key]
+        start = len(kline_data) - 1
+        while start > 0 and int(kline_data[start - 1][0]) > last_open_timestamp:
+            start -= 1
+        for row in kline_data[start:-1]:
+            value = float(row[self.col_index])
+            for name, indicator in indicators.items():
+                self.committed[key][name] = indicator.update(value)
+            self.last_open_timestamp[key] = int(row[0])
+
+        forming_value = float(kline_data[-1][self.col_index])
+        return {name: indicator.peek(forming_value) for name, indicator in indicators.items()}
+
+    def get_committed(self, symbol: str, interval: str) -> Dict:
+        """
+        마지막 마감 캔들 기준 확정 지표값을 반환한다.
+
+        Args:
+            symbol (str): symbol 값
+            interval (str): interval 값
+
+        Returns:
+            Dict: {지표명: 확정 지표값}
+        """
+        return self.committed.get((symbol, interval), {})
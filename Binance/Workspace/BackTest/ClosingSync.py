@@ -0,0 +1,184 @@
+import numpy as np
+from typing import Tuple
+
+import os, sys
+home_path = os.path.expanduser("~")
+sys.path.append(os.path.join(home_path, "github", "Thunder", "Binance"))
+import Workspace.Utils.BaseUtils as base_utils
+
+
+class ClosingSyncEngine:
+    """
+    1분봉 데이터를 기준으로 상위 interval의 closing sync data를 벡터 연산으로 생성한다.
+
+    1분봉 각 행마다 해당 시점까지 진행된(미완성) 상위 interval 캔들을 재구성한다.
+    행별 np.where 탐색 대신 open timestamp로 bucket id를 구한 뒤 bucket별 누적 max/min/sum을
+    한번에 계산하므로 O(n)으로 동작한다.
+    """
+
+    @staticmethod
+    def bucket_ids(base_data: np.ndarray, selec_data: np.ndarray) -> np.ndarray:
+        """
+        👻 base data 각 행이 속하는 selec data의 index(bucket id)를 계산한다.
+
+        Args:
+            base_data (np.ndarray): 기본 데이터 (1분봉 kline data)
+            selec_data (np.ndarray): 대상 데이터 (3분봉 이상 kline data)
+
+        Raises:
+            ValueError: 대상 데이터에 포함되지 않는 base data 행이 존재할 때
+
+        Returns:
+            np.ndarray: base data 길이의 bucket id
+        """
+        bucket = np.searchsorted(selec_data[:, 0], base_data[:, 0], side="right") - 1
+        safe_bucket = np.clip(bucket, 0, None)
+        is_valid = (bucket >= 0) & (selec_data[safe_bucket, 6] >= base_data[:, 6])
+        if not is_valid.all():
+            missing_index = int(np.flatnonzero(~is_valid)[0])
+            raise ValueError(
+                f"  ⚠️ 대상 데이터 구간 없음: index {missing_index} - {base_data[missing_index, 0]}"
+            )
+        return bucket
+
+    @staticmethod
+    def group_positions(bucket: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        👻 연속된 bucket id를 그룹으로 묶고 그룹 번호, 그룹 내 위치, 그룹 시작 index를 반환한다.
+
+        Args:
+            bucket (np.ndarray): bucket_ids 결과값
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: (group_no, position, start_indices)
+        """
+        is_start = np.empty(len(bucket), dtype=bool)
+        is_start[:1] = True
+        is_start[1:] = bucket[1:] != bucket[:-1]
+        start_indices = np.flatnonzero(is_start)
+        group_no = np.cumsum(is_start) - 1
+        position = np.arange(len(bucket)) - start_indices[group_no]
+        return group_no, position, start_indices
+
+    @staticmethod
+    def grouped_accumulate(
+        values: np.ndarray,
+        group_no: np.ndarray,
+        position: np.ndarray,
+        ufunc: np.ufunc,
+        fill_value: float,
+    ) -> np.ndarray:
+        """
+        👻 그룹 단위 누적 연산(max/min/sum)을 수행한다. 그룹을 (그룹수 x 최대길이) 2차원 배열로
+        펼친 후 ufunc.accumulate를 적용하므로 그룹 경계에서 누적값이 초기화된다.
+
+        Args:
+            values (np.ndarray): 누적 대상 값 (1차원 또는 (n, k) 2차원)
+            group_no (np.ndarray): 그룹 번호
+            position (np.ndarray): 그룹 내 위치
+            ufunc (np.ufunc): np.maximum / np.minimum / np.add
+            fill_value (float): 빈칸 채움값 (ufunc의 항등원)
+
+        Returns:
+            np.ndarray: values와 동일한 shape의 그룹 누적값
+        """
+        width = int(position.max()) + 1 if len(position) else 0
+        grid = np.full(
+            (int(group_no[-1]) + 1 if len(group_no) else 0, width) + values.shape[1:],
+            fill_value,
+            dtype=np.float64,
+        )
+        grid[group_no, position] = values
+        ufunc.accumulate(grid, axis=1, out=grid)
+        return grid[group_no, position]
+
+    @staticmethod
+    def generate(
+        base_data: np.ndarray, selec_data: np.ndarray, interval: str
+    ) -> np.ndarray:
+        """
+        base data를 기준하여 closing sync data를 생성한다.
+        base data 각 행 시점까지 진행된 selec data 캔들을 재구성하며, 캔들이 완성된 행은 selec data 원본을 사용한다.
+
+        Args:
+            base_data (np.ndarray): 기본 데이터 (1분봉 kline data)
+            selec_data (np.ndarray): 대상 데이터 (3분봉 이상 kline data)
+            interval (str): selec data의 interval 값
+
+        Returns:
+            np.ndarray: base data와 길이가 같은 12열 closing sync data
+        """
+        return ClosingSyncEngine.generate_multi(
+            np.asarray(base_data)[np.newaxis], np.asarray(selec_data)[np.newaxis], interval
+        )[0]
+
+    @staticmethod
+    def generate_multi(
+        base_data: np.ndarray, selec_data: np.ndarray, interval: str
+    ) -> np.ndarray:
+        """
+        여러 symbol의 closing sync data를 한번에 생성한다. 모든 symbol은 동일한 timestamp 축을 공유해야 하며
+        bucket 계산은 1회만 수행하고 누적 연산은 symbol 축을 포함하여 일괄 처리한다.
+        데이터가 없는 행(NaN, 상장 전 또는 누락)은 누적에서 제외하며, open은 그룹 내 첫 유효 행의 값을 사용한다.
+
+        Args:
+            base_data (np.ndarray): (symbol, 데이터길이, 12) 기본 데이터 (1분봉)
+            selec_data (np.ndarray): (symbol, 대상길이, 12) 대상 데이터 (3분봉 이상)
+            interval (str): selec data의 interval 값
+
+        Returns:
+            np.ndarray: (symbol, 데이터길이, 12) closing sync data
+        """
+        # (데이터길이, symbol, 12)로 배치하여 시간축을 첫번째 축으로 둔다.
+        base_data = np.asarray(base_data, dtype=np.float64).transpose(1, 0, 2)
+        selec_data = np.asarray(selec_data, dtype=np.float64).transpose(1, 0, 2)
+        timestamp_range = base_utils.get_interval_ms_seconds(interval) - 1
+
+        # timestamp 축은 공유하므로 첫번째 symbol 기준으로 bucket을 계산한다.
+        base_time = base_data[:, 0]
+        selec_time = selec_data[:, 0]
+        bucket = ClosingSyncEngine.bucket_ids(base_time, selec_time)
+        group_no, position, start_indices = ClosingSyncEngine.group_positions(bucket)
+        group_start = start_indices[group_no]
+
+        # 상장 전/누락 행(NaN)은 누적에서 제외한다. (fmax/fmin, 합계는 0 처리)
+        is_valid = ~np.isnan(base_data[..., 4])
+        row_index = np.where(is_valid, np.arange(len(base_data))[:, np.newaxis], np.inf)
+        first_valid = ClosingSyncEngine.grouped_accumulate(
+            row_index, group_no, position, np.fmin, np.inf
+        )
+        has_valid = np.isfinite(first_valid)
+        first_valid = np.where(has_valid, first_valid, 0).astype(np.int64)
+        last_valid = ClosingSyncEngine.grouped_accumulate(
+            np.where(is_valid, np.arange(len(base_data))[:, np.newaxis], -np.inf),
+            group_no, position, np.fmax, -np.inf,
+        )
+        last_valid = np.where(has_valid, last_valid, 0).astype(np.int64)
+        symbol_index = np.arange(base_data.shape[1])
+
+        result = np.zeros(base_data.shape[:2] + (12,), dtype=np.float64)
+        result[..., 0] = selec_data[bucket, :, 0]
+        result[..., 1] = base_data[first_valid, symbol_index, 1]
+        result[..., 2] = ClosingSyncEngine.grouped_accumulate(
+            base_data[..., 2], group_no, position, np.fmax, -np.inf
+        )
+        result[..., 3] = ClosingSyncEngine.grouped_accumulate(
+            base_data[..., 3], group_no, position, np.fmin, np.inf
+        )
+        # 누락 행은 직전 유효 행의 종가를 유지한다.
+        result[..., 4] = base_data[last_valid, symbol_index, 4]
+        result[..., [5, 7, 8, 9, 10]] = ClosingSyncEngine.grouped_accumulate(
+            np.nan_to_num(base_data[..., [5, 7, 8, 9, 10]], nan=0.0), group_no, position, np.add, 0.0
+        )
+        result[..., 6] = selec_data[bucket, :, 6]
+        # 그룹 내 유효 행이 아직 없으면 timestamp를 제외하고 NaN으로 둔다.
+        result[~has_valid, 1:6] = np.nan
+        result[~has_valid, 7:] = np.nan
+
+        # 캔들이 완성된 시점은 selec data 원본값을 그대로 사용한다. (원본이 없는 symbol 제외)
+        is_closed = (base_time[:, 6] - base_time[group_start, 0]) == timestamp_range
+        selec_rows = selec_data[bucket]
+        use_selec = is_closed[:, np.newaxis] & ~np.isnan(selec_rows[..., 4])
+        result[use_selec] = selec_rows[use_selec]
+        return result.transpose(1, 0, 2)
+
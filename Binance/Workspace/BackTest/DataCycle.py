@@ -1,4 +1,5 @@
 import numpy as np
+from typing import Optional
 import os, sys
 home_path = os.path.expanduser("~")
 sys.path.append(os.path.join(home_path, "github", "Thunder", "Binance"))
@@ -13,9 +14,20 @@ class DataCycler:
         self.storage_closing_sync_data = storage_closing_sync_data
         self.storage_indices = storage_indices
         
-    def get_data(self, interval:str, iter_no:int):
-        indices = self.storage_indices.get_data(interval, iter_no)
-        return self.storage_closing_sync_data.get_data(interval, indices)
+    def get_data(self, interval:str, iter_no:int, symbol:Optional[str] = None):
+        """
+        iter_no번째 lookback window 데이터를 반환한다. window는 조회시점에 계산되며 가능한 경우 view를 반환한다.
+
+        Args:
+            interval (str): interval 값
+            iter_no (int): 순환 번호
+            symbol (Optional[str], optional): 조회할 symbol (미입력시 전체 symbol)
+
+        Returns:
+            np.ndarray: closing sync data window
+        """
+        window = self.storage_indices.get_data(interval, iter_no)
+        return self.storage_closing_sync_data.get_data(interval, window, symbol)
     
 if __name__ == "__main__":
     from Workspace.BackTest.DataFactory import FactoryManager
@@ -1,20 +1,28 @@
 from typing import List, Dict, Optional, Any
 import numpy as np
 import asyncio
+import aiohttp
 import os, sys
-import pickle
 
 home_path = os.path.expanduser("~")
 sys.path.append(os.path.join(home_path, "github", "Thunder", "Binance"))
 from Workspace.Services.PublicData.Fetcher.FuturesMarketFetcher import (
     FuturesMarketFetcher,
 )
+from Workspace.Services.PublicData.Fetcher.RequestWeightLimiter import (
+    RequestWeightLimiter,
+)
 import Workspace.Utils.BaseUtils as base_utils
 import SystemConfig
 from Workspace.BackTest.Storage.StorageCollector import (
     ClosingSyncStorage,
     IndicesStorage,
+    LookbackIndices,
 )
+from Workspace.BackTest.Storage.ColumnarStorage import ColumnarStorage
+from Workspace.BackTest.Storage.KlineCatalog import KlineCatalog
+from Workspace.BackTest.ClosingSync import ClosingSyncEngine
+from Workspace.BackTest.Resampler import KlineResampler
 
 ins_market_fetcher = FuturesMarketFetcher()
 
@@ -37,8 +45,22 @@ class FactoryManager:
         self.end_date = end_date + " 08:59:59"
 
         self.path_test_storage = os.path.join(home_path, "github", "TestData")
-        self.path_closing = os.path.join(self.path_test_storage, "closing.pkl")
-        self.path_indices = os.path.join(self.path_test_storage, "indices.pkl")
+        self.path_closing = os.path.join(self.path_test_storage, "closing")
+        self.lookback_days: int = 7
+
+        self.ins_columnar_storage = ColumnarStorage(self.path_closing)
+
+        # 수신한 kline data를 저장하고 보유 구간을 기록한다.
+        self.market: str = "FUTURES"
+        self.path_kline_catalog = os.path.join(self.path_test_storage, "klines")
+        self.ins_kline_catalog = KlineCatalog(self.path_kline_catalog)
+
+        # 페이지당 수신 개수 (futures 최대 1,500 / 1,000 초과시 weight 10, 이하 5)
+        self.page_limit: int = 1000
+        self.max_retries: int = 5
+        # 동시 요청 수 및 분당 request weight를 제한한다.
+        self.limiter = RequestWeightLimiter(max_weight_per_minute=2400, max_concurrency=10)
+        ins_market_fetcher.set_limiter(self.limiter)
 
         self.storage_closing = ClosingSyncStorage()
         self.storage_indices = IndicesStorage()
@@ -48,15 +70,18 @@ class FactoryManager:
         interval: str,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
+        symbol: Optional[str] = None,
     ) -> List[List[int]]:
         """
-        👻 kline date를 수신하기 위하여 start timestam, end timestamp를 구간별로 생성한다. 최대 수신량이 1,000개 이므로
+        👻 kline date를 수신하기 위하여 start timestam, end timestamp를 구간별로 생성한다. 페이지당 수신량이 self.page_limit개 이므로
         본 함수를 통해서 전체 기간을 분리하여 수신할 수 있도록 timestamp를 분리 한다.
+        symbol 입력시 kline catalog에 보유중인 구간은 제외하고 미보유 구간만 생성한다.
 
         Args:
             interval (str): interval 값
             start_date (Optional[str], optional): 시작 날짜
             end_date (Optional[str], optional): 종료 날짜
+            symbol (Optional[str], optional): symbol 값 (입력시 미보유 구간만 생성)
 
         Raises:
             ValueError: interval 값 오입력시
@@ -64,25 +89,50 @@ class FactoryManager:
         Returns:
             List[List[int]]: timestamp 값
         """
-        start_date = self.start_date if start_date is None else start_date + " 09:00:00"
-        end_date = self.end_date if end_date is None else end_date + " 08:59:59"
+        start_ts, end_ts = self._get_timestamp_period(start_date, end_date)
 
         interval_step = base_utils.get_interval_ms_seconds(interval)
         if interval_step is None:
             raise ValueError(f"interval step값 없음 - {interval_step}")
 
-        MAX_LIMIT = 900
-        start_ts = base_utils.convert_to_timestamp_ms(date=start_date)
-        end_ts = base_utils.convert_to_timestamp_ms(date=end_date)
+        MAX_LIMIT = self.page_limit
+        missing_ranges = (
+            [[start_ts, end_ts]]
+            if symbol is None
+            else self.ins_kline_catalog.missing_ranges(
+                self.market, symbol, interval, start_ts, end_ts
+            )
+        )
 
         timestamp_ranges = []
-        while start_ts < end_ts:
-            next_end_ts = min(start_ts + interval_step * MAX_LIMIT - 1, end_ts)
-            timestamp_ranges.append([start_ts, next_end_ts])
-            start_ts = next_end_ts + 1
+        for start_ts, end_ts in missing_ranges:
+            while start_ts < end_ts:
+                next_end_ts = min(start_ts + interval_step * MAX_LIMIT - 1, end_ts)
+                timestamp_ranges.append([start_ts, next_end_ts])
+                start_ts = next_end_ts + 1
 
         return timestamp_ranges
 
+    def _get_timestamp_period(
+        self, start_date: Optional[str] = None, end_date: Optional[str] = None
+    ) -> List[int]:
+        """
+        👻 시작/종료 날짜를 timestamp로 변환한다.
+
+        Args:
+            start_date (Optional[str], optional): 시작 날짜
+            end_date (Optional[str], optional): 종료 날짜
+
+        Returns:
+            List[int]: [start timestamp, end timestamp]
+        """
+        start_date = self.start_date if start_date is None else start_date + " 09:00:00"
+        end_date = self.end_date if end_date is None else end_date + " 08:59:59"
+        return [
+            base_utils.convert_to_timestamp_ms(date=start_date),
+            base_utils.convert_to_timestamp_ms(date=end_date),
+        ]
+
     def __prepend_placeholder(self, table: List[List[Any]]) -> List[List[Any]]:
         """
         👻 closing sync data 활용에 필요한 배열을 맞추기 위해 첫번째 index 데이터에 dummy값을 삽입한다.
@@ -99,6 +149,35 @@ class FactoryManager:
         table.insert(0, placeholder_row)  # 첫 번째 위치에 삽입
         return table  # 수정된 리스트 반환
 
+    async def _fetch_page(
+        self, symbol: str, interval: str, start_ts: int, end_ts: int
+    ) -> List[List[Any]]:
+        """
+        📨 kline data 한 페이지를 수신한다. 429/418 응답시 limiter가 Retry-After만큼 대기시킨 후 재시도한다.
+
+        Args:
+            symbol (str): symbol 값
+            interval (str): interval 값
+            start_ts (int): 시작 timestamp
+            end_ts (int): 종료 timestamp
+
+        Raises:
+            ValueError: 재시도 횟수 초과시
+
+        Returns:
+            List[List[Any]]: 수신 데이터
+        """
+        for _ in range(self.max_retries):
+            try:
+                return await ins_market_fetcher.fetch_klines_date(
+                    symbol, interval, start_ts, end_ts, self.page_limit
+                )
+            except aiohttp.ClientResponseError as error:
+                if error.status not in (418, 429):
+                    raise
+                print(f"  ⚠️ {symbol}_{interval} 요청 제한({error.status}) - 재시도")
+        raise ValueError(f"  ⚠️ 재시도 횟수 초과: {symbol}_{interval} {start_ts}")
+
     async def fetch_klines(
         self,
         symbol: str,
@@ -121,16 +200,26 @@ class FactoryManager:
         symbol = symbol if symbol is not None else self.symbol
         result = {}
 
-        kline_data = []
         timestamp_range = self._generate_timestamp_ranges(
-            interval, start_date, end_date
+            interval, start_date, end_date, symbol
         )
-        for start_timestamp, end_timesatmp in timestamp_range:
-            fetch_data = await ins_market_fetcher.fetch_klines_date(
-                symbol, interval, start_timestamp, end_timesatmp
+        # 요청 간격은 limiter가 request weight 기준으로 조절한다.
+        pages = await asyncio.gather(
+            *[
+                self._fetch_page(symbol, interval, start_timestamp, end_timesatmp)
+                for start_timestamp, end_timesatmp in timestamp_range
+            ]
+        )
+        kline_data = [row for page in pages for row in page]
+        # 신규 수신 구간만 catalog에 병합하고, 전체 기간은 catalog에서 불러온다.
+        if timestamp_range:
+            self.ins_kline_catalog.merge(
+                self.market, symbol, interval, kline_data, timestamp_range
             )
-            kline_data.extend(fetch_data)
-            await asyncio.sleep(0.2)
+        start_ts, end_ts = self._get_timestamp_period(start_date, end_date)
+        kline_data = self.ins_kline_catalog.load(
+            self.market, symbol, interval, start_ts, end_ts
+        ).tolist()
         key = f"{symbol}_{interval}"
         print(f"  📨 {key} 수신 완료")
         result[key] = kline_data
@@ -167,6 +256,7 @@ class FactoryManager:
     ):
         """
         📨 fetch_klines method을 활용하여 동시에 여러개 데이터를 비동기식으로 수신한다.
+        전체 페이지 요청이 하나의 limiter를 공유하므로 동시 요청 수와 분당 weight 한도 내에서 최대 속도로 수신한다.
 
         Args:
             symbols (List): symbol 종류
@@ -225,6 +315,31 @@ class FactoryManager:
         table.insert(0, placeholder_row)  # 첫 번째 위치에 삽입
         return table  # 수정된 리스트 반환
 
+    def resample_for_analysis(
+        self, convert_to_data: Dict[str, Dict[str, np.ndarray]]
+    ) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        1분봉 데이터로 나머지 interval 데이터를 생성한다. 첫번째 index의 더미데이터 배열을 유지한다.
+
+        Args:
+            convert_to_data (Dict[str, Dict[str, np.ndarray]]): process_for_analysis 결과물 (1분봉)
+
+        Returns:
+            Dict[str, Dict[str, np.ndarray]]: interval 데이터가 추가된 결과물
+        """
+        for values in convert_to_data.values():
+            base_data = values[self.base_interval][1:]
+            for interval in self.intervals:
+                if interval == self.base_interval:
+                    continue
+                values[interval] = np.vstack(
+                    (
+                        np.zeros((1, base_data.shape[1])),
+                        KlineResampler.resample(base_data, interval),
+                    )
+                )
+        return convert_to_data
+
     def generate_indices_arange(self, interval: str, data: np.ndarray):
         """
         kline data의 특정 index값을 확보한다. 주로 1m값의 index를 생성하기 위하여 쓰인다.
@@ -247,6 +362,7 @@ class FactoryManager:
         """
         base data를 기준하여 closing sync data를 생성한다.
         base data의 길이에 맞게 selec_data를 재구성한다. 시계열 데이터를 사용하기 위함이다.
+        행별 탐색 없이 ClosingSyncEngine으로 한번에 계산하며, 3차원(symbol 축 포함) 입력시 전체 symbol을 일괄 처리한다.
 
         Args:
             base_data (np.ndarray): 기본 데이터 (1분봉 kline data)
@@ -257,160 +373,123 @@ class FactoryManager:
             _type_: 시계열 데이터 생성(1분)
         """
 
-        result = {}
-        timestamp_range = base_utils.get_interval_ms_seconds(interval) - 1
-        temp_data = []
-
         print(f"    ℹ️ 데이터 생성 시작: {interval}")
-        
-        for (
-            open_timestamp,
-            open_price,
-            high_price,
-            low_price,
-            close_price,
-            volume,
-            close_timestamp,
-            volume_total_usdt,
-            trades_count,
-            taker_asset_volume,
-            taker_quote_volume,
-            ignore,
-        ) in zip(*base_data.T):
-            # open_timestamp = 시작 타임스템프
-            # open_price = 시작 가격
-            # high_price = 최고 가격
-            # low_price = 최저 가격
-            # close_price = 마지막 가격
-            # volume = 거래량(단위 : coin)
-            # close_timestamp = 종료 타임스템프
-            # volume_total_usdt = 거래량(단위 : usdt)
-            # trades_count = 총 거래횟수
-            # taker_asset_volume =  시장가 주문 거래량(단위 : coin)
-            # taker_quote_volume = 시장가 주문 거래량(단위 : usdt)
-
-            condition = np.where(
-                (selec_data[:, 0] <= open_timestamp)
-                & (selec_data[:, 6] >= close_timestamp)
-            )
-
-            target_data = selec_data[condition]
-
-            target_open_timestamp = target_data[0, 0]  # 단일값이 확실할 경우
-            target_close_timestamp = target_data[0, 6]  # 단일값이 확실할 경우
-
-            new_data_condition = np.where(
-                (base_data[:, 0] >= target_open_timestamp)
-                & (base_data[:, 6] <= close_timestamp)
-            )  # close_timestamp는 현재 data종료 시간 기준으로 해야한다.
-
-            new_base_data = base_data[new_data_condition]
-
-            timestamp_diff = new_base_data[-1, 6] - new_base_data[0, 0]
-            if timestamp_range == timestamp_diff:
-                new_data = target_data[0]
-            else:
-                new_data = [
-                    target_open_timestamp,
-                    new_base_data[0, 1],
-                    np.max(new_base_data[:, 2]),
-                    np.min(new_base_data[:, 3]),
-                    new_base_data[-1, 4],
-                    np.sum(new_base_data[:, 5]),
-                    target_close_timestamp,
-                    np.sum(new_base_data[:, 7]),
-                    np.sum(new_base_data[:, 8]),
-                    np.sum(new_base_data[:, 9]),
-                    np.sum(new_base_data[:, 10]),
-                    0,
-                ]
-            temp_data.append(new_data)
-        return np.array(temp_data, float)
+        if np.ndim(base_data) == 3:
+            return ClosingSyncEngine.generate_multi(base_data, selec_data, interval)
+        return ClosingSyncEngine.generate(base_data, selec_data, interval)
 
     def generate_indices_by_interval(
         self, base_indices, interval: str, lookback_days: int = 1
-    ):
+    ) -> LookbackIndices:
         """
         기본 데이터를 활용하여 interval별로 index값들을 생성한다. 해당 값을 활용하여 시계열 데이터를 불러올때 사용한다.
+        index 목록을 미리 생성하지 않고, 조회시점에 (start, stop, step) window를 계산하는 LookbackIndices를 반환한다.
 
         Args:
-            base_indices (_type_): _description_
-            interval (str): _description_
-            lookback_days (int, optional): _description_. Defaults to 1.
+            base_indices (np.ndarray): 기본 데이터 index값 (1분봉)
+            interval (str): interval 값
+            lookback_days (int, optional): 조회 기간(일). Defaults to 1.
 
         Returns:
-            _type_: _description_
+            LookbackIndices: interval별 lookback window
         """
-        index_step = base_utils.get_interval_minutes(interval)
-        day_step = base_utils.get_interval_minutes("1d") * lookback_days
-        result = []
-        for current_index in base_indices:
-            start_idx = max(current_index - day_step, 0)
-            if start_idx == 0:
-                continue
-            condition = np.where(
-                (base_indices >= start_idx)
-                & (base_indices < current_index)
-                & (base_indices % index_step == 0)
-            )
-            add_indices = np.append(condition, current_index)
-            result.append(np.append(condition, current_index))
+        return LookbackIndices(interval, len(base_indices), lookback_days)
+
+    def stack_symbols(self, datasets: List[np.ndarray], interval: str) -> np.ndarray:
+        """
+        symbol별 kline data를 공통 timestamp 축에 정렬하여 (symbol, 데이터길이, 12) 배열로 합친다.
+        데이터가 없는 구간(상장 전, 누락)은 timestamp만 기록하고 나머지 값은 NaN으로 채운다.
+        첫번째 index의 더미데이터 배열을 유지한다.
+
+        Args:
+            datasets (List[np.ndarray]): self.symbol 순서의 kline data (첫 행 더미데이터)
+            interval (str): interval 값
+
+        Returns:
+            np.ndarray: (symbol, 데이터길이, 12) 배열
+        """
+        interval_ms = base_utils.get_interval_ms_seconds(interval)
+        timeline = np.unique(np.concatenate([data[1:, 0] for data in datasets]))
+        result = np.full((len(datasets), len(timeline) + 1, 12), np.nan)
+        result[:, 0] = 0
+        result[:, 1:, 0] = timeline
+        result[:, 1:, 6] = timeline + interval_ms - 1
+        for idx, data in enumerate(datasets):
+            positions = np.searchsorted(timeline, data[1:, 0]) + 1
+            result[idx, positions] = data[1:]
         return result
 
     def storage_save(self):
         """
-        storage를 전부 저장한다 (closing, indices)
+        storage를 전부 저장한다. closing data는 interval별 .npy 파일로 저장하고,
+        indices는 조회시점에 계산하므로 manifest에 lookback 정보만 기록한다.
         """
-
-        if not os.path.isdir(self.path_test_storage):
-            os.makedirs(self.path_test_storage)
-        with open(self.path_closing, "wb") as f:
-            pickle.dump(self.storage_closing, f)
-        with open(self.path_indices, "wb") as f:
-            pickle.dump(self.storage_indices, f)
+        for interval in self.intervals:
+            self.ins_columnar_storage.save_stack(
+                interval, self.storage_closing.get_data(interval, slice(None))
+            )
+        self.ins_columnar_storage.write_manifest(
+            symbols=self.storage_closing.symbols,
+            intervals=self.intervals,
+            data_length=self.storage_closing.get_data(self.base_interval, slice(None)).shape[1],
+            lookback_days=self.lookback_days,
+            start_date=self.start_date,
+            end_date=self.end_date,
+        )
         print(f"  ✅ 저장 완료")
 
     def storage_load(self):
         """
-        저장한 스토리지를 불러온다.
+        저장한 스토리지를 불러온다. closing data는 memory map으로 열기 때문에 즉시 로딩되며,
+        여러 프로세스가 동시에 불러와도 메모리를 공유한다.
 
         Raises:
-            ValueError: 폴더가 존재하지 않을 때
-            ValueError: closing 파일이 존재하지 않을 때
-            ValueError: indices 파일이 존재하지 않을 때
+            ValueError: manifest 파일이 존재하지 않을 때
+            ValueError: interval 파일이 존재하지 않을 때
 
         Returns:
             _type_: closing, indices 두 storage
         """
-        if not os.path.isdir(self.path_test_storage):
-            raise ValueError(f"  ⚠️ 폴더가 존재하지 않음: {self.path_test_storage}")
-        if not os.path.isfile(self.path_closing):
-            raise ValueError(f"  ⚠️  파일이 존재하지 않음: {self.path_closing}")
-        if not os.path.isfile(self.path_indices):
-            raise ValueError(f"  ⚠️  파일이 존재하지 않음: {self.path_indices}")
-
-        with open(self.path_closing, "rb") as f:
-            self.storage_closing = pickle.load(f)
-        with open(self.path_indices, "rb") as f:
-            self.storage_indices = pickle.load(f)
+        manifest = self.ins_columnar_storage.read_manifest()
+        self.storage_closing.set_symbols(manifest["symbols"])
+        for interval in manifest["intervals"]:
+            self.storage_closing.set_data(
+                interval, self.ins_columnar_storage.load_stack(interval)
+            )
+            self.storage_indices.set_data(
+                interval,
+                LookbackIndices(
+                    interval, manifest["data_length"], manifest["lookback_days"]
+                ),
+            )
         print(f"  ✅ Storage 로딩 완료")
         return self.storage_closing, self.storage_indices
 
     async def start(self, is_save: bool = True):
-        dataset = await self.fetch_multiple_klines(self.symbol, self.intervals)
-        convert_to_data = self.process_for_analysis(dataset)
-        base_data = convert_to_data[self.symbol[0]][self.base_interval]
+        # 1분봉만 수신하고 나머지 interval은 로컬에서 생성한다.
+        dataset = await self.fetch_multiple_klines(self.symbol, [self.base_interval])
+        convert_to_data = self.resample_for_analysis(self.process_for_analysis(dataset))
+        # 전체 symbol을 공통 timestamp 축으로 정렬하여 한번에 처리한다.
+        self.storage_closing.set_symbols(self.symbol)
+        stacked_data = {
+            interval: self.stack_symbols(
+                [convert_to_data[symbol][interval] for symbol in self.symbol], interval
+            )
+            for interval in self.intervals
+        }
+        base_data = stacked_data[self.base_interval]
         print(f"  🚀 데이터 싱크 생성 시작")
         for i in self.intervals:
-            selec_data = convert_to_data[self.symbol[0]][i]
-            closing_sync_data = self.generate_kline_closing_sync(base_data, selec_data, i)
+            closing_sync_data = self.generate_kline_closing_sync(
+                base_data, stacked_data[i], i
+            )
             self.storage_closing.set_data(i, closing_sync_data)
         print(f"  👍 데이터 싱크 생성 완료")
-        base_data = convert_to_data[self.symbol[0]][self.base_interval]
-        base_indices = self.generate_indices_arange(self.base_interval, base_data)
+        base_indices = self.generate_indices_arange(self.base_interval, base_data[0])
         for i in self.intervals:
-            indices_data = self.generate_indices_by_interval(base_indices, i, 7)
-            
+            indices_data = self.generate_indices_by_interval(
+                base_indices, i, self.lookback_days
+            )
             self.storage_indices.set_data(i, indices_data)
         if is_save:
             self.storage_save()
@@ -0,0 +1,76 @@
+import numpy as np
+
+import os, sys
+home_path = os.path.expanduser("~")
+sys.path.append(os.path.join(home_path, "github", "Thunder", "Binance"))
+import Workspace.Utils.BaseUtils as base_utils
+
+
+class KlineResampler:
+    """
+    1분봉 kline data로 상위 interval kline data를 생성한다.
+
+    Binance와 동일하게 UTC 기준 구간으로 묶으며(1w는 월요일 00:00 UTC 시작),
+    OHLC와 거래량/거래대금/거래횟수/taker 거래량을 구간별로 집계한다. 1분봉만 수신 및 저장하면 된다.
+    """
+
+    # 1970-01-01(목요일) 기준 첫 월요일까지의 offset
+    WEEK_OFFSET_MS: int = 4 * 24 * 60 * 60 * 1_000
+
+    @staticmethod
+    def bucket_open_timestamps(open_timestamps: np.ndarray, interval: str) -> np.ndarray:
+        """
+        👻 open timestamp가 속하는 interval 구간의 시작 timestamp를 계산한다.
+
+        Args:
+            open_timestamps (np.ndarray): 1분봉 open timestamp
+            interval (str): interval 값
+
+        Raises:
+            ValueError: 월봉(1M)처럼 고정 길이가 아닌 interval 입력시
+
+        Returns:
+            np.ndarray: 구간 시작 timestamp
+        """
+        if interval.endswith("M"):
+            raise ValueError(f"  ⚠️ 지원하지 않는 interval: {interval}")
+        interval_ms = base_utils.get_interval_ms_seconds(interval)
+        offset = KlineResampler.WEEK_OFFSET_MS if interval.endswith("w") else 0
+        open_timestamps = open_timestamps.astype(np.int64)
+        return open_timestamps - (open_timestamps - offset) % interval_ms
+
+    @staticmethod
+    def resample(base_data: np.ndarray, interval: str) -> np.ndarray:
+        """
+        1분봉 kline data를 interval kline data로 변환한다.
+
+        Args:
+            base_data (np.ndarray): open timestamp 오름차순 1분봉 kline data (12열)
+            interval (str): 생성할 interval 값
+
+        Returns:
+            np.ndarray: interval kline data (12열)
+        """
+        base_data = np.asarray(base_data, dtype=np.float64)
+        if len(base_data) == 0:
+            return np.empty((0, 12), dtype=np.float64)
+
+        interval_ms = base_utils.get_interval_ms_seconds(interval)
+        bucket = KlineResampler.bucket_open_timestamps(base_data[:, 0], interval)
+        is_start = np.empty(len(bucket), dtype=bool)
+        is_start[0] = True
+        is_start[1:] = bucket[1:] != bucket[:-1]
+        start_indices = np.flatnonzero(is_start)
+        end_indices = np.append(start_indices[1:], len(bucket)) - 1
+
+        result = np.zeros((len(start_indices), 12), dtype=np.float64)
+        result[:, 0] = bucket[start_indices]
+        result[:, 1] = base_data[start_indices, 1]
+        result[:, 2] = np.maximum.reduceat(base_data[:, 2], start_indices)
+        result[:, 3] = np.minimum.reduceat(base_data[:, 3], start_indices)
+        result[:, 4] = base_data[end_indices, 4]
+        result[:, 6] = result[:, 0] + interval_ms - 1
+        result[:, [5, 7, 8, 9, 10]] = np.add.reduceat(
+            base_data[:, [5, 7, 8, 9, 10]], start_indices, axis=0
+        )
+        return result
@@ -0,0 +1,61 @@
+import numpy as np
+
+import os, sys
+home_path = os.path.expanduser("~")
+sys.path.append(os.path.join(home_path, "github", "Thunder", "Binance"))
+
+from Workspace.BackTest.ClosingSync import ClosingSyncEngine
+from Workspace.BackTest.DataFactory import FactoryManager
+
+# 상장 시점이 다르거나 1분봉이 누락된 symbol의 generate_multi 결과가
+# symbol별 generate 결과와 동일한지 확인한다.
+minute_ms = 60_000
+bucket_ms = 4 * 60 * minute_ms
+start_ts = 1_735_689_600_000
+rng = np.random.default_rng(0)
+
+
+def make_minute_kline(start: int, length: int) -> np.ndarray:
+    close = 100 + np.cumsum(rng.normal(0, 0.3, length))
+    open_ = np.r_[close[0], close[:-1]]
+    data = np.zeros((length, 12))
+    data[:, 0] = start + np.arange(length) * minute_ms
+    data[:, [1, 4]] = np.c_[open_, close]
+    data[:, 2] = np.maximum(open_, close) + 0.1
+    data[:, 3] = np.minimum(open_, close) - 0.1
+    data[:, [5, 7, 8, 9, 10]] = rng.random((length, 5))
+    data[:, 6] = data[:, 0] + minute_ms - 1
+    return data
+
+
+def resample(data: np.ndarray) -> np.ndarray:
+    bucket = data[:, 0] // bucket_ms
+    result = []
+    for value in np.unique(bucket):
+        group = data[bucket == value]
+        row = np.zeros(12)
+        row[[0, 6]] = value * bucket_ms, value * bucket_ms + bucket_ms - 1
+        row[[1, 2, 3, 4]] = group[0, 1], group[:, 2].max(), group[:, 3].min(), group[-1, 4]
+        row[[5, 7, 8, 9, 10]] = group[:, [5, 7, 8, 9, 10]].sum(axis=0)
+        result.append(row)
+    return np.array(result)
+
+
+dummy = np.zeros((1, 12))
+symbols_data = [
+    make_minute_kline(start_ts, 2_880),  # 정상
+    make_minute_kline(start_ts + 300 * minute_ms, 2_580),  # 05:00 상장
+    np.delete(make_minute_kline(start_ts, 2_880), [100, 500, 501], axis=0),  # 누락
+]
+base = [np.vstack([dummy, data]) for data in symbols_data]
+selec = [np.vstack([dummy, resample(data)]) for data in symbols_data]
+
+factory = FactoryManager.__new__(FactoryManager)
+stacked_base = factory.stack_symbols(base, "1m")
+multi = ClosingSyncEngine.generate_multi(stacked_base, factory.stack_symbols(selec, "4h"), "4h")
+for idx, (base_data, selec_data) in enumerate(zip(base, selec)):
+    expected = ClosingSyncEngine.generate(base_data, selec_data, "4h")
+    positions = np.searchsorted(stacked_base[idx, :, 0], base_data[:, 0])
+    positions[0] = 0
+    assert np.allclose(multi[idx, positions], expected), f"symbol {idx} 불일치"
+print("  ✅ generate_multi 회귀 검증 완료")
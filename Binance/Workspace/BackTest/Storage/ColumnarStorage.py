@@ -0,0 +1,167 @@
+import numpy as np
+import json
+from typing import Dict, List, Any, Optional
+
+import os, sys
+home_path = os.path.expanduser("~")
+sys.path.append(os.path.join(home_path, "github", "Thunder", "Binance"))
+import Workspace.Utils.BaseUtils as base_utils
+
+
+class ColumnarStorage:
+    """
+    백테스트 데이터셋을 symbol/interval별 .npy 파일과 manifest.json으로 저장 및 로딩한다.
+
+    각 파일은 (컬럼수, 데이터길이) 형태의 column-major 배열로 저장되며 np.load(mmap_mode="r")로 열기 때문에
+    로딩시 역직렬화가 발생하지 않는다. 여러 프로세스가 동시에 열어도 OS page cache를 공유한다.
+
+    폴더 구조:
+        {path}/manifest.json
+        {path}/{symbol}/{interval}.npy
+        {path}/{interval}.npy  (전체 symbol 통합 저장시, (symbol, 컬럼수, 데이터길이))
+    """
+
+    MANIFEST: str = "manifest.json"
+    COLUMNS: List[str] = [
+        column.split(": ")[1] for column in base_utils.info_kline_columns()
+    ]
+
+    def __init__(self, path: str):
+        self.path = path
+        self.path_manifest = os.path.join(self.path, self.MANIFEST)
+
+    def __get_file_path(self, symbol: str, interval: str) -> str:
+        return os.path.join(self.path, symbol, f"{interval}.npy")
+
+    def save(self, symbol: str, interval: str, dataset: np.ndarray):
+        """
+        💾 dataset을 column-major .npy 파일로 저장한다. 임시파일 저장 후 교체하므로 읽기 중인 프로세스에 영향이 없다.
+
+        Args:
+            symbol (str): symbol 값
+            interval (str): interval 값
+            dataset (np.ndarray): (데이터길이, 컬럼수) 배열
+        """
+        file_path = self.__get_file_path(symbol, interval)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        temp_path = f"{file_path}.tmp"
+        with open(temp_path, "wb") as f:
+            np.save(f, np.ascontiguousarray(np.asarray(dataset, dtype=np.float64).T))
+        os.replace(temp_path, file_path)
+
+    def load(self, symbol: str, interval: str) -> np.ndarray:
+        """
+        📂 저장된 .npy 파일을 memory map으로 연다.
+
+        Args:
+            symbol (str): symbol 값
+            interval (str): interval 값
+
+        Raises:
+            ValueError: 파일이 존재하지 않을 때
+
+        Returns:
+            np.ndarray: (데이터길이, 컬럼수) 읽기전용 view
+        """
+        file_path = self.__get_file_path(symbol, interval)
+        if not os.path.isfile(file_path):
+            raise ValueError(f"  ⚠️ 파일이 존재하지 않음: {file_path}")
+        return np.load(file_path, mmap_mode="r").T
+
+    def save_stack(self, interval: str, dataset: np.ndarray):
+        """
+        💾 (symbol, 데이터길이, 컬럼수) 배열을 interval 단위 파일 1개로 저장한다. symbol별 column-major로 배치된다.
+
+        Args:
+            interval (str): interval 값
+            dataset (np.ndarray): (symbol, 데이터길이, 컬럼수) 배열
+        """
+        file_path = os.path.join(self.path, f"{interval}.npy")
+        os.makedirs(self.path, exist_ok=True)
+        temp_path = f"{file_path}.tmp"
+        with open(temp_path, "wb") as f:
+            np.save(
+                f,
+                np.ascontiguousarray(
+                    np.asarray(dataset, dtype=np.float64).transpose(0, 2, 1)
+                ),
+            )
+        os.replace(temp_path, file_path)
+
+    def load_stack(self, interval: str) -> np.ndarray:
+        """
+        📂 save_stack으로 저장된 파일을 memory map으로 연다.
+
+        Args:
+            interval (str): interval 값
+
+        Raises:
+            ValueError: 파일이 존재하지 않을 때
+
+        Returns:
+            np.ndarray: (symbol, 데이터길이, 컬럼수) 읽기전용 view
+        """
+        file_path = os.path.join(self.path, f"{interval}.npy")
+        if not os.path.isfile(file_path):
+            raise ValueError(f"  ⚠️ 파일이 존재하지 않음: {file_path}")
+        return np.load(file_path, mmap_mode="r").transpose(0, 2, 1)
+
+    def write_manifest(
+        self, symbols: List[str], intervals: List[str], data_length: int, **kwargs: Any
+    ):
+        """
+        💾 데이터셋 구성정보를 manifest.json으로 저장한다.
+
+        Args:
+            symbols (List[str]): 저장된 symbol 목록
+            intervals (List[str]): 저장된 interval 목록
+            data_length (int): 기준 데이터(1분봉) 길이
+            **kwargs: 추가 저장정보 (lookback_days 등)
+        """
+        manifest = {
+            "columns": self.COLUMNS,
+            "symbols": list(symbols),
+            "intervals": list(intervals),
+            "data_length": int(data_length),
+            **kwargs,
+        }
+        os.makedirs(self.path, exist_ok=True)
+        temp_path = f"{self.path_manifest}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(temp_path, self.path_manifest)
+
+    def read_manifest(self) -> Dict[str, Any]:
+        """
+        📂 manifest.json을 불러온다.
+
+        Raises:
+            ValueError: manifest 파일이 존재하지 않을 때
+
+        Returns:
+            Dict[str, Any]: 데이터셋 구성정보
+        """
+        if not os.path.isfile(self.path_manifest):
+            raise ValueError(f"  ⚠️ 파일이 존재하지 않음: {self.path_manifest}")
+        with open(self.path_manifest, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def load_all(self, symbols: Optional[List[str]] = None) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        📂 manifest에 기록된 전체 데이터를 memory map으로 연다.
+
+        Args:
+            symbols (Optional[List[str]], optional): 로딩할 symbol 목록 (미입력시 전체)
+
+        Returns:
+            Dict[str, Dict[str, np.ndarray]]: symbol > interval > 데이터
+        """
+        manifest = self.read_manifest()
+        symbols = manifest["symbols"] if symbols is None else symbols
+        return {
+            symbol: {
+                interval: self.load(symbol, interval)
+                for interval in manifest["intervals"]
+            }
+            for symbol in symbols
+        }
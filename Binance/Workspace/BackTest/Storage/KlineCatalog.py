@@ -0,0 +1,209 @@
+import numpy as np
+import json
+import time
+from datetime import datetime, timezone
+from typing import Dict, List
+
+import os, sys
+home_path = os.path.expanduser("~")
+sys.path.append(os.path.join(home_path, "github", "Thunder", "Binance"))
+from Workspace.BackTest.Resampler import KlineResampler
+
+
+class KlineCatalog:
+    """
+    수신한 kline data를 (market, symbol, interval) 단위로 로컬에 저장하고, 저장된 timestamp 구간을 기록한다.
+
+    기록된 구간을 활용하여 미보유 구간만 수신할 수 있으며, 신규 데이터는 open timestamp 기준으로 중복 제거 후 병합한다.
+
+    폴더 구조:
+        {path}/catalog.json
+        {path}/{market}/{symbol}/{interval}.npy
+    """
+
+    CATALOG: str = "catalog.json"
+
+    def __init__(self, path: str):
+        self.path = path
+        self.path_catalog = os.path.join(self.path, self.CATALOG)
+        self.catalog: Dict[str, List[List[int]]] = self.__read_catalog()
+
+    def __read_catalog(self) -> Dict[str, List[List[int]]]:
+        if not os.path.isfile(self.path_catalog):
+            return {}
+        with open(self.path_catalog, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def __write_catalog(self):
+        os.makedirs(self.path, exist_ok=True)
+        temp_path = f"{self.path_catalog}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.catalog, f, indent=2)
+        os.replace(temp_path, self.path_catalog)
+
+    @staticmethod
+    def __get_key(market: str, symbol: str, interval: str) -> str:
+        return f"{market}_{symbol}_{interval}"
+
+    def __get_file_path(self, market: str, symbol: str, interval: str) -> str:
+        return os.path.join(self.path, market, symbol, f"{interval}.npy")
+
+    @staticmethod
+    def _merge_ranges(ranges: List[List[int]]) -> List[List[int]]:
+        """
+        👻 겹치거나 연속된 timestamp 구간을 하나로 병합한다.
+
+        Args:
+            ranges (List[List[int]]): [start, end] 구간 목록
+
+        Returns:
+            List[List[int]]: 병합된 구간 목록
+        """
+        result: List[List[int]] = []
+        for start_ts, end_ts in sorted(ranges):
+            if result and start_ts <= result[-1][1] + 1:
+                result[-1][1] = max(result[-1][1], end_ts)
+            else:
+                result.append([start_ts, end_ts])
+        return result
+
+    @staticmethod
+    def _last_closed_ts(interval: str, current_ts: int) -> int:
+        """
+        👻 current_ts 기준 마지막으로 완성된 캔들의 close timestamp를 계산한다.
+        1w는 월요일 00:00 UTC, 1M은 매월 1일 00:00 UTC에 시작한다.
+
+        Args:
+            interval (str): interval 값
+            current_ts (int): 기준 timestamp
+
+        Returns:
+            int: 진행중인 캔들의 open timestamp - 1
+        """
+        if interval.endswith("M"):
+            current = datetime.fromtimestamp(current_ts / 1_000, tz=timezone.utc)
+            month_index = current.year * 12 + current.month - 1
+            month_index -= month_index % int(interval[:-1])
+            open_time = datetime(month_index // 12, month_index % 12 + 1, 1, tzinfo=timezone.utc)
+            return int(open_time.timestamp() * 1_000) - 1
+        open_ts = KlineResampler.bucket_open_timestamps(np.array([current_ts]), interval)[0]
+        return int(open_ts) - 1
+
+    def get_ranges(self, market: str, symbol: str, interval: str) -> List[List[int]]:
+        """
+        보유중인 timestamp 구간을 반환한다.
+
+        Args:
+            market (str): 시장 정보 (FUTURES / SPOT)
+            symbol (str): symbol 값
+            interval (str): interval 값
+
+        Returns:
+            List[List[int]]: [start, end] 구간 목록
+        """
+        return [list(r) for r in self.catalog.get(self.__get_key(market, symbol, interval), [])]
+
+    def missing_ranges(
+        self, market: str, symbol: str, interval: str, start_ts: int, end_ts: int
+    ) -> List[List[int]]:
+        """
+        요청 구간 중 보유하지 않은 구간만 반환한다.
+
+        Args:
+            market (str): 시장 정보
+            symbol (str): symbol 값
+            interval (str): interval 값
+            start_ts (int): 요청 시작 timestamp
+            end_ts (int): 요청 종료 timestamp
+
+        Returns:
+            List[List[int]]: 미보유 [start, end] 구간 목록
+        """
+        result = []
+        cursor = start_ts
+        for covered_start, covered_end in self.get_ranges(market, symbol, interval):
+            if covered_end < cursor:
+                continue
+            if covered_start > end_ts:
+                break
+            if covered_start > cursor:
+                result.append([cursor, covered_start - 1])
+            cursor = max(cursor, covered_end + 1)
+        if cursor <= end_ts:
+            result.append([cursor, end_ts])
+        return result
+
+    def load(
+        self, market: str, symbol: str, interval: str, start_ts: int, end_ts: int
+    ) -> np.ndarray:
+        """
+        보유중인 kline data 중 open timestamp가 요청 구간에 포함되는 데이터를 반환한다.
+
+        Args:
+            market (str): 시장 정보
+            symbol (str): symbol 값
+            interval (str): interval 값
+            start_ts (int): 시작 timestamp
+            end_ts (int): 종료 timestamp
+
+        Returns:
+            np.ndarray: kline data
+        """
+        file_path = self.__get_file_path(market, symbol, interval)
+        if not os.path.isfile(file_path):
+            return np.empty((0, 12), dtype=np.float64)
+        dataset = np.load(file_path, mmap_mode="r")
+        start_idx, end_idx = np.searchsorted(dataset[:, 0], [start_ts, end_ts], side="left")
+        end_idx += int(end_idx < len(dataset) and dataset[end_idx, 0] == end_ts)
+        return np.array(dataset[start_idx:end_idx])
+
+    def merge(
+        self,
+        market: str,
+        symbol: str,
+        interval: str,
+        kline_data: List[List],
+        ranges: List[List[int]],
+    ):
+        """
+        💾 신규 수신 데이터를 기존 데이터와 병합하여 저장하고, 수신 구간을 보유 구간으로 기록한다.
+        open timestamp가 중복될 경우 신규 데이터를 사용한다. 진행중인 캔들은 저장하지 않는다.
+
+        Args:
+            market (str): 시장 정보
+            symbol (str): symbol 값
+            interval (str): interval 값
+            kline_data (List[List]): 수신한 kline data
+            ranges (List[List[int]]): 수신 요청한 [start, end] 구간 목록
+        """
+        current_ts = int(time.time() * 1_000)
+        new_data = np.asarray(kline_data, dtype=np.float64).reshape(-1, 12)
+        new_data = new_data[new_data[:, 6] < current_ts]
+
+        file_path = self.__get_file_path(market, symbol, interval)
+        if os.path.isfile(file_path):
+            # 신규 데이터를 앞에 두어 중복시 신규 데이터가 선택되도록 한다.
+            dataset = np.concatenate((new_data, np.load(file_path)))
+        else:
+            dataset = new_data
+        _, unique_indices = np.unique(dataset[:, 0], return_index=True)
+        dataset = dataset[unique_indices]
+
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        temp_path = f"{file_path}.tmp"
+        with open(temp_path, "wb") as f:
+            np.save(f, dataset)
+        os.replace(temp_path, file_path)
+
+        # 진행중인 캔들 구간은 보유 구간으로 기록하지 않는다.
+        closed_ts = self._last_closed_ts(interval, current_ts)
+        covered_ranges = [
+            [start_ts, min(end_ts, closed_ts)]
+            for start_ts, end_ts in ranges
+            if start_ts <= closed_ts
+        ]
+        key = self.__get_key(market, symbol, interval)
+        self.catalog[key] = self._merge_ranges(
+            self.get_ranges(market, symbol, interval) + covered_ranges
+        )
+        self.__write_catalog()
@@ -1,10 +1,12 @@
 import numpy as np
+from typing import Dict, List, Optional, Tuple, Union
 
 import os, sys
 home_path = os.path.expanduser("~")
 sys.path.append(os.path.join(home_path, "github", "Thunder", "Binance"))
 
 from SystemConfig import Streaming
+import Workspace.Utils.BaseUtils as base_utils
 
 base_interval = "1m"
 config_intervals = Streaming.intervals
@@ -15,32 +17,129 @@ class ClosingSyncStorage:
     """
     ClosingSyncDataset를 저장하는 저장소다.
 
+    interval별로 (symbol, 데이터길이, 12) 배열을 저장하며, symbol_index로 symbol의 행 번호를 조회한다.
+    2차원(단일 symbol) 배열도 그대로 저장 및 조회할 수 있다.
+
     Returns:
         _type_: _description_
     """
-    __slots__ = tuple(convert_to_intervals)
+    __slots__ = tuple(convert_to_intervals) + ("symbols", "symbol_index")
     
     def __init__(self):
         self.clear()
     
     def __convert_to_interval(self, interval:str):
         return f"interval_{interval}"
+
+    def set_symbols(self, symbols:List[str]):
+        """
+        저장된 배열의 symbol 축 순서를 지정한다.
+
+        Args:
+            symbols (List[str]): symbol 목록 (배열 첫번째 축 순서)
+        """
+        self.symbols = list(symbols)
+        self.symbol_index = {symbol: idx for idx, symbol in enumerate(self.symbols)}
     
     def set_data(self, interval:str, dataset:np.ndarray):
         str_interval = self.__convert_to_interval(interval)
         setattr(self, str_interval, dataset)
     
-    def get_data(self, interval:str, indices:np.ndarray):
+    def get_data(
+        self,
+        interval:str,
+        indices:Union[np.ndarray, slice, Tuple[int, int, int]],
+        symbol:Optional[str] = None,
+    ):
+        """
+        interval 데이터를 조회한다. indices가 (start, stop, step) window일 경우 복사 없이 view로 반환한다.
+        현재 index(stop - 1)가 step 배열에 포함되지 않는 구간에서는 현재 행 1개만 덧붙인다.
+
+        Args:
+            interval (str): interval 값
+            indices (Union[np.ndarray, slice, Tuple[int, int, int]]): index 배열 또는 (start, stop, step) window
+            symbol (Optional[str], optional): 조회할 symbol (미입력시 전체 symbol)
+
+        Returns:
+            np.ndarray: 조회 데이터
+        """
         str_interval = self.__convert_to_interval(interval)
-        return getattr(self, str_interval)[indices]
+        dataset = getattr(self, str_interval)
+        if symbol is not None and dataset.ndim == 3:
+            dataset = dataset[self.symbol_index[symbol]]
+        if not isinstance(indices, tuple):
+            return dataset[..., indices, :]
+        start, stop, step = indices
+        window_data = dataset[..., start:stop:step, :]
+        if (stop - 1 - start) % step == 0:
+            return window_data
+        return np.concatenate(
+            (window_data, dataset[..., stop - 1 : stop, :]), axis=dataset.ndim - 2
+        )
     
     def clear(self):
-        for attr in self.__slots__:
+        for attr in convert_to_intervals:
             setattr(self, attr, [])
+        self.symbols: List[str] = []
+        self.symbol_index: Dict[str, int] = {}
+
+class LookbackIndices:
+    """
+    Closing Sync Data의 lookback window를 요청시점에 계산한다. index 목록을 미리 생성하지 않는다.
+
+    n번째 window는 현재 index(current)를 기준으로 lookback 기간 내 interval 마감 index(step 배수)와
+    current로 구성되며 (start, stop, step) 형태로 반환한다.
+    """
+    __slots__ = ("index_step", "day_step", "data_length")
+
+    def __init__(self, interval:str, data_length:int, lookback_days:int = 1):
+        self.index_step = base_utils.get_interval_minutes(interval)
+        self.day_step = base_utils.get_interval_minutes("1d") * lookback_days
+        self.data_length = data_length
+
+    def __len__(self):
+        return max(self.data_length - self.day_step - 1, 0)
+
+    def __getitem__(self, index:int) -> Tuple[int, int, int]:
+        """
+        index번째 window를 (start, stop, step)로 반환한다.
+
+        Args:
+            index (int): 순환 번호
+
+        Raises:
+            IndexError: 순환 범위를 벗어났을 때
+
+        Returns:
+            Tuple[int, int, int]: (start, stop, step)
+        """
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError(f"  ⚠️ index 범위 초과: {index}")
+        current_index = self.day_step + 1 + index
+        start_idx = current_index - self.day_step
+        first_idx = -(-start_idx // self.index_step) * self.index_step
+        return (min(first_idx, current_index), current_index + 1, self.index_step)
+
+    @staticmethod
+    def length(window:Tuple[int, int, int]) -> int:
+        """
+        window에 포함되는 데이터 개수를 반환한다.
+
+        Args:
+            window (Tuple[int, int, int]): (start, stop, step)
+
+        Returns:
+            int: 데이터 개수
+        """
+        start, stop, step = window
+        return len(range(start, stop, step)) + (1 if (stop - 1 - start) % step else 0)
 
 class IndicesStorage:
     """
-    Closing Sync Storage에 적용될 indices값을 저장하는 저장소다.
+    Closing Sync Storage에 적용될 indices값을 저장하는 저장소다. interval별 LookbackIndices를 저장한다.
 
     Returns:
         _type_: _description_
@@ -53,11 +152,11 @@ class IndicesStorage:
     def __convert_to_interval(self, interval:str):
         return f"interval_{interval}"
     
-    def set_data(self, interval:str, indices:np.ndarray):
+    def set_data(self, interval:str, indices:LookbackIndices):
         str_interval = self.__convert_to_interval(interval)
         setattr(self, str_interval, indices)
     
-    def get_data(self, interval:str, index:int):
+    def get_data(self, interval:str, index:int) -> Tuple[int, int, int]:
         str_interval = self.__convert_to_interval(interval)
         return getattr(self, str_interval)[index]
     
@@ -0,0 +1,220 @@
+import numpy as np
+from typing import Callable, Dict, List, Tuple
+
+import os, sys
+
+home_path = os.path.expanduser("~")
+sys.path.append(os.path.join(home_path, "github", "Thunder", "Binance"))
+
+from Workspace.Abstract.AbstractRepository import AppendRepository
+
+from SystemConfig import Streaming
+
+fields = Streaming.symbols
+
+# stream type별 저장 열 : (열 이름, websocket message key, dtype)
+STREAM_COLUMNS: Dict[str, List[Tuple[str, str, str]]] = {
+    "aggTrade": [
+        ("event_time", "E", "i8"),
+        ("agg_trade_id", "a", "i8"),
+        ("price", "p", "f8"),
+        ("quantity", "q", "f8"),
+        ("first_trade_id", "f", "i8"),
+        ("last_trade_id", "l", "i8"),
+        ("trade_time", "T", "i8"),
+        ("is_buyer_maker", "m", "?"),
+    ],
+    "trade": [
+        ("event_time", "E", "i8"),
+        ("trade_id", "t", "i8"),
+        ("price", "p", "f8"),
+        ("quantity", "q", "f8"),
+        ("trade_time", "T", "i8"),
+        ("is_buyer_maker", "m", "?"),
+    ],
+    "ticker": [
+        ("event_time", "E", "i8"),
+        ("price_change", "p", "f8"),
+        ("price_change_percent", "P", "f8"),
+        ("weighted_avg_price", "w", "f8"),
+        ("last_price", "c", "f8"),
+        ("last_quantity", "Q", "f8"),
+        ("open_price", "o", "f8"),
+        ("high_price", "h", "f8"),
+        ("low_price", "l", "f8"),
+        ("volume", "v", "f8"),
+        ("quote_volume", "q", "f8"),
+        ("open_time", "O", "i8"),
+        ("close_time", "C", "i8"),
+        ("trade_count", "n", "i8"),
+    ],
+    "miniTicker": [
+        ("event_time", "E", "i8"),
+        ("close_price", "c", "f8"),
+        ("open_price", "o", "f8"),
+        ("high_price", "h", "f8"),
+        ("low_price", "l", "f8"),
+        ("volume", "v", "f8"),
+        ("quote_volume", "q", "f8"),
+    ],
+    "bookTicker": [
+        ("update_id", "u", "i8"),
+        ("event_time", "E", "i8"),
+        ("transaction_time", "T", "i8"),
+        ("bid_price", "b", "f8"),
+        ("bid_quantity", "B", "f8"),
+        ("ask_price", "a", "f8"),
+        ("ask_quantity", "A", "f8"),
+    ],
+}
+
+# dtype별 변환 함수 (websocket 가격/수량은 문자열로 수신된다.)
+CONVERTERS: Dict[str, Callable] = {"i8": int, "f8": float, "?": bool}
+
+
+class RepositoryRing(AppendRepository):
+    """
+    💾 stream type별 numpy structured array 기반 ring 스토리지.
+    websocket message(dict)를 저장시 1회 변환하며, symbol별 최근 max_length개의 데이터를 보관한다.
+    각 행을 [position], [position + max_length] 두 곳에 기록하여 시간순 데이터를 복사 없이 view로 반환한다.
+    """
+
+    def __init__(self, stream_type: str, max_length: int):
+        """
+        Args:
+            stream_type (str): STREAM_COLUMNS key (aggTrade, trade, ticker, miniTicker, bookTicker)
+            max_length (int): symbol별 최대 보관 갯수
+        """
+        if stream_type not in STREAM_COLUMNS:
+            raise ValueError(f"stream type 입력 오류: {stream_type}")
+        self.stream_type = stream_type
+        self.max_length = max_length
+        self.columns = STREAM_COLUMNS[stream_type]
+        self.dtype = np.dtype([(name, dtype) for name, _, dtype in self.columns])
+        self.parsers = [(key, CONVERTERS[dtype]) for _, key, dtype in self.columns]
+        self.buffers: Dict[str, np.ndarray] = {}
+        self.positions: Dict[str, int] = {}
+        self.lengths: Dict[str, int] = {}
+        self.clear_all()
+
+    def add_data(self, field: str, data: Dict):
+        """
+        📥 websocket message data를 변환하여 추가한다.
+
+        Args:
+            field (str): field값 (symbol)
+            data (Dict): websocket message의 data
+        """
+        if field not in self.buffers:
+            self.clear_field(field)
+        buffer = self.buffers[field]
+        position = (self.positions[field] + 1) % self.max_length
+        buffer[position] = tuple(convert(data[key]) for key, convert in self.parsers)
+        buffer[position + self.max_length] = buffer[position]
+        self.positions[field] = position
+        self.lengths[field] = min(self.lengths[field] + 1, self.max_length)
+
+    def get_data(self, field: str) -> np.ndarray:
+        """
+        📤 데이터를 오래된 순서로 불러온다. (복사 없는 view)
+
+        Args:
+            field (str): 불러올 field명
+
+        Returns:
+            np.ndarray: structured array
+        """
+        if field not in self.buffers:
+            raise ValueError(f"field 입력 오류: {field}")
+        stop = self.positions[field] + self.max_length + 1
+        return self.buffers[field][stop - self.lengths[field] : stop]
+
+    def get_column(self, field: str, column: str) -> np.ndarray:
+        """
+        📤 지정한 열의 데이터를 오래된 순서로 불러온다. (복사 없는 view)
+
+        Args:
+            field (str): field명
+            column (str): 열 이름 (예: price, quantity)
+
+        Returns:
+            np.ndarray: 열 데이터
+        """
+        return self.get_data(field)[column]
+
+    def clear_all(self):
+        """
+        🧹 전체 field 데이터를 초기화한다.
+        """
+        for field in fields:
+            self.clear_field(field)
+
+    def clear_field(self, field: str):
+        """
+        🧹 지정한 field값을 초기화한다. (저장공간 재사용)
+
+        Args:
+            field (str): field 명
+        """
+        if field not in self.buffers:
+            self.buffers[field] = np.zeros(self.max_length * 2, dtype=self.dtype)
+        self.positions[field] = -1
+        self.lengths[field] = 0
+
+    def get_fields(self) -> List:
+        """
+        🔎 field명을 반환한다.
+
+        Returns:
+            List: 전체 필드명
+        """
+        return list(self.buffers)
+
+    def to_dict(self) -> Dict:
+        """
+        📑 데이터를 Dictionary형태로 변환하여 반환한다.
+
+        Returns:
+            Dict: {field: structured array 복사본}
+        """
+        return {field: self.get_data(field).copy() for field in self.buffers}
+
+    def __str__(self) -> str:
+        """
+        🖨️ print( ), str( ) 출력 형태를 대응한다.
+        내용은 field별 데이터 길이 값을 출력한다.
+
+        Returns:
+            str: 속성당 데이터 길이
+        """
+        message = [f"\n{self.__class__.__name__}({self.stream_type}) Data Legnth info\n"]
+        for field in self.buffers:
+            message.append(f"  >> {field}: {self.lengths[field]}\n")
+        return "".join(message)
+
+    def __repr__(self) -> str:
+        """
+        🖨️ repr( ) 사용시 출력될 내용을 정리한다.
+
+        Returns:
+            str: 정렬된 dict 형태 출력
+        """
+        return str(self.to_dict())
+
+    def __len__(self) -> int:
+        """
+        📏 field의 갯수를 출력한다.
+        """
+        return len(self.buffers)
+
+
+if __name__ == "__main__":
+    storage = RepositoryRing("aggTrade", 3)
+    for idx in range(5):
+        storage.add_data(
+            "BTCUSDT",
+            {"e": "aggTrade", "E": idx, "s": "BTCUSDT", "a": idx, "p": f"{100 + idx}", "q": "0.5",
+             "f": idx, "l": idx, "T": idx, "m": idx % 2 == 0},
+        )
+    print(storage)
+    print(storage.get_column("BTCUSDT", "price"))
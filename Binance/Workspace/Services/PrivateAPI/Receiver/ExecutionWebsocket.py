@@ -1,8 +1,8 @@
 import asyncio
-import json
 import aiohttp
 import websockets
 from typing import Dict, Optional
+from ...PublicData.Receiver.JsonDecoder import loads
 
 
 class ExecutionWebsocket:
@@ -71,7 +71,7 @@ class ExecutionWebsocket:
         """📩 웹소켓 메시지 수신 (반복 실행)"""
         if self.websocket_client:
             message = await self.websocket_client.recv()
-            return json.loads(message)  # JSON 데이터 변환
+            return loads(message)  # JSON 데이터 변환
 
 if __name__ == "__main__":
     import asyncio
@@ -2,6 +2,8 @@
 import aiohttp
 import asyncio
 from typing import Final, Dict, Any, Optional, List, Union
+from .RequestWeightLimiter import RequestWeightLimiter
+from ..Receiver.JsonDecoder import loads
 
 
 class MarketFetcher:
@@ -15,18 +17,33 @@ class MarketFetcher:
 
     def __init__(self, base_url: str):
         self.BASE_URL: str = base_url
+        self.limiter: Optional[RequestWeightLimiter] = None
+
+    def set_limiter(self, limiter: Optional[RequestWeightLimiter]):
+        """
+        request weight 관리용 limiter를 지정한다. 지정시 모든 요청이 limiter를 거친다.
+        """
+        self.limiter = limiter
 
     async def _retrieve_api_data(
-        self, endpoint: str, params: Optional[Dict[str, Any]] = None
+        self, endpoint: str, params: Optional[Dict[str, Any]] = None, weight: int = 1
     ) -> Any:
         """
         공동 API 호출 메서드 (비공개)
         """
         url = self.BASE_URL + endpoint
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params, timeout=10) as response:
-                response.raise_for_status()
-                return await response.json()
+        if self.limiter is None:
+            async with aiohttp.ClientSession() as session:
+                async with session.get(url, params=params, timeout=10) as response:
+                    response.raise_for_status()
+                    return await response.json(loads=loads)
+
+        async with self.limiter.request(weight):
+            async with aiohttp.ClientSession() as session:
+                async with session.get(url, params=params, timeout=10) as response:
+                    self.limiter.update(response.headers, response.status)
+                    response.raise_for_status()
+                    return await response.json(loads=loads)
 
     async def fetch_ticker_price(
         self, symbol: Optional[str] = None
@@ -82,7 +99,8 @@ class MarketFetcher:
             "interval": interval,
             "limit":limit
         }
-        return await self._retrieve_api_data("klines", params=params)
+        weight = RequestWeightLimiter.kline_weight(limit, "fapi" in self.BASE_URL)
+        return await self._retrieve_api_data("klines", params=params, weight=weight)
 
     async def fetch_order_book(
         self, symbol: str, limit: int
@@ -0,0 +1,124 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Mapping, Optional
+
+
+class RequestWeightLimiter:
+    """
+    Binance REST API의 request weight를 token bucket 방식으로 관리한다.
+
+    bucket은 분당 허용 weight의 safety_ratio 만큼 채워지며, 요청 전 weight만큼 token을 차감한다.
+    응답 header의 X-MBX-USED-WEIGHT-1m 값으로 서버측 사용량을 반영하고,
+    429/418 응답시 Retry-After 만큼 전체 요청을 중단한다.
+
+    Alias: weight_limiter
+    """
+
+    HEADER_USED_WEIGHT: str = "X-MBX-USED-WEIGHT-1m"
+    HEADER_RETRY_AFTER: str = "Retry-After"
+
+    def __init__(
+        self,
+        max_weight_per_minute: int = 2400,
+        max_concurrency: int = 10,
+        safety_ratio: float = 0.8,
+    ):
+        """
+        Args:
+            max_weight_per_minute (int, optional): 분당 허용 weight (futures 2400 / spot 6000)
+            max_concurrency (int, optional): 동시 요청 수 상한
+            safety_ratio (float, optional): 허용 weight 중 실제 사용할 비율
+        """
+        self.capacity: float = max_weight_per_minute * safety_ratio
+        self.refill_rate: float = self.capacity / 60
+        self.tokens: float = self.capacity
+        self.last_refill: float = time.monotonic()
+        self.blocked_until: float = 0.0
+        self.used_weight: int = 0
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.lock = asyncio.Lock()
+
+    @staticmethod
+    def kline_weight(limit: int, is_futures: bool = True) -> int:
+        """
+        klines endpoint의 limit별 request weight를 반환한다.
+
+        Args:
+            limit (int): 페이지당 수신 개수
+            is_futures (bool, optional): futures 여부 (spot은 limit과 무관하게 2)
+
+        Returns:
+            int: request weight
+        """
+        if not is_futures:
+            return 2
+        if limit < 100:
+            return 1
+        if limit < 500:
+            return 2
+        if limit <= 1000:
+            return 5
+        return 10
+
+    def __refill(self):
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate
+        )
+        self.last_refill = now
+
+    async def acquire(self, weight: int = 1):
+        """
+        weight만큼 token이 확보될 때까지 대기 후 차감한다.
+
+        Args:
+            weight (int, optional): 요청 weight
+        """
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    await asyncio.sleep(self.blocked_until - now)
+                    continue
+                self.__refill()
+                if self.tokens >= weight:
+                    self.tokens -= weight
+                    return
+                await asyncio.sleep((weight - self.tokens) / self.refill_rate)
+
+    def update(self, headers: Mapping[str, str], status: Optional[int] = None):
+        """
+        응답 header를 반영하여 token 잔량 및 차단 시간을 조정한다.
+
+        Args:
+            headers (Mapping[str, str]): 응답 header
+            status (Optional[int], optional): 응답 status code
+        """
+        used_weight = headers.get(self.HEADER_USED_WEIGHT)
+        if used_weight is not None:
+            self.used_weight = int(used_weight)
+            self.__refill()
+            # 서버 기준 잔여 weight보다 많은 token을 보유하지 않는다.
+            self.tokens = min(self.tokens, self.capacity - self.used_weight)
+
+        if status in (418, 429):
+            retry_after = headers.get(self.HEADER_RETRY_AFTER)
+            # Retry-After 미제공시 다음 분까지 대기한다.
+            wait_seconds = (
+                float(retry_after) if retry_after is not None else 60 - time.time() % 60
+            )
+            self.blocked_until = max(self.blocked_until, time.monotonic() + wait_seconds)
+            self.tokens = 0.0
+
+    @asynccontextmanager
+    async def request(self, weight: int = 1):
+        """
+        동시 요청 수 상한과 weight 확보를 함께 적용하는 context manager.
+
+        Args:
+            weight (int, optional): 요청 weight
+        """
+        async with self.semaphore:
+            await self.acquire(weight)
+            yield
@@ -0,0 +1,167 @@
+import json
+from typing import Any, Callable, Dict, List, Optional, TypedDict, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+class KlineData(TypedDict):
+    t: int
+    T: int
+    s: str
+    i: str
+    f: int
+    L: int
+    o: str
+    c: str
+    h: str
+    l: str
+    v: str
+    n: int
+    x: bool
+    q: str
+    V: str
+    Q: str
+    B: str
+
+
+class KlineEvent(TypedDict):
+    e: str
+    E: int
+    s: str
+    k: KlineData
+
+
+class AggTradeEvent(TypedDict):
+    e: str
+    E: int
+    s: str
+    a: int
+    p: str
+    q: str
+    f: int
+    l: int
+    T: int
+    m: bool
+
+
+class DepthEvent(TypedDict):
+    e: str
+    E: int
+    T: int
+    s: str
+    U: int
+    u: int
+    pu: int
+    b: List[List[str]]
+    a: List[List[str]]
+
+
+class TickerEvent(TypedDict):
+    e: str
+    E: int
+    s: str
+    p: str
+    P: str
+    w: str
+    c: str
+    Q: str
+    o: str
+    h: str
+    l: str
+    v: str
+    q: str
+    O: int
+    C: int
+    F: int
+    L: int
+    n: int
+
+
+# stream type별 event 구조 (combined stream의 data)
+EVENT_SCHEMAS: Dict[str, type] = {
+    "kline": KlineEvent,
+    "aggTrade": AggTradeEvent,
+    "depth": DepthEvent,
+    "ticker": TickerEvent,
+}
+
+
+# 설치된 라이브러리 중 가장 빠른 범용 decoder를 선택한다. (orjson > msgspec > json)
+if orjson is not None:
+    loads: Callable[[Union[str, bytes]], Any] = orjson.loads
+    BACKEND = "orjson"
+elif msgspec is not None:
+    loads = msgspec.json.Decoder().decode
+    BACKEND = "msgspec"
+else:
+    loads = json.loads
+    BACKEND = "json"
+
+
+class JsonDecoder:
+    """
+    ℹ️ websocket / REST 응답 JSON decoder.
+    범용 decode는 orjson, msgspec, json(표준 라이브러리) 순으로 설치된 것을 사용한다.
+    validate 지정 및 msgspec 설치시 stream type별 event 구조(EVENT_SCHEMAS)로 decode하며, 결과는 동일한 dict다.
+    (구조 검증 비용으로 orjson 대비 빠르지 않으며, 구조에 없는 key는 제외된다.)
+    구조가 다른 message(구독 응답, 오류 등)는 범용 decode로 처리한다.
+
+    Alias: json_decoder
+
+    Args:
+        stream_type (Optional[str]): stream type (예: kline, aggTrade, depth@100ms, ticker)
+        is_combined (bool): combined stream({"stream", "data"}) 여부
+        validate (bool): event 구조 검증 여부
+    """
+
+    def __init__(self, stream_type: Optional[str] = None, is_combined: bool = True, validate: bool = False):
+        self.stream_type = stream_type
+        self.is_combined = is_combined
+        self.typed_decoder = None
+
+        schema = EVENT_SCHEMAS.get(self.normalize_stream_type(stream_type))
+        if validate and msgspec is not None and schema is not None:
+            if is_combined:
+                schema = TypedDict(
+                    f"Combined{schema.__name__}", {"stream": str, "data": schema}
+                )
+            self.typed_decoder = msgspec.json.Decoder(schema)
+
+    @staticmethod
+    def normalize_stream_type(stream_type: Optional[str]) -> Optional[str]:
+        """
+        stream 이름에서 event 구분값을 추출한다. (예: depth@100ms -> depth, kline_1m -> kline)
+        """
+        if stream_type is None:
+            return None
+        return stream_type.split("@")[0].split("_")[0]
+
+    @property
+    def backend(self) -> str:
+        """사용중인 decoder 이름"""
+        return "msgspec" if self.typed_decoder is not None else BACKEND
+
+    def decode(self, data: Union[str, bytes]) -> Any:
+        """
+        📩 JSON 데이터를 decode한다.
+
+        Args:
+            data (Union[str, bytes]): JSON 문자열
+
+        Returns:
+            Any: decode 결과 (dict / list)
+        """
+        if self.typed_decoder is not None:
+            try:
+                return self.typed_decoder.decode(data)
+            except msgspec.ValidationError:
+                pass
+        return loads(data)
@@ -2,6 +2,7 @@ import aiohttp
 import json
 import asyncio
 from typing import List, Optional
+from .JsonDecoder import JsonDecoder
 
 
 class MarketWebsocket:
@@ -16,19 +17,23 @@ class MarketWebsocket:
         self.websocket: Optional[aiohttp.ClientWebSocketResponse] = None
         self.stream_type: Optional[str] = None
         self.interval_streams: Optional[List[str]] = None
+        self.decoder: JsonDecoder = JsonDecoder()
+
+    def build_streams(self, stream_types: List[str]) -> List[str]:
+        """
+        👻 symbol별 stream 이름 목록을 생성한다. (예: btcusdt@depth@100ms)
+        """
+        return [
+            f"{symbol.lower()}@{endpoint}"
+            for symbol in self.symbols
+            for endpoint in stream_types
+        ]
 
     def _build_stream_url(self, stream_types: List[str]) -> str:
         """
         👻 WebSocket 스트림 URL을 생성한다.
         """
-        endpoints = [stream for stream in stream_types]
-        stream_path = "/".join(
-            [
-                f"{symbol.lower()}@{endpoint}"
-                for symbol in self.symbols
-                for endpoint in endpoints
-            ]
-        )
+        stream_path = "/".join(self.build_streams(stream_types))
         return f"{self.base_url}/stream?streams={stream_path}"  # ✅ Binance의 올바른 WebSocket URL
 
     async def open_kline_connection(self, intervals: List[str], session:aiohttp.ClientSession):
@@ -39,6 +44,7 @@ class MarketWebsocket:
         self.stream_type = "kline"
         self.interval_streams = [f"{self.stream_type}_{i}" for i in intervals]
         stream_url = self._build_stream_url(self.interval_streams)
+        self.decoder = JsonDecoder(self.stream_type)
         self.websocket = await self.session.ws_connect(
             stream_url
         )  # ✅ WebSocket 연결 유지
@@ -58,8 +64,24 @@ class MarketWebsocket:
         self.session = session  # ✅ 세션을 별도로 유지
         self.stream_type = [stream_type]
         url = self._build_stream_url(self.stream_type)
+        self.decoder = JsonDecoder(stream_type)
         self.websocket = await self.session.ws_connect(url)
 
+    async def open_combined_connection(self, streams: List[str], session:aiohttp.ClientSession):
+        """
+        🐣 여러 stream type을 하나의 combined stream으로 연결한다.
+        수신 message의 'stream' 값(예: btcusdt@kline_1m)으로 stream type을 구분한다.
+
+        Args:
+            streams (List[str]): stream 이름 목록 (예: btcusdt@ticker, btcusdt@kline_1m)
+        """
+        self.session = session
+        self.stream_type = streams
+        self.websocket = await self.session.ws_connect(
+            f"{self.base_url}/stream?streams={'/'.join(streams)}"
+        )
+        self.decoder = JsonDecoder()
+
     async def receive_message(self):
         """
         🚀 WebSocket 데이터를 수신 및 반환한다.
@@ -70,9 +92,15 @@ class MarketWebsocket:
         message = await self.websocket.receive()
 
         if message.type == aiohttp.WSMsgType.TEXT:
-            return json.loads(message.data)  # ✅ JSON 변환 후 반환
-
-        elif message.type in (aiohttp.WSMsgType.CLOSE, aiohttp.WSMsgType.ERROR):
+            return self.decoder.decode(message.data)  # ✅ JSON 변환 후 반환
+
+        elif message.type in (
+            aiohttp.WSMsgType.CLOSE,
+            aiohttp.WSMsgType.CLOSING,
+            aiohttp.WSMsgType.CLOSED,
+            aiohttp.WSMsgType.ERROR,
+        ):
+            # 닫힌 연결의 receive()는 대기 없이 반환되므로 None 대신 연결 오류로 처리한다.
             raise ConnectionError("🔴 WebSocket 연결 오류!")
 
     async def close_connection(self):
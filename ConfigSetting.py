@@ -50,6 +50,8 @@ class SystemConfig(Enum):
     
     kline_data = 'kline_data.json'
     closing_sync_data = "closing_sync_data.pkl"
+    closing_sync_store = "closing_sync_store"
+    kline_catalog = "klines"
 
     path_binance_api = os.path.join(parent_folder_path, api_folder_name, api_binance)
     path_telegram_api = os.path.join(parent_folder_path, api_folder_name, api_telegram)
@@ -58,6 +60,8 @@ class SystemConfig(Enum):
 
     path_kline_data = os.path.join(parent_folder_path, data_folder_name, kline_data)
     path_closing_sync_data = os.path.join(parent_folder_path, data_folder_name, closing_sync_data)
+    path_closing_sync_store = os.path.join(parent_folder_path, data_folder_name, closing_sync_store)
+    path_kline_catalog = os.path.join(parent_folder_path, data_folder_name, kline_catalog)
 
 class SymbolConfig(Enum):
     """
@@ -5,6 +5,14 @@ import utils
 import datetime
 from typing import Final, Dict, List, Union, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# websocket 메시지 JSON 변환 함수 (orjson 설치시 우선 사용)
+json_loads = orjson.loads if orjson is not None else json.loads
+
 
 class BinanceHandler:
     """
@@ -81,7 +89,7 @@ class BinanceHandler:
         while not self.stop_event.is_set():
             message = await ws.receive()
             if message.type == aiohttp.WSMsgType.TEXT:
-                data = json.loads(message.data)
+                data = json_loads(message.data)
                 # DEBUG
                 print(data)
                 await self.asyncio_queue.put(data)
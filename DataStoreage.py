@@ -1,5 +1,8 @@
 import utils
-from typing import List, Union, Final, Optional
+import numpy as np
+import json
+import os
+from typing import List, Union, Final, Optional, Tuple
 from dataclasses import dataclass, fields, field, asdict
 import time
 import ConfigSetting
@@ -66,6 +69,188 @@ class DataContainer:
         for attr in list(self.__dict__.keys()):
             delattr(self, attr)
 
+class LookbackIndices:
+    """
+    closing_sync_data의 lookback window를 조회 시점에 계산한다. (index 목록을 미리 생성하지 않는다.)
+    window는 (start, stop, step)으로 표현하며, 현재 index(stop - 1)는 항상 포함된다.
+    """
+
+    __slots__ = ("index_step", "lookback_step", "data_length")
+
+    def __init__(self, interval: str, data_length: int, lookback_days: int):
+        """
+        1. 기능 : interval별 lookback window 계산기를 생성한다.
+        2. 매개변수
+            1) interval : interval 값
+            2) data_length : 기준 데이터(1분봉) 길이
+            3) lookback_days : 조회 기간(일)
+        """
+        self.index_step = utils._get_interval_minutes(interval)
+        self.lookback_step = utils._get_interval_minutes("1d") * lookback_days
+        self.data_length = data_length
+
+    def __len__(self):
+        return self.data_length
+
+    def __getitem__(self, current_idx: int) -> Tuple[int, int, int]:
+        """
+        1. 기능 : 현재 index 기준 lookback window를 (start, stop, step)으로 반환한다.
+        2. 매개변수
+            1) current_idx : 현재 index (1분봉 기준)
+        """
+        if current_idx < 0:
+            current_idx += self.data_length
+        if not 0 <= current_idx < self.data_length:
+            raise IndexError(f"index 범위 초과: {current_idx}")
+        start_idx = max(current_idx - self.lookback_step, 0)
+        first_idx = -(-start_idx // self.index_step) * self.index_step
+        return (min(first_idx, current_idx), current_idx + 1, self.index_step)
+
+    @staticmethod
+    def length(window: Tuple[int, int, int]) -> int:
+        """
+        1. 기능 : window에 포함되는 데이터 개수를 반환한다.
+        2. 매개변수
+            1) window : (start, stop, step)
+        """
+        start, stop, step = window
+        return len(range(start, stop, step)) + (1 if (stop - 1 - start) % step else 0)
+
+    @staticmethod
+    def select(data: np.ndarray, window: Tuple[int, int, int]) -> np.ndarray:
+        """
+        1. 기능 : data에서 window 구간을 조회한다. 현재 index가 step 배열에 포함되면 복사 없이 view를 반환한다.
+        2. 매개변수
+            1) data : closing_sync_data의 interval 데이터
+            2) window : (start, stop, step)
+        """
+        start, stop, step = window
+        window_data = data[start:stop:step]
+        if (stop - 1 - start) % step == 0:
+            return window_data
+        return np.concatenate((window_data, data[stop - 1 : stop]))
+
+
+class KlineCatalog:
+    """
+    수신한 kline data를 (market, symbol, interval) 단위로 로컬에 저장하고, 보유중인 timestamp 구간을 기록한다.
+    폴더 구조 : {path}/catalog.json, {path}/{market}/{symbol}/{interval}.npy
+    """
+
+    def __init__(self, path: str):
+        """
+        1. 기능 : catalog를 불러온다. (파일 미존재시 빈 catalog로 시작)
+        2. 매개변수
+            1) path : 저장 폴더 주소
+        """
+        self.path = path
+        self.path_catalog = os.path.join(self.path, "catalog.json")
+        self.catalog = {}
+        if os.path.isfile(self.path_catalog):
+            with open(self.path_catalog, "r", encoding="utf-8") as file:
+                self.catalog = json.load(file)
+
+    def __get_file_path(self, market: str, symbol: str, interval: str) -> str:
+        return os.path.join(self.path, market, symbol, f"{interval}.npy")
+
+    def get_ranges(self, market: str, symbol: str, interval: str) -> List[List[int]]:
+        """
+        1. 기능 : 보유중인 [start, end] timestamp 구간 목록을 반환한다.
+        """
+        key = f"{market}_{symbol}_{interval}"
+        return [list(ranges) for ranges in self.catalog.get(key, [])]
+
+    def missing_ranges(
+        self, market: str, symbol: str, interval: str, start_ts: int, end_ts: int
+    ) -> List[List[int]]:
+        """
+        1. 기능 : 요청 구간 중 보유하지 않은 [start, end] 구간만 반환한다.
+        2. 매개변수
+            1) market, symbol, interval : catalog key
+            2) start_ts, end_ts : 요청 구간 timestamp
+        """
+        result = []
+        cursor = start_ts
+        for covered_start, covered_end in self.get_ranges(market, symbol, interval):
+            if covered_end < cursor:
+                continue
+            if covered_start > end_ts:
+                break
+            if covered_start > cursor:
+                result.append([cursor, covered_start - 1])
+            cursor = max(cursor, covered_end + 1)
+        if cursor <= end_ts:
+            result.append([cursor, end_ts])
+        return result
+
+    def load(
+        self, market: str, symbol: str, interval: str, start_ts: int, end_ts: int
+    ) -> np.ndarray:
+        """
+        1. 기능 : 보유중인 kline data 중 open timestamp가 요청 구간에 포함되는 데이터를 반환한다.
+        """
+        file_path = self.__get_file_path(market, symbol, interval)
+        if not os.path.isfile(file_path):
+            return np.empty((0, 12), dtype=np.float64)
+        dataset = np.load(file_path, mmap_mode="r")
+        open_timestamps = dataset[:, INDEX_OPEN_TIMESTAMP]
+        start_idx = np.searchsorted(open_timestamps, start_ts, side="left")
+        end_idx = np.searchsorted(open_timestamps, end_ts, side="right")
+        return np.array(dataset[start_idx:end_idx])
+
+    def merge(
+        self,
+        market: str,
+        symbol: str,
+        interval: str,
+        kline_data: List[List[Union[int, str]]],
+        ranges: List[List[int]],
+    ):
+        """
+        1. 기능 : 신규 수신 데이터를 기존 데이터와 병합(open timestamp 중복 제거) 저장하고 수신 구간을 기록한다.
+        2. 매개변수
+            1) market, symbol, interval : catalog key
+            2) kline_data : 신규 수신 데이터
+            3) ranges : 수신 요청한 [start, end] 구간 목록
+        3. 추가설명
+            >> open timestamp 중복시 신규 데이터를 사용한다.
+            >> 진행중인 캔들은 저장 및 구간 기록하지 않는다.
+        """
+        current_ts = int(time.time() * 1_000)
+        new_data = np.asarray(kline_data, dtype=np.float64).reshape(-1, 12)
+        new_data = new_data[new_data[:, INDEX_CLOSE_TIMESTAMP] < current_ts]
+
+        file_path = self.__get_file_path(market, symbol, interval)
+        if os.path.isfile(file_path):
+            new_data = np.concatenate((new_data, np.load(file_path)))
+        _, unique_indices = np.unique(
+            new_data[:, INDEX_OPEN_TIMESTAMP], return_index=True
+        )
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(f"{file_path}.tmp", "wb") as file:
+            np.save(file, new_data[unique_indices])
+        os.replace(f"{file_path}.tmp", file_path)
+
+        closed_ts = utils._get_last_closed_timestamp(interval, current_ts)
+        covered = self.get_ranges(market, symbol, interval) + [
+            [start_ts, min(end_ts, closed_ts)]
+            for start_ts, end_ts in ranges
+            if start_ts <= closed_ts
+        ]
+        merged = []
+        for start_ts, end_ts in sorted(covered):
+            if merged and start_ts <= merged[-1][1] + 1:
+                merged[-1][1] = max(merged[-1][1], end_ts)
+            else:
+                merged.append([start_ts, end_ts])
+        self.catalog[f"{market}_{symbol}_{interval}"] = merged
+
+        os.makedirs(self.path, exist_ok=True)
+        with open(f"{self.path_catalog}.tmp", "w", encoding="utf-8") as file:
+            json.dump(self.catalog, file, indent=2)
+        os.replace(f"{self.path_catalog}.tmp", self.path_catalog)
+
+
 class KlineData:
     """
     Binance에서 수신한 KlineData를 interval별 저장하기 위한 class __slots__형태의 데이터 타입
@@ -187,6 +372,115 @@ class KlineData:
         # print("모든 데이터를 초기화했습니다.")
 
 
+class KlineBuffer:
+    """
+    (symbol, interval)별 kline data를 고정 크기 float64 배열에 저장하는 ring buffer.
+
+    각 행을 [position]과 [position + capacity] 두 곳에 기록(mirror)하여,
+    최근 N개 행을 복사 없이 연속된 view로 반환한다. 진행중 캔들은 같은 행에 덮어쓰고,
+    새 캔들 시작시 다음 행으로 이동하며 capacity 초과시 가장 오래된 행을 덮어쓴다.
+
+        >> buffer = KlineBuffer(capacity=1_000)
+        >> buffer.set_data(kline_data)          # REST kline data (list 또는 np.ndarray)
+        >> buffer.update_data(latest_kline)     # websocket 변환 데이터 (12열)
+        >> array_ = buffer.get_data()           # 최근 데이터 view (np.ndarray, float)
+
+    반환 view는 이후 update시 값이 변경되므로, 보관이 필요하면 copy()하여 사용한다.
+    """
+
+    def __init__(self, capacity: int, num_columns: int = 12):
+        """
+        1. 기능 : 저장공간을 미리 할당한다.
+        2. 매개변수
+            1) capacity : 최대 보관 행 수
+            2) num_columns : kline data 열 수 (기본값 12)
+        """
+        if capacity <= 0:
+            raise ValueError(f"capacity는 0보다 커야 합니다: {capacity}")
+        self.capacity = capacity
+        self.num_columns = num_columns
+        self.buffer = np.zeros((capacity * 2, num_columns), dtype=np.float64)
+        self.position: int = -1  # 마지막 행 위치 (0 ~ capacity - 1)
+        self.length: int = 0
+
+    def __len__(self) -> int:
+        return self.length
+
+    # 지정 위치에 행을 기록한다. (mirror 영역 포함)
+    def __write(self, position: int, row):
+        self.buffer[position] = row
+        self.buffer[position + self.capacity] = self.buffer[position]
+
+    def set_data(self, kline_data: Union[List[List[Union[int, str]]], np.ndarray]):
+        """
+        1. 기능 : 기존 데이터를 지우고 kline data를 저장한다.
+        2. 매개변수
+            1) kline_data : open timestamp 오름차순 kline data
+        3. 추가설명
+            - capacity보다 길면 최근 capacity개만 저장한다.
+        """
+        array_ = np.asarray(kline_data, dtype=np.float64)[-self.capacity :]
+        length = len(array_)
+        self.buffer[:length] = array_
+        self.buffer[self.capacity : self.capacity + length] = array_
+        self.position = length - 1
+        self.length = length
+
+    def update_data(self, kline_data_latest: List[Union[int, float]]) -> bool:
+        """
+        1. 기능 : 최신 kline 1건을 반영한다.
+        2. 매개변수
+            1) kline_data_latest : kline 1행 (websocket 변환 데이터)
+        3. 추가설명
+            - open / close timestamp가 마지막 행과 같으면 덮어쓰고, open timestamp가 더 크면 다음 행에 기록한다.
+            - 이전 open timestamp의 데이터는 무시하며, 반영 여부를 반환한다.
+        """
+        if self.length == 0:
+            self.position = 0
+            self.length = 1
+            self.__write(0, kline_data_latest)
+            return True
+
+        last_row = self.buffer[self.position]
+        open_timestamp = float(kline_data_latest[INDEX_OPEN_TIMESTAMP])
+        close_timestamp = float(kline_data_latest[INDEX_CLOSE_TIMESTAMP])
+        if (
+            open_timestamp == last_row[INDEX_OPEN_TIMESTAMP]
+            and close_timestamp == last_row[INDEX_CLOSE_TIMESTAMP]
+        ):
+            self.__write(self.position, kline_data_latest)
+            return True
+        if open_timestamp > last_row[INDEX_OPEN_TIMESTAMP]:
+            self.position = (self.position + 1) % self.capacity
+            self.length = min(self.length + 1, self.capacity)
+            self.__write(self.position, kline_data_latest)
+            return True
+        return False
+
+    def get_data(self, length: Optional[int] = None) -> np.ndarray:
+        """
+        1. 기능 : 최근 데이터를 open timestamp 오름차순 view로 반환한다. (복사 없음)
+        2. 매개변수
+            1) length : 반환할 행 수 (기본값 전체)
+        """
+        length = self.length if length is None else min(length, self.length)
+        stop = self.position + self.capacity + 1
+        return self.buffer[stop - length : stop]
+
+    def get_last(self) -> np.ndarray:
+        """
+        1. 기능 : 마지막 행(진행중 캔들) view를 반환한다.
+        """
+        return self.buffer[self.position]
+
+    def reset_data(self):
+        """
+        1. 기능 : 저장 데이터를 초기화한다. (저장공간 유지)
+        """
+        self.position = -1
+        self.length = 0
+
+
 @dataclass
 class TradingLog:
     """
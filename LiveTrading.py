@@ -1,4 +1,5 @@
 import TradeComputation
+import DataStoreage
 import TickerDataFetcher
 import TradeClient
 import DataHandler
@@ -122,9 +123,9 @@ class LiveTradingManager:
             lambda: defaultdict()
         )  # websocket data 마지막값 임시저장용
         self.select_symbols: List = []  # 검토 결과 선택된 심볼들
-        self.kline_data: DefaultDict[str, DefaultDict[str, List[List[Any]]]] = (
+        self.kline_data: DefaultDict[str, DefaultDict[str, DataStoreage.KlineBuffer]] = (
             defaultdict(lambda: defaultdict())
-        )  # kline_data 저장용
+        )  # kline_data 저장용 (symbol, interval별 ring buffer)
 
         ### 유틸리티 ###
         self.lock = asyncio.Lock()
@@ -288,12 +289,14 @@ class LiveTradingManager:
                         interval=interval, days=self.kline_period
                     )
                 # Kline 데이터를 수집하고 self.kline_data에 업데이트
-                self.kline_data[ticker][interval] = (
-                    await self.ins_market.fetch_klines_limit(
+                self.__set_kline_buffer(
+                    ticker=ticker,
+                    interval=interval,
+                    kline_data=await self.ins_market.fetch_klines_limit(
                         symbol=ticker,
                         interval=interval,
                         limit=limit_,
-                    )
+                    ),
                 )
         # 데이터가 준비 되었음을 표시
         self.is_data_ready = True
@@ -342,6 +345,22 @@ class LiveTradingManager:
         }
         return time_intervals
 
+    # kline_data를 (symbol, interval)별 ring buffer에 저장한다.
+    def __set_kline_buffer(self, ticker: str, interval: str, kline_data: List[List[Any]]):
+        """
+        1. 기능 : 수신한 kline_data를 KlineBuffer에 저장한다.
+        2. 매개변수
+            1) ticker : symbol 값
+            2) interval : interval 값
+            3) kline_data : fetch_klines_limit 수신 데이터
+        3. 추가사항 : 기존 buffer의 크기가 같으면 재사용하며, 수신 데이터 길이를 buffer 크기로 사용한다.
+        """
+        buffer = self.kline_data[ticker].get(interval)
+        if buffer is None or buffer.capacity != len(kline_data):
+            buffer = DataStoreage.KlineBuffer(capacity=len(kline_data))
+            self.kline_data[ticker][interval] = buffer
+        buffer.set_data(kline_data)
+
     # kline_data 수집 최종버전.
     async def collect_kline_by_interval_loop(self, days: int = 2):
         # interval day기간을 속성에 저장 후 현재 로딩 데이터의 길이가 유효한지 검토하는 목적
@@ -374,13 +393,14 @@ class LiveTradingManager:
 
                                     # ### DEBUG
                                     # print(f'{ticker} - {interval}')
-
-                                    self.kline_data[ticker][interval] = (
-                                        await self.ins_market.fetch_klines_limit(
+                                    self.__set_kline_buffer(
+                                        ticker=ticker,
+                                        interval=interval,
+                                        kline_data=await self.ins_market.fetch_klines_limit(
                                             symbol=ticker,
                                             interval=interval,
                                             limit=limit_,
-                                        )
+                                        ),
                                     )
                         if time_unit == time_units[1] and current_time_minute == times:
                             for ticker in self.select_symbols:
@@ -390,12 +410,14 @@ class LiveTradingManager:
                                     )
                                     # ### DEBUG
                                     # print(f'{ticker} - {interval}')
-                                    self.kline_data[ticker][interval] = (
-                                        await self.ins_market.fetch_klines_limit(
+                                    self.__set_kline_buffer(
+                                        ticker=ticker,
+                                        interval=interval,
+                                        kline_data=await self.ins_market.fetch_klines_limit(
                                             symbol=ticker,
                                             interval=interval,
                                             limit=limit_,
-                                        )
+                                        ),
                                     )
 
     ##=--=####=---=###=--=####=---=###=--=##
@@ -532,8 +554,7 @@ class LiveTradingManager:
         """'
         1. 기능 : kline_data의 마지막 값을 웹소켓 데이터로 업데이트한다.
         2. 매개변수 : 해당없음.
-        3. 추가사항 : kline_data와 websocket 데이터는 자료타입이 다르다.
-                    하지만 np.array(object, float)으로 자료형태를 수정할 예정이므로 문제 없다.
+        3. 추가사항 : kline_data는 KlineBuffer(float64)에 저장되며, 값을 그대로 덮어쓴다. (별도 메모리 할당 없음)
         """
         if self.is_data_ready:
             for symbol, symbol_data in self.kline_data.items():
@@ -549,21 +570,11 @@ class LiveTradingManager:
                         continue
 
                     message_last_data = self.final_message_received[symbol][interval]
-
-                    kline_last_data = interval_data[-1]
                     transform_kline = self.__transform_kline(message_last_data)
 
-                    # open_timestamp / close timestamp가 같을경우
-                    if (kline_last_data[0] == transform_kline[0]) and (
-                        kline_last_data[6] == transform_kline[6]
-                    ):
-                        # 값을 수정한다.
-                        self.kline_data[symbol][interval][-1] = transform_kline
-
-                    # kline_data open_timestam가 웹소켓 open_timestamp보다 작을경우
-                    if kline_last_data[0] < transform_kline[0]:
-                        # 값을 추가한다.
-                        self.kline_data[symbol][interval].append(transform_kline)
+                    # open_timestamp / close timestamp가 같을경우 마지막 행을 덮어쓰고,
+                    # 웹소켓 open_timestamp가 더 클경우 다음 행에 기록한다.
+                    interval_data.update_data(transform_kline)
 
     ##=--=####=---=###=--=####=---=###=--=##
     # -=##=---=-* 분석 파트 (주문 포함) *-=---=##=-#
@@ -584,10 +595,8 @@ class LiveTradingManager:
                 for symbol in self.select_symbols:
                     # interval을 추출
                     for interval in self.ins_analyzer.intervals:
-                        # 데이터를 np.ndarray화 한다. 타입은 float
-                        array_ = np.array(
-                            object=self.kline_data[symbol][interval], dtype=float
-                        )
+                        # 저장된 데이터 view를 가져온다. 타입은 float (복사 없음)
+                        array_ = self.kline_data[symbol][interval].get_data()
                         # 각 interval 데이터를 컨테이너 데이터화 한다.
                         self.interval_dataset.set_data(
                             data_name=f"{self.market}_{symbol}_{interval}", data=array_
@@ -22,6 +22,8 @@ class MarketDataManager:
 
     def __init__(self, base_url: str):
         BASE_URL: str = base_url
+        # 최근 응답 header(X-MBX-USED-WEIGHT-1m) 기준 분당 사용 weight
+        self.used_weight: int = 0
 
     # 공통 API 호출 메서드
     async def __retrieve_api_data(
@@ -37,6 +39,9 @@ class MarketDataManager:
         try:
             async with aiohttp.ClientSession() as session:
                 async with session.get(url, params=params, timeout=10) as response:
+                    used_weight = response.headers.get("X-MBX-USED-WEIGHT-1m")
+                    if used_weight is not None:
+                        self.used_weight = int(used_weight)
                     if response.status == HTTPStatus.OK:
                         return await response.json()
                     else:
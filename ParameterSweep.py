@@ -0,0 +1,201 @@
+import itertools
+import numpy as np
+import pandas as pd
+import utils
+from typing import Dict, List, Sequence, Tuple, Union
+
+
+# 파라미터 조합을 배열 축으로 묶어 손절/레버리지 설정을 일괄 평가한다.
+class StopLossSweep:
+    """
+    동일한 가격 흐름과 진입 신호에 대하여 여러 손절/레버리지 설정을 동시에 평가한다.
+    TradingLog의 stop_price / stop_signal 계산식을 (파라미터 조합 x 시간) 배열 연산으로 재현하며,
+    진입 신호는 1회만 계산하여 전달받는다.
+
+    1. 지원 파라미터 : stop_rate, init_stop_rate, dynamic_adjustment_rate, leverage
+    2. 고정 설정 : is_dynamic_adjustment, dynamic_adjustment_interval, fee_rate
+    3. 포지션 보유중 발생한 신호는 설정별로 무시된다. (설정별 청산시점이 다르므로 진입 여부도 설정별로 결정됨)
+    4. 자산 잔고, 동시 보유 제한은 반영하지 않으며, 거래별 손익률(진입 증거금 대비)로 평가한다.
+    """
+
+    PARAMETERS: Tuple[str, ...] = (
+        "stop_rate",
+        "init_stop_rate",
+        "dynamic_adjustment_rate",
+        "leverage",
+    )
+
+    def __init__(
+        self,
+        timestamps: np.ndarray,
+        prices: np.ndarray,
+        is_dynamic_adjustment: bool = True,
+        dynamic_adjustment_interval: str = "3m",
+        fee_rate: float = 0.05,
+        block_size: int = 4_096,
+    ):
+        """
+        1. 기능 : 평가할 가격 흐름을 지정한다.
+        2. 매개변수
+            1) timestamps : 가격별 timestamp (1분봉 close timestamp)
+            2) prices : 가격 (1분봉 close)
+            3) is_dynamic_adjustment : TradingLog.is_dynamic_adjustment
+            4) dynamic_adjustment_interval : TradingLog.dynamic_adjustment_interval
+            5) fee_rate : TradingLog.fee_rate (단위 %)
+            6) block_size : 한번에 연산할 시간축 길이 (메모리 사용량 제한)
+        """
+        self.timestamps = np.asarray(timestamps, dtype=np.float64)
+        self.prices = np.asarray(prices, dtype=np.float64)
+        self.is_dynamic_adjustment = is_dynamic_adjustment
+        self.adjustment_ms = utils._get_interval_ms_seconds(dynamic_adjustment_interval)
+        self.fee_rate = fee_rate / 100
+        self.block_size = block_size
+
+    # 파라미터 grid를 조합하여 파라미터별 배열로 반환한다.
+    def generate_grid(
+        self, grid: Dict[str, Sequence[Union[int, float]]]
+    ) -> Dict[str, np.ndarray]:
+        """
+        1. 기능 : 파라미터별 후보값의 모든 조합을 생성한다.
+        2. 매개변수
+            1) grid : {파라미터명: 후보값 목록}, 미입력 파라미터는 TradingLog 기본값 적용
+        """
+        defaults = {
+            "stop_rate": [0.025],
+            "init_stop_rate": [0.015],
+            "dynamic_adjustment_rate": [0.0007],
+            "leverage": [1],
+        }
+        for name in grid:
+            if name not in self.PARAMETERS:
+                raise ValueError(f"지원하지 않는 파라미터: {name}")
+        values = [list(grid.get(name, defaults[name])) for name in self.PARAMETERS]
+        combinations = np.array(list(itertools.product(*values)), dtype=np.float64)
+        return {name: combinations[:, idx] for idx, name in enumerate(self.PARAMETERS)}
+
+    # 진입 index 기준으로 파라미터별 청산 index와 청산가격을 계산한다.
+    def __find_exit(
+        self, entry_idx: int, position: int, params: Dict[str, np.ndarray]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        1. 기능 : 파라미터 조합별로 stop_signal이 처음 발생하는 index를 찾는다.
+        2. 매개변수
+            1) entry_idx : 진입 index
+            2) position : 1:long, 2:short
+            3) params : generate_grid 결과
+        3. 추가설명
+            - 진입 다음 index부터 검토하며, 데이터 종료시까지 미청산시 마지막 index로 청산한다.
+        """
+        num_params = len(params["stop_rate"])
+        entry_price = self.prices[entry_idx]
+        entry_ts = self.timestamps[entry_idx]
+        last_idx = len(self.prices) - 1
+
+        exit_idx = np.full(num_params, last_idx, dtype=np.int64)
+        is_open = np.ones(num_params, dtype=bool)
+        high_price = entry_price
+        low_price = entry_price
+
+        stop_rate = params["stop_rate"][:, np.newaxis]
+        init_stop_rate = params["init_stop_rate"][:, np.newaxis]
+        adjustment_rate = params["dynamic_adjustment_rate"][:, np.newaxis]
+
+        for block_start in range(entry_idx + 1, last_idx + 1, self.block_size):
+            block_end = min(block_start + self.block_size, last_idx + 1)
+            price = self.prices[block_start:block_end]
+            high = np.maximum.accumulate(np.maximum(price, high_price))
+            low = np.minimum.accumulate(np.minimum(price, low_price))
+
+            if not self.is_dynamic_adjustment:
+                if position == 1:
+                    stop_price = high * (1 - stop_rate)
+                else:
+                    stop_price = low * (1 + stop_rate)
+            else:
+                steps = np.floor(
+                    (self.timestamps[block_start:block_end] - entry_ts) / self.adjustment_ms
+                )
+                start_rate = init_stop_rate - steps * adjustment_rate
+                if position == 1:
+                    adj_start_price = entry_price * (1 - start_rate)
+                    stop_price = adj_start_price + (high - adj_start_price) * (1 - stop_rate)
+                else:
+                    adj_start_price = entry_price * (1 + start_rate)
+                    stop_price = adj_start_price - (adj_start_price - low) * (1 - stop_rate)
+
+            stop_signal = stop_price >= price if position == 1 else stop_price <= price
+            stop_signal &= is_open[:, np.newaxis]
+            is_hit = stop_signal.any(axis=1)
+            exit_idx[is_hit] = block_start + np.argmax(stop_signal[is_hit], axis=1)
+            is_open &= ~is_hit
+
+            if not is_open.any():
+                break
+            high_price = high[-1]
+            low_price = low[-1]
+
+        return exit_idx, self.prices[exit_idx]
+
+    # 진입 신호 전체를 파라미터 조합별로 평가한다.
+    def run(
+        self,
+        signals: List[Tuple[int, int]],
+        grid: Dict[str, Sequence[Union[int, float]]],
+    ) -> pd.DataFrame:
+        """
+        1. 기능 : 진입 신호를 순서대로 평가하여 파라미터 조합별 결과표를 반환한다.
+        2. 매개변수
+            1) signals : [(진입 index, position)] 목록 (position 1:long, 2:short)
+            2) grid : {파라미터명: 후보값 목록}
+        3. 반환 컬럼
+            - 파라미터, trade_count, win_rate, total_pnl_rate, mean_pnl_rate, max_loss_rate, avg_holding_minutes
+            - pnl_rate는 수수료 포함 손익률(TradingLog.gross_profit_loss_rate)
+        """
+        params = self.generate_grid(grid)
+        num_params = len(params["stop_rate"])
+        leverage = params["leverage"]
+
+        available_idx = np.zeros(num_params, dtype=np.int64)
+        trade_count = np.zeros(num_params, dtype=np.int64)
+        win_count = np.zeros(num_params, dtype=np.int64)
+        total_pnl_rate = np.zeros(num_params)
+        max_loss_rate = np.zeros(num_params)
+        holding_ms = np.zeros(num_params)
+
+        for entry_idx, position in sorted(signals):
+            # 포지션 보유중인 파라미터 조합은 신호를 무시한다.
+            is_entry = available_idx <= entry_idx
+            if not is_entry.any():
+                continue
+            exit_idx, exit_price = self.__find_exit(entry_idx, position, params)
+            entry_price = self.prices[entry_idx]
+            direction = 1 if position == 1 else -1
+
+            net_rate = direction * (exit_price - entry_price) / entry_price * leverage
+            fee_rate = self.fee_rate * (entry_price + exit_price) / entry_price * leverage
+            pnl_rate = net_rate - fee_rate
+
+            trade_count += is_entry
+            win_count += is_entry & (pnl_rate > 0)
+            total_pnl_rate += np.where(is_entry, pnl_rate, 0)
+            max_loss_rate = np.minimum(max_loss_rate, np.where(is_entry, pnl_rate, 0))
+            holding_ms += np.where(
+                is_entry, self.timestamps[exit_idx] - self.timestamps[entry_idx], 0
+            )
+            available_idx = np.where(is_entry, exit_idx + 1, available_idx)
+
+        result = pd.DataFrame(params)
+        result["leverage"] = result["leverage"].astype(int)
+        result["trade_count"] = trade_count
+        result["win_rate"] = np.divide(
+            win_count, trade_count, out=np.zeros(num_params), where=trade_count > 0
+        )
+        result["total_pnl_rate"] = total_pnl_rate
+        result["mean_pnl_rate"] = np.divide(
+            total_pnl_rate, trade_count, out=np.zeros(num_params), where=trade_count > 0
+        )
+        result["max_loss_rate"] = max_loss_rate
+        result["avg_holding_minutes"] = np.divide(
+            holding_ms, trade_count * 60_000, out=np.zeros(num_params), where=trade_count > 0
+        )
+        return result.sort_values("total_pnl_rate", ascending=False, ignore_index=True)
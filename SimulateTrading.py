@@ -9,9 +9,10 @@ import TradeSignalAnalyzer
 from pprint import pprint
 import matplotlib.pyplot as plt
 from matplotlib import style, ticker
-from typing import Optional, List, Union
+from typing import Optional, List, Union, Dict, Any, Tuple
 import numpy as np
 from multiprocessing import Pool, Manager
+from concurrent.futures import ProcessPoolExecutor
 
 ## 신규 테스트
 import DataStoreage
@@ -47,6 +48,10 @@ class BackTesterManager:
         value: int = 350_000_000,
         percent: float = 0.03,
         quote_type: str = "usdt",
+        # 병렬 실행시 담당 구간(index)
+        index_range: Optional[Tuple[int, int]] = None,
+        # 신호 일괄 계산 여부 (False시 index마다 Analysis_new.AnalysisManager 실행)
+        is_batch_signal: bool = True,
     ):
         self.symbols = [symbol.upper() for symbol in symbols]
         self.market = market
@@ -74,7 +79,7 @@ class BackTesterManager:
         )
         # TradingLog에 기록한다. 앞으로 어떻게 사용할지 고민중...
         self.test_mode: bool = True
-        # 데이터를 pickle로 저장 및 로딩해야하며, 컨테이너화 하지 않는다.
+        # 데이터를 .npy(memory map)로 저장 및 로딩해야하며, 컨테이너화 하지 않는다.
         self.closing_sync_data: Optional[Dict[str, Dict[str, List[Any]]]] = None
         # self.kline_data: Optional[Dict[str,Dict[str,List[Any]]]] = None
         # 백테스트에 사용될 kline_data의 길이 지정(단위 : day)
@@ -123,6 +128,10 @@ class BackTesterManager:
         #####신규 테스트
         self.kline_datsets = {}#DataStoreage.KlineData()
         self.ins_new_analysis = Analysis_new.AnalysisManager(self.kline_datsets)
+        self.is_batch_signal = is_batch_signal
+        self.ins_batch_analysis = Analysis_new.BatchSignalAnalyzer()
+        # symbol별 1분봉 index 정렬 신호 배열 {symbol: {"buy": ..., "sell": ...}}
+        self.batch_signals: Optional[Dict[str, Dict[str, np.ndarray]]] = None
 
         # ticker 관련 instance
         self.ins_ticker = TickerDataFetcher.FuturesTickers()
@@ -132,13 +141,16 @@ class BackTesterManager:
         self.target_percent = percent  # 변동 비율폭 : 음수 가능
         self.quote_type = quote_type  # 쌍거래 거래화폐
 
+        # 신규 진입을 허용하는 index 구간. 구간 종료 후에는 보유 포지션 종료시까지만 진행한다.
+        self.index_range = index_range
+
     # 저장데이터의 주소값을 확보한다.
     def __get_data_path(self):
         """
         1. 기능 : 백테스트에 적용될 kline_data의 주소값을 반환한다.
         2. 매개변수 : 해당없음.
         """
-        # 파일명 - 속성명에 지정함.
+        # 폴더명(closing sync store) - 속성명에 지정함.
         file_name = self.ins_backtest_data.kline_closing_sync_data
         # 폴더명 - 속성명에 지정함.
         folder_name = self.ins_backtest_data.storeage
@@ -176,17 +188,17 @@ class BackTesterManager:
         if not self.is_download:
             # 파일 주소를 생성하고
             path = self.__get_data_path()
-            # 해당 주소에 파일 존재여부를 점검
-            # 파일 미존재시
-            if not os.path.isfile(path):
+            # 해당 주소에 폴더 존재여부를 점검
+            # 폴더 미존재시
+            if not os.path.isdir(path):
                 # 에러 발생시키고 중단
-                raise ValueError(f"파일이 존재하지 않음: {path}")
-            # 파일 존재시
+                raise ValueError(f"폴더가 존재하지 않음: {path}")
+            # 폴더 존재시
             else:
-                # 해당 파일을 불러온다.
-                with open(path, "rb") as file:
-                    self.closing_sync_data = pickle.load(file)
-                    # return
+                # 해당 데이터를 memory map으로 불러온다.
+                self.closing_sync_data = utils._load_columnar_store(
+                    path, symbols=self.symbols
+                )
         # 신규 다운로드 선택시
         else:
             # kline data를 수신한다.
@@ -487,32 +499,51 @@ class BackTesterManager:
 
         # 최소단위 interval값 기준 데이터 길이를 확보한다.
         data_length = len(self.closing_sync_data[self.symbols[0]][self.intervals[0]])
+        entry_start, entry_end = (
+            self.index_range if self.index_range is not None else (0, data_length)
+        )
+        # 전체 구간 신호를 1회 계산한다.
+        if self.is_batch_signal:
+            self.batch_signals = self.ins_batch_analysis.run(self.closing_sync_data)
 
         # Loop 시작
-        for index in range(data_length):
+        # 신호는 index별 lookback window로 계산하므로 구간 이전 index는 진행하지 않는다.
+        for index in range(entry_start, data_length):
+            # 담당 구간 종료 후 보유 포지션이 없으면 중단한다.
+            if index >= entry_end and not self.ins_portfolio.open_positions:
+                break
+            is_entry_index = entry_start <= index < entry_end
             # print(index)
             price = {}
             for symbol in self.symbols:
                 self.kline_datsets[symbol] = DataStoreage.KlineData()
                 timestamp_min = []
                 for interval in self.intervals:
-                    select_indices_ = self.closing_indices_data.get_data(
+                    select_window_ = self.closing_indices_data.get_data(
                         f"interval_{interval}"
                     )[index]
                     
                     ### 가장 최대 interval값을 기준으로 index최대값도달 시 검토 필요하다.
                     ### 최대값 도달 전에 검토시 데이터 외곡 발생한다.
-                    if len(select_indices_) <=960:
+                    if DataStoreage.LookbackIndices.length(select_window_) <=960:
                         flag = False
                         continue
                     
-                    select_data = self.closing_sync_data[symbol][interval][select_indices_]                 
+                    # 일괄 계산시 신호 분석용 데이터는 구성하지 않는다.
+                    if self.is_batch_signal and interval != self.intervals[0]:
+                        flag = True
+                        continue
+
+                    select_data = DataStoreage.LookbackIndices.select(
+                        self.closing_sync_data[symbol][interval], select_window_
+                    )
                     # if interval == "3m":
                     #     import pickle
                     #     print(select_data)
                     #     with open('data.pickle', 'wb') as file:
                     #         pickle.dump(select_data, file)
-                    self.kline_datsets[symbol].set_data(list(select_data))
+                    if not self.is_batch_signal:
+                        self.kline_datsets[symbol].set_data(list(select_data))
                     #     raise ValueError(f'중간점검')
                         # print(select_data)
                     if interval == self.intervals[0]:
@@ -538,7 +569,23 @@ class BackTesterManager:
                     # kline_data[symbol][interval] = select_data
                     flag = True
                     
-            if flag:
+            if flag and is_entry_index and self.is_batch_signal:
+                # loop 방식과 동일하게 buy 신호를 모두 진입한 후 sell 신호를 진입한다.
+                for position, position_type in (("buy", 1), ("sell", 2)):
+                    for symbol in self.symbols:
+                        scenario_type = int(
+                            self.batch_signals[symbol][f"{position}_scenario"][index]
+                        )
+                        if scenario_type:
+                            await self.active_open_position(
+                                symbol=symbol,
+                                price=price[symbol],
+                                position=position_type,
+                                scenario_leverage=20,
+                                start_timestamp=end_timestamp,
+                                scenario_type=scenario_type,
+                            )
+            elif flag and is_entry_index:
                 self.ins_new_analysis.run()
 
                 for position in ['buy', 'sell']:
@@ -670,6 +717,143 @@ class BackTesterManager:
         print("\n\nEND")
 
 
+# 병렬 실행 단위를 worker process에서 실행한다.
+def _run_backtest_unit(backtest_kwargs: Dict[str, Any]) -> TradeComputation.PortfolioManager:
+    """
+    1. 기능 : BackTesterManager를 생성 및 실행하고 PortfolioManager를 반환한다.
+    2. 매개변수
+        1) backtest_kwargs : BackTesterManager 매개변수
+    3. 추가설명
+        - ProcessPoolExecutor에서 pickle 가능하도록 module 수준 함수로 둔다.
+        - 저장된 closing sync data를 memory map으로 불러오므로 worker간 데이터를 복사하지 않는다.
+    """
+    ins_backtest = BackTesterManager(**backtest_kwargs)
+    asyncio.run(ins_backtest.run())
+    return ins_backtest.ins_portfolio
+
+
+class ParallelBackTester:
+    """
+    백테스트를 독립 실행 단위로 분리하여 ProcessPoolExecutor로 병렬 실행하고 결과를 병합한다.
+
+    1. symbol 단위 : max_held_symbols >= symbol 수일 경우 symbol간 거래 슬롯 경쟁이 없으므로
+        symbol별로 자금(seed_money / max_held_symbols)을 나누어 실행한다.
+    2. 기간 단위 : 그 외의 경우 전체 index를 겹치지 않는 구간으로 나누고, 구간별로 자금(seed_money / 구간 수)을 나누어 실행한다.
+        구간간 자산은 이월되지 않으며, 병합 결과는 구간별 결과의 합계다.
+    """
+
+    def __init__(
+        self,
+        backtest_kwargs: Dict[str, Any],
+        max_workers: Optional[int] = None,
+        shard_count: Optional[int] = None,
+        mode: str = "auto",  # "auto", "symbol", "shard"
+    ):
+        self.backtest_kwargs = backtest_kwargs
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.shard_count = shard_count or self.max_workers
+        self.mode = mode
+
+    # 병렬 실행 방식을 결정한다.
+    def get_mode(self) -> str:
+        if self.mode != "auto":
+            return self.mode
+        symbols = self.backtest_kwargs["symbols"]
+        if self.backtest_kwargs["max_held_symbols"] >= len(symbols):
+            return "symbol"
+        return "shard"
+
+    # 데이터를 사전에 준비(수신 및 저장)하고 데이터 길이를 반환한다.
+    async def prepare_data(self) -> int:
+        """
+        1. 기능 : worker 실행 전 closing sync data를 저장해두고 전체 데이터 길이를 반환한다.
+        2. 매개변수 : 해당없음.
+        """
+        ins_backtest = BackTesterManager(**self.backtest_kwargs)
+        await ins_backtest.get_base_data(is_save=True)
+        return len(
+            ins_backtest.closing_sync_data[ins_backtest.symbols[0]][
+                ins_backtest.intervals[0]
+            ]
+        )
+
+    # 실행 단위별 매개변수를 생성한다.
+    def generate_units(self, data_length: int) -> List[Dict[str, Any]]:
+        """
+        1. 기능 : 실행 방식에 맞추어 worker별 BackTesterManager 매개변수를 생성한다.
+        2. 매개변수
+            1) data_length : 최소 interval 기준 데이터 길이
+        """
+        base_kwargs = {**self.backtest_kwargs, "is_download": False}
+        if self.get_mode() == "symbol":
+            seed_money = base_kwargs["seed_money"] / base_kwargs["max_held_symbols"]
+            return [
+                {
+                    **base_kwargs,
+                    "symbols": [symbol],
+                    "max_held_symbols": 1,
+                    "seed_money": seed_money,
+                }
+                for symbol in base_kwargs["symbols"]
+            ]
+
+        bounds = np.linspace(0, data_length, self.shard_count + 1).astype(int)
+        index_ranges = [
+            (int(start), int(end))
+            for start, end in zip(bounds[:-1], bounds[1:])
+            if start < end
+        ]
+        seed_money = base_kwargs["seed_money"] / len(index_ranges)
+        return [
+            {**base_kwargs, "index_range": index_range, "seed_money": seed_money}
+            for index_range in index_ranges
+        ]
+
+    # worker별 PortfolioManager를 하나로 병합한다.
+    def merge_portfolios(
+        self, portfolios: List[TradeComputation.PortfolioManager]
+    ) -> TradeComputation.PortfolioManager:
+        """
+        1. 기능 : worker별 거래기록을 병합하여 PortfolioManager를 재구성한다.
+        2. 매개변수
+            1) portfolios : worker별 PortfolioManager
+        3. 추가설명
+            - worker별 자금의 합계는 seed_money를 넘지 않으므로 seed_money를 초기자산으로 한다.
+        """
+        result = TradeComputation.PortfolioManager(
+            market=self.backtest_kwargs["market"],
+            is_profit_preservation=self.backtest_kwargs.get(
+                "is_profit_preservation", True
+            ),
+            initial_balance=self.backtest_kwargs["seed_money"],
+        )
+        for portfolio in portfolios:
+            result.trade_history.extend(portfolio.trade_history)
+            for symbol, closed_data in portfolio.closed_positions.items():
+                result.closed_positions.setdefault(symbol, []).extend(closed_data)
+            result.open_positions.update(portfolio.open_positions)
+        result.update_data()
+        return result
+
+    async def run(self) -> TradeComputation.PortfolioManager:
+        """
+        1. 기능 : 데이터 준비 후 실행 단위를 병렬 실행하고 병합된 PortfolioManager를 반환한다.
+        2. 매개변수 : 해당없음.
+        """
+        data_length = await self.prepare_data()
+        units = self.generate_units(data_length)
+        loop = asyncio.get_running_loop()
+        # event loop를 차단하지 않도록 실행 단위별로 executor에 등록하고 대기한다.
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            portfolios = await asyncio.gather(
+                *(
+                    loop.run_in_executor(executor, _run_backtest_unit, unit)
+                    for unit in units
+                )
+            )
+        return self.merge_portfolios(list(portfolios))
+
+
 if __name__ == "__main__":
     symbols = [
         "btcusdt",
@@ -5,7 +5,6 @@ import numpy as np
 import utils
 import BackTestDataFactory
 import os
-import pickle
 import DataStoreage
 import Analysis_new
 import datetime
@@ -190,12 +189,11 @@ class BackTestManager:
                 f"{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}: closing indices 데이터 생성 완료"
             )
         elif not self.download_enabled:
-            path = ConfigSetting.SystemConfig.path_closing_sync_data.value
-            if not os.path.isfile(path):
-                raise ValueError(f"파일이 존재하지 않음: {path}")
+            path = ConfigSetting.SystemConfig.path_closing_sync_store.value
+            if not os.path.isdir(path):
+                raise ValueError(f"폴더가 존재하지 않음: {path}")
 
-            with open(path, "rb") as file:
-                self.closing_sync_data = pickle.load(file)
+            self.closing_sync_data = utils._load_columnar_store(path)
             print(
                 f"{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}: closing_sync_data 로드 완료"
             )
@@ -332,13 +330,15 @@ class BackTestManager:
                 self.kline_datasets[symbol].reset_data()
                 # interval 값 순환
                 for interval in self.intervals:
-                    # index 데이터를 확보한다.
-                    indices = self.closing_indices_data.get_data(
+                    # index window (start, stop, step)를 확보한다.
+                    window = self.closing_indices_data.get_data(
                         f"interval_{interval}"
                     )[index]
                     
-                    # sync 데이터에 index값 반영하여 분류
-                    sync_data = self.closing_sync_data[symbol][interval][indices]
+                    # sync 데이터에 window를 반영하여 분류
+                    sync_data = DataStoreage.LookbackIndices.select(
+                        self.closing_sync_data[symbol][interval], window
+                    )
                     # 리스트 형태로 전환 후 데이터를 함수에 반영한다.
                     ### !!! ###
                     # live 트레이딩때는 정기적으로 kline을 업데이트하고 실시간 수신되는 데이터를
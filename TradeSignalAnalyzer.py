@@ -152,8 +152,8 @@ class AnalysisManager:
         self.scenario_data.clear_all_data()
 
     def __get_scenario_number(self) -> Tuple:
-        stack = inspect.stack()
-        parent_function_name = stack[1].function
+        # inspect.stack()은 전체 frame의 소스 정보를 수집하므로 호출 frame만 조회한다.
+        parent_function_name = inspect.currentframe().f_back.f_code.co_name
         return (parent_function_name, int(parent_function_name.split("_")[-1]))
 
     def __fail_signal(self, scenario_number: int):
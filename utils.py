@@ -6,7 +6,7 @@ import sys
 import numpy as np
 import importlib
 import requests
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional, TypeVar, Union, Final, Dict, List, Union, Any
 from decimal import Decimal, ROUND_UP, ROUND_DOWN
 from pprint import pformat
@@ -735,6 +735,32 @@ def _get_interval_ms_seconds(interval: str) -> int:
     return int(INTERVAL_MS_SECONDS[interval])
 
 
+# 현재 진행중인 캔들 직전, 마지막으로 마감된 캔들의 close timestamp를 반환한다.
+def _get_last_closed_timestamp(interval: str, current_ts: int) -> int:
+    """
+    1. 기능 : current_ts 기준 마지막 마감 캔들의 close timestamp(진행중인 캔들 open timestamp - 1)를 반환한다.
+    2. 매개변수
+        1) interval : interval값
+        2) current_ts : 기준 timestamp (ms)
+    3. 추가사항
+        >> 1w는 월요일 00:00 UTC, 1M은 매월 1일 00:00 UTC에 시작하므로 고정 ms로 나누지 않는다.
+        >> Binance/Workspace/BackTest/Storage/KlineCatalog._last_closed_ts와 동일한 기준이다.
+    """
+    if interval.endswith("M"):
+        current = datetime.fromtimestamp(current_ts / 1_000, tz=timezone.utc)
+        month_index = current.year * 12 + current.month - 1
+        month_index -= month_index % int(interval[:-1])
+        open_time = datetime(
+            month_index // 12, month_index % 12 + 1, 1, tzinfo=timezone.utc
+        )
+        return int(open_time.timestamp() * 1_000) - 1
+
+    interval_ms = _get_interval_ms_seconds(interval)
+    # 1970-01-01(목요일) 기준 4일 이동하여 월요일에 맞춘다.
+    offset = 4 * 86_400_000 if interval.endswith("w") else 0
+    return current_ts - (current_ts - offset) % interval_ms - 1
+
+
 # interval별 분 정보를 반환한다.
 def _get_interval_minutes(interval: str) -> int:
     """
@@ -765,6 +791,139 @@ def _get_interval_minutes(interval: str) -> int:
     return int(INTERVAL_MINITES[interval])
 
 
+# 1분봉 데이터를 기준으로 상위 interval의 closing sync data를 벡터 연산으로 생성한다.
+def _generate_closing_sync(
+    base_data: np.ndarray, interval_data: np.ndarray, interval: str
+) -> np.ndarray:
+    """
+    1. 기능 : base_data(1분봉) 각 행 시점까지 진행된 interval_data 캔들을 재구성하여 base_data 길이로 반환한다.
+    2. 매개변수
+        1) base_data : 1분봉 kline data (np.ndarray)
+        2) interval_data : 대상 interval kline data (np.ndarray)
+        3) interval : 대상 interval 값
+    3. 추가설명
+        >> open timestamp로 bucket id를 구한 후 bucket별 누적 max/min/sum을 한번에 계산한다. (O(n))
+        >> 캔들이 완성된 행은 interval_data 원본값을 그대로 사용한다.
+    """
+    base_data = np.asarray(base_data, dtype=np.float64)
+    interval_data = np.asarray(interval_data, dtype=np.float64)
+    timestamp_range = _get_interval_ms_seconds(interval) - 1
+
+    # base_data가 속하는 interval_data의 index(bucket id)
+    bucket = np.searchsorted(interval_data[:, 0], base_data[:, 0], side="right") - 1
+    safe_bucket = np.clip(bucket, 0, None)
+    is_valid = (bucket >= 0) & (interval_data[safe_bucket, 6] >= base_data[:, 6])
+    if not is_valid.all():
+        raise ValueError(f"interval data 구간 없음: {interval}")
+
+    # 연속된 bucket을 그룹으로 묶고 그룹 내 위치를 계산한다.
+    is_start = np.empty(len(bucket), dtype=bool)
+    is_start[:1] = True
+    is_start[1:] = bucket[1:] != bucket[:-1]
+    start_indices = np.flatnonzero(is_start)
+    group_no = np.cumsum(is_start) - 1
+    position = np.arange(len(bucket)) - start_indices[group_no]
+    group_start = start_indices[group_no]
+
+    def grouped_accumulate(values, ufunc, fill_value):
+        grid = np.full(
+            (len(start_indices), int(position.max()) + 1) + values.shape[1:],
+            fill_value,
+            dtype=np.float64,
+        )
+        grid[group_no, position] = values
+        ufunc.accumulate(grid, axis=1, out=grid)
+        return grid[group_no, position]
+
+    result = np.zeros((len(base_data), 12), dtype=np.float64)
+    result[:, 0] = interval_data[bucket, 0]
+    result[:, 1] = base_data[group_start, 1]
+    result[:, 2] = grouped_accumulate(base_data[:, 2], np.maximum, -np.inf)
+    result[:, 3] = grouped_accumulate(base_data[:, 3], np.minimum, np.inf)
+    result[:, 4] = base_data[:, 4]
+    result[:, [5, 7, 8, 9, 10]] = grouped_accumulate(
+        base_data[:, [5, 7, 8, 9, 10]], np.add, 0.0
+    )
+    result[:, 6] = interval_data[bucket, 6]
+
+    is_closed = (base_data[:, 6] - base_data[group_start, 0]) == timestamp_range
+    result[is_closed] = interval_data[bucket[is_closed]]
+    return result
+
+
+# closing_sync_data를 symbol/interval별 column-major .npy 파일과 manifest.json으로 저장한다.
+def _save_columnar_store(
+    path: str, dataset: Dict[str, Dict[str, np.ndarray]], **kwargs: Any
+):
+    """
+    1. 기능 : symbol > interval > np.ndarray 구조의 데이터를 .npy 파일로 저장한다.
+    2. 매개변수
+        1) path : 저장 폴더 주소
+        2) dataset : 저장할 데이터 (closing_sync_data 등)
+        3) kwargs : manifest에 추가 기록할 정보
+    3. 추가설명
+        >> {path}/{symbol}/{interval}.npy 파일은 (컬럼수, 데이터길이) 형태로 저장되어 컬럼별로 연속된 메모리를 가진다.
+        >> 임시파일로 저장 후 교체하므로 읽기 중인 프로세스에 영향이 없다.
+    """
+    symbols = list(dataset.keys())
+    intervals = list(dataset[symbols[0]].keys())
+    for symbol, symbol_data in dataset.items():
+        os.makedirs(os.path.join(path, symbol), exist_ok=True)
+        for interval, interval_data in symbol_data.items():
+            file_path = os.path.join(path, symbol, f"{interval}.npy")
+            with open(f"{file_path}.tmp", "wb") as file:
+                np.save(file, np.ascontiguousarray(np.asarray(interval_data, float).T))
+            os.replace(f"{file_path}.tmp", file_path)
+
+    manifest = {
+        "columns": [column.split(": ")[1] for column in _info_kline_columns()],
+        "symbols": symbols,
+        "intervals": intervals,
+        "data_length": len(dataset[symbols[0]][intervals[0]]),
+        **kwargs,
+    }
+    manifest_path = os.path.join(path, "manifest.json")
+    with open(f"{manifest_path}.tmp", "w", encoding="utf-8") as file:
+        json.dump(manifest, file, indent=2)
+    os.replace(f"{manifest_path}.tmp", manifest_path)
+
+
+# _save_columnar_store로 저장한 데이터를 memory map으로 불러온다.
+def _load_columnar_store(
+    path: str, symbols: Optional[List[str]] = None
+) -> Dict[str, Dict[str, np.ndarray]]:
+    """
+    1. 기능 : 저장된 .npy 파일을 np.load(mmap_mode="r")로 열어 symbol > interval > np.ndarray 구조로 반환한다.
+    2. 매개변수
+        1) path : 저장 폴더 주소
+        2) symbols : 불러올 symbol 목록 (None이면 저장된 전체 symbol)
+    3. 추가설명
+        >> 역직렬화 없이 즉시 로딩되며, 여러 프로세스가 동시에 열어도 OS page cache를 공유한다.
+        >> 반환값은 읽기전용 (데이터길이, 컬럼수) view다.
+    """
+    manifest_path = os.path.join(path, "manifest.json")
+    if not os.path.isfile(manifest_path):
+        raise ValueError(f"파일이 존재하지 않음: {manifest_path}")
+    with open(manifest_path, "r", encoding="utf-8") as file:
+        manifest = json.load(file)
+
+    if symbols is None:
+        symbols = manifest["symbols"]
+    missing = [symbol for symbol in symbols if symbol not in manifest["symbols"]]
+    if missing:
+        raise ValueError(f"저장된 데이터에 symbol 없음: {missing}")
+
+    return {
+        symbol: {
+            interval: np.load(
+                os.path.join(path, symbol, f"{interval}.npy"), mmap_mode="r"
+            ).T
+            for interval in manifest["intervals"]
+        }
+        for symbol in symbols
+    }
+
+
 def get_interval_start_hour(interval: str) -> int:
     """시작시간을 09시 00분 으로 세팅하는게 제일 속편하다"""
     INTERVAL_START_HOUR = {